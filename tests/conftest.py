@@ -6,12 +6,18 @@ including test data, mock objects, and utility functions.
 """
 
 import os
+import sys
 import pytest
 import tempfile
 import shutil
 from pathlib import Path
 from typing import List, Dict, Any
 from unittest.mock import patch, MagicMock
+
+# Make the source tree importable without installing the package; test
+# modules just ``import wf2wf`` instead of bootstrapping it themselves.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from wf2wf.core import Workflow, Task, EnvironmentSpecificValue
 from wf2wf.interactive import get_prompter
 
@@ -30,9 +36,16 @@ def examples_dir(project_root):
 
 @pytest.fixture(scope="session")
 def test_output_dir(project_root):
-    """Return the path to the test output directory, creating it if needed."""
+    """Return the path to the test output directory, creating it if needed.
+
+    Under pytest-xdist each worker gets its own subdirectory, so workers
+    never clean or overwrite each other's output.
+    """
     output_dir = project_root / "tests" / "test_output"
-    output_dir.mkdir(exist_ok=True)
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker:
+        output_dir = output_dir / worker
+    output_dir.mkdir(parents=True, exist_ok=True)
     return output_dir
 
 
@@ -1,21 +1,7 @@
 """Basic integration tests for DAGMan exporter using the Workflow IR."""
 
-# Allow running tests without installing package
-import sys
-import pathlib
-import importlib.util
 import pytest
 
-proj_root = pathlib.Path(__file__).resolve().parents[1]
-
-if "wf2wf" not in sys.modules:
-    spec = importlib.util.spec_from_file_location("wf2wf", proj_root / "__init__.py")
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["wf2wf"] = module  # type: ignore[assignment]
-    assert spec and spec.loader
-    spec.loader.exec_module(module)  # type: ignore[arg-type]
-
-
 from wf2wf.core import Workflow, Task, EnvironmentSpecificValue, ParameterSpec
 from wf2wf.exporters import dagman as dag_exporter
 from wf2wf.importers import dagman as dag_importer
@@ -68,6 +54,65 @@ def test_export_linear_workflow(tmp_path):
     assert (scripts_dir / "step_b.sh").exists()
 
 
+def test_export_writes_submit_files_before_dag(tmp_path, monkeypatch):
+    """Submit files are all written, in parallel, before the DAG references them."""
+    wf = _build_linear_workflow()
+    dag_path = tmp_path / "linear.dag"
+
+    written = []
+    original_write_file = dag_exporter.DAGManExporter._write_file
+
+    def recording_write_file(self, content, path, *args, **kwargs):
+        written.append(path.name)
+        return original_write_file(self, content, path, *args, **kwargs)
+
+    monkeypatch.setattr(dag_exporter.DAGManExporter, "_write_file", recording_write_file)
+    dag_exporter.from_workflow(wf, dag_path, workdir=tmp_path)
+
+    assert sorted(written[:-1]) == ["step_a.sub", "step_b.sub"]
+    assert written[-1] == "linear.dag"
+    for task_id in ("step_a", "step_b"):
+        submit_text = (tmp_path / f"{task_id}.sub").read_text()
+        assert f"executable = scripts/{task_id}.sh" in submit_text
+
+
+def test_export_skip_unchanged_reuses_previous_output(tmp_path, monkeypatch):
+    """With skip_unchanged, an identical re-export is skipped via the manifest."""
+    dag_path = tmp_path / "linear.dag"
+    exported = _build_linear_workflow()
+    dag_exporter.from_workflow(exported, dag_path, workdir=tmp_path, skip_unchanged=True)
+    manifest_path = tmp_path / "linear.manifest.json"
+    assert manifest_path.exists()
+
+    generated = []
+    original_generate = dag_exporter.DAGManExporter._generate_output
+
+    def recording_generate(self, *args, **kwargs):
+        generated.append(True)
+        return original_generate(self, *args, **kwargs)
+
+    monkeypatch.setattr(dag_exporter.DAGManExporter, "_generate_output", recording_generate)
+    skipped = _build_linear_workflow()
+    exporter = dag_exporter.DAGManExporter()
+    exporter.export_workflow(skipped, dag_path, workdir=tmp_path, skip_unchanged=True)
+    assert generated == []
+    assert exporter._written_files is None
+
+    # A skipped export leaves the workflow as the full export did
+    assert skipped.to_dict() == exported.to_dict()
+
+    # A changed workflow, or a deleted output, forces a fresh export
+    changed = _build_linear_workflow()
+    changed.tasks["step_b"].cpu = EnvironmentSpecificValue(4, ["distributed_computing"])
+    dag_exporter.from_workflow(changed, dag_path, workdir=tmp_path, skip_unchanged=True)
+    assert generated == [True]
+
+    (tmp_path / "step_a.sub").unlink()
+    dag_exporter.from_workflow(changed, dag_path, workdir=tmp_path, skip_unchanged=True)
+    assert generated == [True, True]
+    assert (tmp_path / "step_a.sub").exists()
+
+
 class TestDAGManInlineSubmit:
     """Test suite for DAGMan inline submit description functionality."""
 
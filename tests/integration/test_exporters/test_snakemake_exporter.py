@@ -1,7 +1,7 @@
 """Tests for the Snakemake exporter functionality."""
 
 from wf2wf.core import Workflow, Task, ParameterSpec, EnvironmentSpecificValue
-from wf2wf.exporters.snakemake import from_workflow
+from wf2wf.exporters.snakemake import SnakemakeExporter, from_workflow
 import os
 
 
@@ -295,6 +295,25 @@ class TestSnakemakeExporter:
         assert task_a_line < task_b_line
         assert task_a_line < task_c_line
 
+    def test_topological_sort_follows_task_and_edge_order(self):
+        """Test that siblings are ordered by task and edge insertion order."""
+        wf = Workflow(name="fan_out_workflow")
+        for task_id in ("root", "z_child", "a_child", "m_child", "join"):
+            wf.add_task(Task(id=task_id))
+        wf.add_edges_from(
+            [
+                ("root", "z_child"),
+                ("root", "a_child"),
+                ("root", "m_child"),
+                ("a_child", "join"),
+                ("z_child", "join"),
+            ]
+        )
+
+        order = SnakemakeExporter()._topological_sort(wf)
+
+        assert order == ["root", "z_child", "a_child", "m_child", "join"]
+
     def test_rule_name_sanitization(self, persistent_test_output):
         """Test that rule names are properly sanitized."""
         wf = Workflow(name="sanitization_workflow")
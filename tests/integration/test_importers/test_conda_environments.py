@@ -1,20 +1,7 @@
 """Tests for conda environment management functionality."""
 
-import sys
-import pathlib
-import importlib.util
 import textwrap
 
-# Allow running tests without installing package
-proj_root = pathlib.Path(__file__).resolve().parents[1]
-
-if "wf2wf" not in sys.modules:
-    spec = importlib.util.spec_from_file_location("wf2wf", proj_root / "__init__.py")
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["wf2wf"] = module  # type: ignore[assignment]
-    assert spec and spec.loader
-    spec.loader.exec_module(module)  # type: ignore[arg-type]
-
 import pytest
 from wf2wf.core import Workflow, Task, EnvironmentSpecificValue
 from wf2wf.exporters import dagman as dag_exporter
@@ -227,14 +214,8 @@ class TestCondaEnvironmentParsing:
         try:
             wf = snake_importer.to_workflow(snakefile, workdir=tmp_path)
 
-            # Find the mixed task
-            mixed_task = None
-            for task in wf.tasks.values():
-                if task.id == "mixed_task":
-                    mixed_task = task
-                    break
-
-            assert mixed_task is not None, "Should have found mixed_task"
+            assert "mixed_task" in wf.tasks, "Should have found mixed_task"
+            mixed_task = wf.tasks["mixed_task"]
 
             # In the new IR, both conda and container can coexist
             # The exporter will decide which to use based on the target environment
@@ -171,7 +171,7 @@ class TestCWLImporter:
         assert workflow.name == "Test Tool"
         assert len(workflow.tasks) == 1
 
-        task = list(workflow.tasks.values())[0]
+        task = next(iter(workflow.tasks.values()))
         assert task.command.get_value_for("shared_filesystem") == "echo Hello, World!"
 
         # Check resources
@@ -209,7 +209,7 @@ class TestCWLImporter:
             yaml.dump(tool_content, f)
 
         workflow = to_workflow(tool_file)
-        task = list(workflow.tasks.values())[0]
+        task = next(iter(workflow.tasks.values()))
 
         # Check that max values are used
         assert task.cpu.get_value_for("shared_filesystem") == 8
@@ -236,7 +236,7 @@ class TestCWLImporter:
             yaml.dump(docker_tool, f)
 
         workflow = to_workflow(docker_file)
-        task = list(workflow.tasks.values())[0]
+        task = next(iter(workflow.tasks.values()))
         assert task.container.get_value_for("shared_filesystem") == "docker://python:3.9-slim"
 
         # Test Software requirement
@@ -262,7 +262,7 @@ class TestCWLImporter:
             yaml.dump(software_tool, f)
 
         workflow = to_workflow(software_file)
-        task = list(workflow.tasks.values())[0]
+        task = next(iter(workflow.tasks.values()))
         conda_env = task.conda.get_value_for("shared_filesystem")
         assert conda_env is not None
         # Parse the YAML string to get the dict
@@ -369,7 +369,7 @@ class TestCWLImporter:
         workflow = to_workflow(workflow_file)
 
         assert len(workflow.tasks) == 1
-        task = list(workflow.tasks.values())[0]
+        task = next(iter(workflow.tasks.values()))
         assert "external_tool" in task.command.get_value_for("shared_filesystem")
 
     def test_error_handling(self, persistent_test_output):
@@ -445,7 +445,7 @@ class TestCWLImporter:
         # Import and test
         workflow = to_workflow(json_file)
         assert len(workflow.tasks) == 1
-        assert "test" in list(workflow.tasks.values())[0].command.get_value_for("shared_filesystem")
+        assert "test" in next(iter(workflow.tasks.values())).command.get_value_for("shared_filesystem")
 
     def test_submit_file_parsing(self, persistent_test_output):
         """Test parsing a CommandLineTool with submit_file."""
@@ -483,7 +483,7 @@ class TestCWLImporter:
         assert workflow.name == "Test Tool"
         assert len(workflow.tasks) == 1
 
-        task = list(workflow.tasks.values())[0]
+        task = next(iter(workflow.tasks.values()))
         assert task.command.get_value_for("shared_filesystem") == "echo Hello, World!"
 
         # Check resources
@@ -636,7 +636,7 @@ class TestCWLBasicImport:
         assert workflow.name == "Test Tool"
         assert len(workflow.tasks) == 1
 
-        task = list(workflow.tasks.values())[0]
+        task = next(iter(workflow.tasks.values()))
         assert task.command.get_value_for("shared_filesystem") == "echo Hello, World!"
 
         # Check resources
@@ -678,7 +678,7 @@ class TestCWLResourceParsing:
             yaml.dump(tool_content, f)
 
         workflow = to_workflow(tool_file)
-        task = list(workflow.tasks.values())[0]
+        task = next(iter(workflow.tasks.values()))
 
         # Check that max values are used
         assert task.cpu.get_value_for("shared_filesystem") == 8
@@ -705,7 +705,7 @@ class TestCWLResourceParsing:
             yaml.dump(docker_tool, f)
 
         workflow = to_workflow(docker_file)
-        task = list(workflow.tasks.values())[0]
+        task = next(iter(workflow.tasks.values()))
         assert task.container.get_value_for("shared_filesystem") == "docker://python:3.9-slim"
 
         # Test Singularity requirement
@@ -725,7 +725,7 @@ class TestCWLResourceParsing:
             yaml.dump(singularity_tool, f)
 
         workflow = to_workflow(singularity_file)
-        task = list(workflow.tasks.values())[0]
+        task = next(iter(workflow.tasks.values()))
         assert task.container.get_value_for("shared_filesystem") == "shub://singularity-hub/python:3.9"
 
 
@@ -1009,7 +1009,7 @@ class TestCWLFormatSupport:
             json.dump(tool_content, f)
 
         workflow = to_workflow(json_file)
-        task = list(workflow.tasks.values())[0]
+        task = next(iter(workflow.tasks.values()))
         assert "echo json_test" in task.command.get_value_for("shared_filesystem")
 
     def test_submit_file_parsing(self, persistent_test_output):
@@ -1028,7 +1028,7 @@ class TestCWLFormatSupport:
             yaml.dump(submit_content, f)
 
         workflow = to_workflow(submit_file)
-        task = list(workflow.tasks.values())[0]
+        task = next(iter(workflow.tasks.values()))
         assert "submit_job" in task.command.get_value_for("shared_filesystem")
 
 
@@ -1053,7 +1053,7 @@ class TestCWLComplexTypes:
             yaml.dump(tool_content, f)
 
         workflow = to_workflow(tool_file)
-        task = list(workflow.tasks.values())[0]
+        task = next(iter(workflow.tasks.values()))
 
         # Check that array inputs are properly handled
         files_input = next((p for p in task.inputs if p.id == "files"), None)
@@ -1077,7 +1077,7 @@ class TestCWLComplexTypes:
             yaml.dump(tool_content, f)
 
         workflow = to_workflow(tool_file)
-        task = list(workflow.tasks.values())[0]
+        task = next(iter(workflow.tasks.values()))
 
         # Check that union types are properly handled
         input_param = next((p for p in task.inputs if p.id == "input_data"), None)
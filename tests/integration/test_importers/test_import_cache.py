@@ -0,0 +1,160 @@
+"""Tests for the import cache shared by the importers."""
+
+import json
+import logging
+
+import pytest
+
+from wf2wf.importers import galaxy, nextflow, utils, wdl
+
+# Every test writes into its own tmp_path, so the module is xdist-safe
+pytestmark = pytest.mark.parallel
+
+_GALAXY_STEP = {
+    "id": 0,
+    "input_connections": {},
+    "inputs": [],
+    "label": "Sort",
+    "name": "Sort",
+    "outputs": [{"name": "out_file1", "type": "tabular"}],
+    "tool_id": "sort1",
+    "tool_state": "{}",
+    "tool_version": "1.0.0",
+    "type": "tool",
+    "workflow_outputs": [],
+}
+
+_WDL_TEMPLATE = """
+version 1.0
+
+task say {
+    input {
+        String word
+    }
+
+    command <<<
+        echo "${word}"
+    >>>
+
+    output {
+        String said = stdout()
+    }
+}
+
+workflow %s {
+    call say {
+        input: word = "hi"
+    }
+}
+"""
+
+_NEXTFLOW_TEMPLATE = """
+process SAY {
+    script:
+    'echo hi'
+}
+
+workflow %s {
+    SAY()
+}
+"""
+
+
+def _write_galaxy(tmp_path, name):
+    document = {
+        "a_galaxy_workflow": "true",
+        "format-version": "0.1",
+        "name": name,
+        "steps": {"0": dict(_GALAXY_STEP)},
+        "version": "1.0",
+    }
+    path = tmp_path / "cached.ga"
+    path.write_text(json.dumps(document))
+    return path
+
+
+def _write_wdl(tmp_path, name):
+    path = tmp_path / "cached.wdl"
+    path.write_text(_WDL_TEMPLATE % name)
+    return path
+
+
+def _write_nextflow(tmp_path, name):
+    path = tmp_path / "main.nf"
+    path.write_text(_NEXTFLOW_TEMPLATE % name)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _clear_import_cache():
+    utils._cached_import.cache_clear()
+    yield
+    utils._cached_import.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "module, write, task_id",
+    [
+        (galaxy, _write_galaxy, "step_0"),
+        (wdl, _write_wdl, "say"),
+        (nextflow, _write_nextflow, "SAY"),
+    ],
+    ids=["galaxy", "wdl", "nextflow"],
+)
+def test_importer_caches_unchanged_file(tmp_path, module, write, task_id):
+    """Re-importing an unchanged file reuses the parsed workflow."""
+    path = write(tmp_path, "cached_workflow")
+
+    first = module.to_workflow(path)
+    second = module.to_workflow(path)
+
+    info = utils._cached_import.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+    assert first is not second
+    assert first.tasks[task_id] is not second.tasks[task_id]
+
+    # Rewriting the file invalidates the cached entry
+    write(tmp_path, "renamed_workflow")
+    renamed = module.to_workflow(path)
+    assert utils._cached_import.cache_info().misses == 2
+    if module is not nextflow:  # Nextflow names workflows after their directory
+        assert renamed.name == "renamed_workflow"
+
+
+def test_cache_hit_is_logged_when_verbose(tmp_path, caplog):
+    path = _write_galaxy(tmp_path, "cached_workflow")
+    galaxy.to_workflow(path, verbose=True)
+
+    with caplog.at_level(logging.INFO, logger=utils.__name__):
+        galaxy.to_workflow(path, verbose=True)
+
+    assert f"Loaded {path.resolve()} from the import cache" in caplog.text
+
+
+def test_nextflow_cache_tracks_includes_and_config(tmp_path):
+    """Included modules and nextflow.config invalidate the entry; other files do not."""
+    module_file = tmp_path / "modules" / "align.nf"
+    module_file.parent.mkdir()
+    module_file.write_text("process ALIGN {\n    cpus 2\n    script:\n    'echo align'\n}\n")
+
+    main_file = tmp_path / "main.nf"
+    main_file.write_text(
+        "include { ALIGN } from './modules/align'\n\n"
+        "workflow {\n    ALIGN()\n}\n"
+    )
+    nextflow.to_workflow(main_file)
+
+    module_file.write_text("process ALIGN {\n    cpus 16\n    script:\n    'echo align'\n}\n")
+    wf = nextflow.to_workflow(main_file)
+    original_env = wf.metadata.original_execution_environment
+    assert wf.tasks["ALIGN"].cpu.get_value_for(original_env) == 16
+    assert utils._cached_import.cache_info().misses == 2
+
+    (tmp_path / "work").mkdir()
+    (tmp_path / "work" / "stale.nf").write_text("process STALE {}\n")
+    nextflow.to_workflow(main_file)
+    assert utils._cached_import.cache_info().misses == 2
+
+    (tmp_path / "nextflow.config").write_text("params { x = 1 }\n")
+    nextflow.to_workflow(main_file)
+    assert utils._cached_import.cache_info().misses == 3
@@ -1,69 +1,20 @@
 """Tests for the Nextflow importer functionality."""
 
-import pytest
-from pathlib import Path
-from wf2wf.core import Workflow
-from wf2wf.importers.nextflow import to_workflow
-
-
-class TestNextflowImporter:
-    """Test the Nextflow importer."""
+import json
 
-    def test_import_demo_workflow(self, examples_dir, persistent_test_output):
-        """Test importing the demo Nextflow workflow."""
-        nextflow_dir = examples_dir / "nextflow"
-
-        if not (nextflow_dir / "main.nf").exists():
-            pytest.skip("Demo Nextflow workflow not found")
-
-        # Import the workflow
-        wf = to_workflow(Path(nextflow_dir), verbose=True)
-
-        # Test basic workflow properties
-        assert wf.name == "nextflow"
-        assert len(wf.tasks) == 3  # PREPARE_DATA, ANALYZE_DATA, GENERATE_REPORT
-        assert len(wf.edges) == 2  # prepare->analyze->report
+import pytest
+from wf2wf.importers.nextflow import (
+    NextflowInvalidSyntaxError,
+    to_workflow,
+    to_workflow_from_source,
+)
 
-        # Test task names (should be uppercase in Nextflow)
-        task_names = set(wf.tasks.keys())
-        expected_names = {"PREPARE_DATA", "ANALYZE_DATA", "GENERATE_REPORT"}
-        assert task_names == expected_names
+# Sources live in tmp_path / tmp_path_factory directories, so the module is
+# xdist-safe
+pytestmark = pytest.mark.parallel
 
-        # Test dependencies
-        deps = [(edge.parent, edge.child) for edge in wf.edges]
-        expected_deps = [
-            ("PREPARE_DATA", "ANALYZE_DATA"),
-            ("ANALYZE_DATA", "GENERATE_REPORT"),
-        ]
-        assert set(deps) == set(expected_deps)
 
-        # Test specific task properties using environment-specific values
-        # Get the original execution environment from metadata
-        original_env = wf.metadata.original_execution_environment
-        assert original_env is not None
-        
-        prep_task = wf.tasks["PREPARE_DATA"]
-        assert prep_task.cpu.get_value_for(original_env) == 2
-        assert prep_task.mem_mb.get_value_for(original_env) == 4096  # 4GB in MB
-        assert prep_task.container.get_value_for(original_env) == "python:3.9-slim"
-        assert prep_task.conda.get_value_for(original_env) == "environments/python.yml"
-
-        analyze_task = wf.tasks["ANALYZE_DATA"]
-        assert analyze_task.cpu.get_value_for(original_env) == 4
-        assert analyze_task.mem_mb.get_value_for(original_env) == 8192  # 8GB in MB
-        assert analyze_task.gpu.get_value_for(original_env) == 1
-        assert analyze_task.retry_count.get_value_for(original_env) == 2
-        assert analyze_task.container.get_value_for(original_env) == "rocker/r-ver:4.2.0"
-
-        # Save converted workflow to test output
-        output_file = persistent_test_output / "nextflow_workflow.json"
-        wf.save_json(output_file)
-        assert output_file.exists()
-
-    def test_parse_nextflow_config(self, persistent_test_output):
-        """Test parsing Nextflow configuration files."""
-        # Create a test config file
-        config_content = """
+NEXTFLOW_CONFIG = """
 // Test nextflow.config
 nextflow.enable.dsl = 2
 
@@ -94,11 +45,7 @@ executor {
 }
 """
 
-        config_file = persistent_test_output / "nextflow.config"
-        config_file.write_text(config_content)
-
-        # Test main.nf that references the config
-        main_content = """
+CONFIG_MAIN_NF = """
 #!/usr/bin/env nextflow
 nextflow.enable.dsl=2
 
@@ -124,33 +71,7 @@ workflow {
 }
 """
 
-        main_file = persistent_test_output / "main.nf"
-        main_file.write_text(main_content)
-
-        # Import workflow
-        wf = to_workflow(Path(main_file), verbose=True, debug=True)
-
-        # Check configuration was parsed (now in metadata)
-        assert wf.metadata is not None
-        assert "nextflow_config" in wf.metadata.format_specific
-        config = wf.metadata.format_specific["nextflow_config"]
-        assert config["params"]["input_data"] == "data/test.txt"
-        assert config["params"]["output_dir"] == "results"
-        assert config["params"]["threads"] == 8
-        assert config["params"]["analysis_threshold"] == 0.01
-        assert config["params"]["debug"] is True
-
-        # Check process was parsed
-        assert len(wf.tasks) == 1
-        task = wf.tasks["TEST_PROCESS"]
-        original_env = wf.metadata.original_execution_environment
-        assert task.cpu.get_value_for(original_env) == 4
-        assert task.mem_mb.get_value_for(original_env) == 8192  # 8GB
-
-    def test_parse_process_definitions(self, persistent_test_output):
-        """Test parsing various process definition features."""
-        # Create a comprehensive process definition
-        main_content = """
+COMPREHENSIVE_NF = """
 #!/usr/bin/env nextflow
 nextflow.enable.dsl=2
 
@@ -210,36 +131,7 @@ workflow {
 }
 """
 
-        main_file = persistent_test_output / "comprehensive.nf"
-        main_file.write_text(main_content)
-
-        # Import workflow
-        wf = to_workflow(Path(main_file), verbose=True)
-
-        # Check both processes were parsed
-        assert len(wf.tasks) == 2
-
-        # Check comprehensive process
-        comp_task = wf.tasks["COMPREHENSIVE_PROCESS"]
-        original_env = wf.metadata.original_execution_environment
-        # The original_env for Nextflow should be 'hybrid'
-        assert comp_task.cpu.get_value_for(original_env) == 8
-        assert comp_task.mem_mb.get_value_for(original_env) == 32768  # 32GB
-        assert comp_task.disk_mb.get_value_for(original_env) == 102400  # 100GB
-        assert comp_task.time_s.get_value_for(original_env) == 14400  # 4h
-        assert comp_task.gpu.get_value_for(original_env) == 2
-        assert comp_task.container.get_value_for(original_env) == "biocontainers/fastqc:0.11.9"
-        assert comp_task.conda.get_value_for(original_env) == "bioconda::fastqc=0.11.9"
-        assert comp_task.retry_count.get_value_for(original_env) == 3
-
-        # Check simple process
-        simple_task = wf.tasks["SIMPLE_PROCESS"]
-        assert simple_task.command.get_value_for(original_env) is not None
-
-    def test_module_parsing(self, persistent_test_output):
-        """Test parsing Nextflow modules."""
-        # Create module file
-        module_content = """
+MODULE_NF = """
 #!/usr/bin/env nextflow
 nextflow.enable.dsl=2
 
@@ -262,12 +154,7 @@ process MODULE_PROCESS {
 }
 """
 
-        module_file = persistent_test_output / "modules" / "test_module.nf"
-        module_file.parent.mkdir(exist_ok=True)
-        module_file.write_text(module_content)
-
-        # Create main workflow that imports module
-        main_content = """
+MODULAR_MAIN_NF = """
 #!/usr/bin/env nextflow
 nextflow.enable.dsl=2
 
@@ -279,24 +166,7 @@ workflow {
 }
 """
 
-        main_file = persistent_test_output / "modular_main.nf"
-        main_file.write_text(main_content)
-
-        # Import workflow
-        wf = to_workflow(Path(main_file), verbose=True, debug=True)
-
-        # Check module process was parsed
-        assert len(wf.tasks) == 1  # Should include the module process
-        assert "MODULE_PROCESS" in wf.tasks
-
-        module_task = wf.tasks["MODULE_PROCESS"]
-        original_env = wf.metadata.original_execution_environment
-        assert module_task.cpu.get_value_for(original_env) == 4
-        assert module_task.mem_mb.get_value_for(original_env) == 8192  # 8GB
-
-    def test_resource_parsing(self, persistent_test_output):
-        """Test parsing various resource specifications."""
-        main_content = """
+RESOURCES_NF = """
 #!/usr/bin/env nextflow
 nextflow.enable.dsl=2
 
@@ -326,33 +196,7 @@ workflow {
 }
 """
 
-        main_file = persistent_test_output / "resources.nf"
-        main_file.write_text(main_content)
-
-        # Import workflow
-        wf = to_workflow(Path(main_file), verbose=True)
-
-        # Check resource parsing
-        assert len(wf.tasks) == 3
-
-        original_env = wf.metadata.original_execution_environment
-        
-        cpu_task = wf.tasks["CPU_VARIANTS"]
-        assert cpu_task.cpu.get_value_for(original_env) == 2
-        assert cpu_task.mem_mb.get_value_for(original_env) == 4096
-
-        mem_task = wf.tasks["MEMORY_VARIANTS"]
-        assert mem_task.cpu.get_value_for(original_env) == 1
-        assert mem_task.mem_mb.get_value_for(original_env) == 16384
-
-        gpu_task = wf.tasks["GPU_VARIANTS"]
-        assert gpu_task.cpu.get_value_for(original_env) == 4
-        assert gpu_task.mem_mb.get_value_for(original_env) == 32768
-        assert gpu_task.gpu.get_value_for(original_env) == 1
-
-    def test_dependency_extraction(self, persistent_test_output):
-        """Test extracting dependencies between processes."""
-        main_content = """
+DEPENDENCIES_NF = """
 #!/usr/bin/env nextflow
 nextflow.enable.dsl=2
 
@@ -390,25 +234,238 @@ workflow {
 }
 """
 
-        main_file = persistent_test_output / "dependencies.nf"
-        main_file.write_text(main_content)
 
-        # Import workflow
-        wf = to_workflow(Path(main_file), verbose=True)
+BRANCHING_NF = """
+process STEP_A { script: 'echo a' }
+process STEP_B { script: 'echo b' }
+process STEP_C { script: 'echo c' }
+process STEP_D { script: 'echo d' }
+
+workflow {
+    STEP_A()
+    STEP_B(STEP_A.out)
+    STEP_C(STEP_B.out)
+    merged = STEP_D(STEP_B.out, STEP_C.out)
+}
+"""
 
-        # Check all processes were parsed
-        assert len(wf.tasks) == 4
+@pytest.fixture(scope="session")
+def demo_nextflow_workflow(examples_dir):
+    """The examples/nextflow workflow, imported once per session.
+
+    Shared between tests, so they must not modify it.
+    """
+    nextflow_dir = examples_dir / "nextflow"
+    if not (nextflow_dir / "main.nf").exists():
+        pytest.skip("Demo Nextflow workflow not found")
+    return to_workflow(nextflow_dir)
+
+def _write_sources(tmp_path_factory, name, files):
+    """Write *files* (relative path -> content) into a fresh directory."""
+    root = tmp_path_factory.mktemp(name)
+    for rel_path, content in files.items():
+        target = root / rel_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content)
+    return root
+
+
+# Marks a value that only has to be set, not equal to anything in particular
+_PRESENT = object()
+
+# (case id, source files, file to import, expected workflow contents)
+NEXTFLOW_CASES = [
+    (
+        "config",
+        {"nextflow.config": NEXTFLOW_CONFIG, "main.nf": CONFIG_MAIN_NF},
+        "main.nf",
+        {
+            "params": {
+                "input_data": "data/test.txt",
+                "output_dir": "results",
+                "threads": 8,
+                "analysis_threshold": 0.01,
+                "debug": True,
+            },
+            "tasks": {"TEST_PROCESS": {"cpu": 4, "mem_mb": 8192}},
+        },
+    ),
+    (
+        "process_definitions",
+        {"comprehensive.nf": COMPREHENSIVE_NF},
+        "comprehensive.nf",
+        {
+            "tasks": {
+                "COMPREHENSIVE_PROCESS": {
+                    "cpu": 8,
+                    "mem_mb": 32768,  # 32GB
+                    "disk_mb": 102400,  # 100GB
+                    "time_s": 14400,  # 4h
+                    "gpu": 2,
+                    "container": "biocontainers/fastqc:0.11.9",
+                    "conda": "bioconda::fastqc=0.11.9",
+                    "retry_count": 3,
+                },
+                "SIMPLE_PROCESS": {"command": _PRESENT},
+            },
+        },
+    ),
+    (
+        "modules",
+        {"modules/test_module.nf": MODULE_NF, "modular_main.nf": MODULAR_MAIN_NF},
+        "modular_main.nf",
+        {"tasks": {"MODULE_PROCESS": {"cpu": 4, "mem_mb": 8192}}},
+    ),
+    (
+        "resources",
+        {"resources.nf": RESOURCES_NF},
+        "resources.nf",
+        {
+            "tasks": {
+                "CPU_VARIANTS": {"cpu": 2, "mem_mb": 4096},
+                "MEMORY_VARIANTS": {"cpu": 1, "mem_mb": 16384},
+                "GPU_VARIANTS": {"cpu": 4, "mem_mb": 32768, "gpu": 1},
+            },
+        },
+    ),
+    (
+        "dependencies",
+        {"dependencies.nf": DEPENDENCIES_NF},
+        "dependencies.nf",
+        {
+            "tasks": {"step1": {}, "step2": {}, "step3": {}, "step4": {}},
+            "edges": frozenset(
+                {("step1", "step2"), ("step2", "step3"), ("step3", "step4")}
+            ),
+        },
+    ),
+    (
+        "branching",
+        {"branching.nf": BRANCHING_NF},
+        "branching.nf",
+        {
+            "tasks": {"STEP_A": {}, "STEP_B": {}, "STEP_C": {}, "STEP_D": {}},
+            "edges": frozenset(
+                {
+                    ("STEP_A", "STEP_B"),
+                    ("STEP_B", "STEP_C"),
+                    ("STEP_B", "STEP_D"),
+                    ("STEP_C", "STEP_D"),
+                }
+            ),
+        },
+    ),
+]
+
+
+@pytest.fixture(
+    scope="module", params=NEXTFLOW_CASES, ids=[case[0] for case in NEXTFLOW_CASES]
+)
+def nextflow_case(request, tmp_path_factory):
+    """Write one case's sources once and return ``(path to import, expected)``."""
+    name, files, main_file, expected = request.param
+    root = _write_sources(tmp_path_factory, f"nf_{name}", files)
+    return root / main_file, expected
 
-        # Check dependencies
-        deps = [(edge.parent, edge.child) for edge in wf.edges]
-        expected_deps = [
-            ("step1", "step2"),
-            ("step2", "step3"),
-            ("step3", "step4"),
-        ]
-        assert set(deps) == set(expected_deps)
 
-    def test_error_handling(self, persistent_test_output):
+class TestNextflowImporter:
+    """Test the Nextflow importer."""
+
+    @pytest.mark.integration
+    def test_import_demo_workflow(self, demo_nextflow_workflow):
+        """Test importing the demo Nextflow workflow."""
+        wf = demo_nextflow_workflow
+
+        # Test basic workflow properties
+        assert wf.name == "nextflow"
+        assert len(wf.tasks) == 3  # PREPARE_DATA, ANALYZE_DATA, GENERATE_REPORT
+        assert len(wf.edges) == 2  # prepare->analyze->report
+
+        # Test task names (should be uppercase in Nextflow)
+        task_names = set(wf.tasks.keys())
+        expected_names = {"PREPARE_DATA", "ANALYZE_DATA", "GENERATE_REPORT"}
+        assert task_names == expected_names
+
+        # Test dependencies
+        assert wf.edge_pairs == frozenset(
+            {
+                ("PREPARE_DATA", "ANALYZE_DATA"),
+                ("ANALYZE_DATA", "GENERATE_REPORT"),
+            }
+        )
+        assert ("PREPARE_DATA", "GENERATE_REPORT") not in wf.edge_pairs
+
+        # Test specific task properties using environment-specific values
+        # Get the original execution environment from metadata
+        original_env = wf.metadata.original_execution_environment
+        assert original_env is not None
+        
+        expected_prep = {
+            "cpu": 2,
+            "mem_mb": 4096,  # 4GB in MB
+            "container": "python:3.9-slim",
+            "conda": "environments/python.yml",
+        }
+        assert wf.tasks["PREPARE_DATA"].snapshot(original_env, list(expected_prep)) == expected_prep
+
+        expected_analyze = {
+            "cpu": 4,
+            "mem_mb": 8192,  # 8GB in MB
+            "gpu": 1,
+            "retry_count": 2,
+            "container": "rocker/r-ver:4.2.0",
+        }
+        assert wf.tasks["ANALYZE_DATA"].snapshot(original_env, list(expected_analyze)) == expected_analyze
+
+    @pytest.mark.integration
+    def test_demo_to_json(self, demo_nextflow_workflow):
+        """Test serializing the converted demo workflow to JSON."""
+        data = demo_nextflow_workflow.to_json_bytes()
+        assert b'"PREPARE_DATA"' in data
+        assert json.loads(data)["name"] == "nextflow"
+
+    def test_nextflow_feature(self, nextflow_case):
+        """Test config, process, module, resource and dependency parsing."""
+        main_file, expected = nextflow_case
+        wf = to_workflow(main_file, verbose=True)
+
+        # Every process is parsed, including those from included modules
+        assert set(wf.tasks) == set(expected["tasks"])
+
+        original_env = wf.metadata.original_execution_environment
+        for task_name, fields in expected["tasks"].items():
+            snapshot = wf.tasks[task_name].snapshot(original_env, list(fields))
+            assert snapshot.keys() == fields.keys(), task_name
+            required = {name: value for name, value in fields.items() if value is not _PRESENT}
+            assert {name: snapshot[name] for name in required} == required, task_name
+
+        if "edges" in expected:
+            assert wf.edge_pairs == expected["edges"]
+
+        # Configuration is kept in the format-specific metadata
+        if "params" in expected:
+            params = wf.metadata.format_specific["nextflow_config"]["params"]
+            for key, value in expected["params"].items():
+                assert params[key] == value
+
+    @pytest.mark.parametrize("encode", [False, True], ids=["str", "bytes"])
+    def test_import_from_source(self, encode):
+        """Test importing DSL held in memory rather than on disk."""
+        source = RESOURCES_NF.encode() if encode else RESOURCES_NF
+        wf = to_workflow_from_source(source, name="resources")
+
+        assert wf.name == "resources"
+        assert set(wf.tasks) == {"CPU_VARIANTS", "MEMORY_VARIANTS", "GPU_VARIANTS"}
+        original_env = wf.metadata.original_execution_environment
+        assert wf.tasks["GPU_VARIANTS"].gpu.get_value_for(original_env) == 1
+
+    @pytest.mark.parametrize("name", ["a/b", "../x", "..", ""])
+    def test_import_from_source_rejects_path_like_names(self, name):
+        """In-memory names must not escape or nest inside the temporary directory."""
+        with pytest.raises(ValueError, match="Invalid workflow name"):
+            to_workflow_from_source(RESOURCES_NF, name=name)
+
+    def test_error_handling(self, tmp_path):
         """Test error handling for invalid Nextflow files."""
         # Test with non-existent file
         with pytest.raises(ImportError):
@@ -423,14 +480,17 @@ process INVALID {
 }
 """
 
-        invalid_file = persistent_test_output / "invalid.nf"
+        invalid_file = tmp_path / "invalid.nf"
         invalid_file.write_text(invalid_content)
 
-        # Should handle gracefully or raise appropriate error
-        try:
-            wf = to_workflow(Path(invalid_file), verbose=True)
-            # If it doesn't raise an error, at least it should create a workflow
-            assert isinstance(wf, Workflow)
-        except Exception as e:
-            # Should be a specific error, not a generic one
-            assert "nextflow" in str(e).lower() or "syntax" in str(e).lower()
+        # A balanced but meaningless process body is still imported leniently
+        wf = to_workflow(invalid_file)
+        assert "INVALID" in wf.tasks
+
+        # An unterminated process body is reported instead of being dropped
+        unterminated_file = tmp_path / "unterminated.nf"
+        unterminated_file.write_text("process OPEN {\n    script:\n    'echo open'\n")
+
+        with pytest.raises(ImportError, match=r"unmatched '\{' in process OPEN at line 1") as exc_info:
+            to_workflow(unterminated_file)
+        assert isinstance(exc_info.value.__cause__, NextflowInvalidSyntaxError)
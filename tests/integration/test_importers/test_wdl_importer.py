@@ -1,14 +1,14 @@
 """Tests for WDL importer functionality."""
 
 import pytest
-from pathlib import Path
 from wf2wf.importers import wdl
 
+# Every test reads its own file (or writes under tmp_path), so the module
+# can be spread across pytest-xdist workers.
+pytestmark = pytest.mark.parallel
 
-def test_wdl_importer_basic_task():
-    """Test importing a basic WDL task."""
 
-    wdl_content = """
+HELLO_WDL = """
 version 1.0
 
 task hello_world {
@@ -56,50 +56,8 @@ workflow hello_workflow {
 }
 """
 
-    # Create temporary WDL file
-    wdl_file = Path("test_hello.wdl")
-    wdl_file.write_text(wdl_content)
-
-    try:
-        # Import the workflow
-        workflow = wdl.to_workflow(wdl_file, verbose=True)
-
-        # Verify workflow properties
-        assert workflow.name == "hello_workflow"
-        assert workflow.version == "1.0"
-        assert len(workflow.tasks) == 1
-
-        # Verify task properties
-        task = list(workflow.tasks.values())[0]
-        assert task.id == "hello_world"
-        assert "echo" in task.command.get_value_for("shared_filesystem")
-        assert task.cpu.get_value_for("shared_filesystem") == 1
-        assert task.mem_mb.get_value_for("shared_filesystem") == 1024  # 1 GB converted to MB
-        assert "docker://ubuntu:20.04" in task.container.get_value_for("shared_filesystem")
-
-        # Verify inputs and outputs
-        assert len(workflow.inputs) == 1
-        assert workflow.inputs[0].id == "input_name"
-        assert workflow.inputs[0].default == "World"
-
-        assert len(workflow.outputs) == 1
-        assert workflow.outputs[0].id == "result"
-
-        # Verify metadata preservation
-        if workflow.metadata and workflow.metadata.format_specific:
-            assert workflow.metadata.format_specific.get("source_format") == "wdl"
-            assert workflow.metadata.format_specific.get("wdl_version") == "1.0"
-
-    finally:
-        # Clean up
-        if wdl_file.exists():
-            wdl_file.unlink()
 
-
-def test_wdl_importer_scatter():
-    """Test importing a WDL workflow with scatter."""
-
-    wdl_content = """
+SCATTER_WDL = """
 version 1.0
 
 task process_file {
@@ -142,38 +100,8 @@ workflow scatter_workflow {
 }
 """
 
-    # Create temporary WDL file
-    wdl_file = Path("test_scatter.wdl")
-    wdl_file.write_text(wdl_content)
-
-    try:
-        # Import the workflow
-        workflow = wdl.to_workflow(wdl_file, verbose=True)
-
-        # Verify workflow properties
-        assert workflow.name == "scatter_workflow"
-        assert len(workflow.tasks) == 1
-
-        # Verify scatter operation
-        task = list(workflow.tasks.values())[0]
-        scatter_spec = task.scatter.get_value_for("shared_filesystem")
-        assert scatter_spec is not None
-        assert scatter_spec.scatter_method == "dotproduct"
-
-        # Verify resources
-        assert task.cpu.get_value_for("shared_filesystem") == 2
-        assert task.mem_mb.get_value_for("shared_filesystem") == 2048  # 2 GB converted to MB
-
-    finally:
-        # Clean up
-        if wdl_file.exists():
-            wdl_file.unlink()
 
-
-def test_wdl_importer_multiple_tasks():
-    """Test importing a WDL workflow with multiple tasks and dependencies."""
-
-    wdl_content = """
+MULTI_TASK_WDL = """
 version 1.0
 
 task prepare_data {
@@ -223,46 +151,8 @@ workflow multi_task_workflow {
 }
 """
 
-    # Create temporary WDL file
-    wdl_file = Path("test_multi_task.wdl")
-    wdl_file.write_text(wdl_content)
-
-    try:
-        # Import the workflow
-        workflow = wdl.to_workflow(wdl_file, verbose=True)
-
-        # Verify workflow properties
-        assert workflow.name == "multi_task_workflow"
-        assert len(workflow.tasks) == 2
-
-        # Verify tasks exist
-        assert "prepare_data" in workflow.tasks
-        assert "analyze_data" in workflow.tasks
-
-        # Verify dependencies
-        assert len(workflow.edges) == 1
-        edge = workflow.edges[0]
-        assert edge.parent == "prepare_data"
-        assert edge.child == "analyze_data"
-
-        # Verify task commands
-        prepare_task = workflow.tasks["prepare_data"]
-        analyze_task = workflow.tasks["analyze_data"]
-        
-        assert "echo" in prepare_task.command.get_value_for("shared_filesystem")
-        assert "wc -l" in analyze_task.command.get_value_for("shared_filesystem")
 
-    finally:
-        # Clean up
-        if wdl_file.exists():
-            wdl_file.unlink()
-
-
-def test_wdl_importer_error_handling():
-    """Test WDL importer error handling."""
-
-    # Test with invalid WDL content
-    invalid_wdl = """
+INVALID_WDL = """
 version 1.0
 
 task invalid_task {
@@ -277,22 +167,8 @@ task invalid_task {
     # Missing closing brace
 """
 
-    wdl_file = Path("test_invalid.wdl")
-    wdl_file.write_text(invalid_wdl)
-
-    try:
-        # Should handle parsing errors gracefully
-        with pytest.raises(Exception):
-            wdl.to_workflow(wdl_file, verbose=True)
-    finally:
-        if wdl_file.exists():
-            wdl_file.unlink()
-
-
-def test_wdl_type_conversion():
-    """Test WDL type conversion to IR types."""
 
-    wdl_content = """
+TYPES_WDL = """
 version 1.0
 
 task type_test {
@@ -340,33 +216,8 @@ workflow type_workflow {
 }
 """
 
-    wdl_file = Path("test_types.wdl")
-    wdl_file.write_text(wdl_content)
 
-    try:
-        workflow = wdl.to_workflow(wdl_file, verbose=True)
-
-        # Verify type conversions
-        assert len(workflow.inputs) == 6
-        
-        # Check that inputs have correct types
-        input_ids = [input_spec.id for input_spec in workflow.inputs]
-        assert "test_string" in input_ids
-        assert "test_int" in input_ids
-        assert "test_float" in input_ids
-        assert "test_bool" in input_ids
-        assert "test_file" in input_ids
-        assert "test_array" in input_ids
-
-    finally:
-        if wdl_file.exists():
-            wdl_file.unlink()
-
-
-def test_wdl_memory_parsing():
-    """Test WDL memory parsing with different units."""
-
-    wdl_content = """
+MEMORY_WDL = """
 version 1.0
 
 task memory_test {
@@ -403,25 +254,8 @@ workflow memory_workflow {
 }
 """
 
-    wdl_file = Path("test_memory.wdl")
-    wdl_file.write_text(wdl_content)
-
-    try:
-        workflow = wdl.to_workflow(wdl_file, verbose=True)
-        
-        task = list(workflow.tasks.values())[0]
-        # Verify memory parsing (512 MB = 512 MB)
-        assert task.mem_mb.get_value_for("shared_filesystem") == 512
-
-    finally:
-        if wdl_file.exists():
-            wdl_file.unlink()
 
-
-def test_wdl_disk_parsing():
-    """Test WDL disk parsing with different units."""
-
-    wdl_content = """
+DISK_WDL = """
 version 1.0
 
 task disk_test {
@@ -459,16 +293,227 @@ workflow disk_workflow {
 }
 """
 
-    wdl_file = Path("test_disk.wdl")
-    wdl_file.write_text(wdl_content)
 
-    try:
-        workflow = wdl.to_workflow(wdl_file, verbose=True)
-        
-        task = list(workflow.tasks.values())[0]
-        # Verify disk parsing (1 GB = 1024 MB)
-        assert task.disk_mb.get_value_for("shared_filesystem") == 1024
+ANNOTATED_WDL = """
+version 1.0
+
+task annotated {
+    input {
+        String word
+    }
+
+    command <<<
+        echo "${word}"
+    >>>
+
+    output {
+        String said = stdout()
+    }
+
+    meta {
+        description: "Echo a word"
+    }
+
+    parameter_meta {
+        word: "The word to echo"
+    }
+}
+
+workflow annotated_workflow {
+    call annotated {
+        input: word = "hi"
+    }
+}
+"""
+
+
+WDL_SOURCES = {
+    "hello": HELLO_WDL,
+    "scatter": SCATTER_WDL,
+    "multi_task": MULTI_TASK_WDL,
+    "invalid": INVALID_WDL,
+    "types": TYPES_WDL,
+    "memory": MEMORY_WDL,
+    "disk": DISK_WDL,
+    "annotated": ANNOTATED_WDL,
+}
+
+
+@pytest.fixture(scope="session")
+def wdl_files(tmp_path_factory):
+    """Write every WDL source once per session and map its key to the file."""
+    wdl_dir = tmp_path_factory.mktemp("wdl")
+    paths = {}
+    for key, source in WDL_SOURCES.items():
+        paths[key] = wdl_dir / f"{key}.wdl"
+        paths[key].write_text(source)
+    return paths
+
+
+def test_wdl_importer_basic_task(wdl_files):
+    """Test importing a basic WDL task."""
+
+    wdl_file = wdl_files["hello"]
+
+    # Import the workflow
+    workflow = wdl.to_workflow(wdl_file, verbose=True)
+
+    # Verify workflow properties
+    assert workflow.name == "hello_workflow"
+    assert workflow.version == "1.0"
+    assert len(workflow.tasks) == 1
+
+    # Verify task properties
+    task = next(iter(workflow.tasks.values()))
+    assert task.id == "hello_world"
+    assert "echo" in task.command.get_value_for("shared_filesystem")
+    assert task.cpu.get_value_for("shared_filesystem") == 1
+    assert task.mem_mb.get_value_for("shared_filesystem") == 1024  # 1 GB converted to MB
+    assert "docker://ubuntu:20.04" in task.container.get_value_for("shared_filesystem")
+
+    # Verify inputs and outputs
+    assert len(workflow.inputs) == 1
+    assert workflow.inputs[0].id == "input_name"
+    assert workflow.inputs[0].default == "World"
+
+    assert len(workflow.outputs) == 1
+    assert workflow.outputs[0].id == "result"
+
+    # Verify metadata preservation
+    if workflow.metadata and workflow.metadata.format_specific:
+        assert workflow.metadata.format_specific.get("source_format") == "wdl"
+        assert workflow.metadata.format_specific.get("wdl_version") == "1.0"
+
+
+def test_wdl_importer_scatter(wdl_files):
+    """Test importing a WDL workflow with scatter."""
+
+    wdl_file = wdl_files["scatter"]
+
+    # Import the workflow
+    workflow = wdl.to_workflow(wdl_file, verbose=True)
+
+    # Verify workflow properties
+    assert workflow.name == "scatter_workflow"
+    assert len(workflow.tasks) == 1
+
+    # Verify scatter operation
+    task = next(iter(workflow.tasks.values()))
+    scatter_spec = task.scatter.get_value_for("shared_filesystem")
+    assert scatter_spec is not None
+    assert scatter_spec.scatter_method == "dotproduct"
+
+    # Verify resources
+    assert task.cpu.get_value_for("shared_filesystem") == 2
+    assert task.mem_mb.get_value_for("shared_filesystem") == 2048  # 2 GB converted to MB
+
+
+def test_wdl_importer_multiple_tasks(wdl_files):
+    """Test importing a WDL workflow with multiple tasks and dependencies."""
+
+    wdl_file = wdl_files["multi_task"]
+
+    # Import the workflow
+    workflow = wdl.to_workflow(wdl_file, verbose=True)
+
+    # Verify workflow properties
+    assert workflow.name == "multi_task_workflow"
+    assert len(workflow.tasks) == 2
+
+    # Verify tasks exist
+    assert "prepare_data" in workflow.tasks
+    assert "analyze_data" in workflow.tasks
+
+    # Verify dependencies
+    assert len(workflow.edges) == 1
+    edge = workflow.edges[0]
+    assert edge.parent == "prepare_data"
+    assert edge.child == "analyze_data"
+
+    # Verify task commands
+    prepare_task = workflow.tasks["prepare_data"]
+    analyze_task = workflow.tasks["analyze_data"]
+    
+    assert "echo" in prepare_task.command.get_value_for("shared_filesystem")
+    assert "wc -l" in analyze_task.command.get_value_for("shared_filesystem")
+
+
+def test_wdl_importer_error_handling(wdl_files):
+    """Test WDL importer error handling."""
+
+    wdl_file = wdl_files["invalid"]
+
+    # Should handle parsing errors gracefully
+    with pytest.raises(Exception):
+        wdl.to_workflow(wdl_file, verbose=True)
+
+
+def test_wdl_type_conversion(wdl_files):
+    """Test WDL type conversion to IR types."""
+
+    wdl_file = wdl_files["types"]
+
+    workflow = wdl.to_workflow(wdl_file, verbose=True)
+
+    # Verify type conversions
+    assert len(workflow.inputs) == 6
+    
+    # Check that inputs have correct types
+    input_ids = [input_spec.id for input_spec in workflow.inputs]
+    assert "test_string" in input_ids
+    assert "test_int" in input_ids
+    assert "test_float" in input_ids
+    assert "test_bool" in input_ids
+    assert "test_file" in input_ids
+    assert "test_array" in input_ids
+
+
+def test_wdl_memory_parsing(wdl_files):
+    """Test WDL memory parsing with different units."""
+
+    wdl_file = wdl_files["memory"]
+
+    workflow = wdl.to_workflow(wdl_file, verbose=True)
+    
+    task = next(iter(workflow.tasks.values()))
+    # Verify memory parsing (512 MB = 512 MB)
+    assert task.mem_mb.get_value_for("shared_filesystem") == 512
+
+
+def test_wdl_disk_parsing(wdl_files):
+    """Test WDL disk parsing with different units."""
+
+    wdl_file = wdl_files["disk"]
+
+    workflow = wdl.to_workflow(wdl_file, verbose=True)
+    
+    task = next(iter(workflow.tasks.values()))
+    # Verify disk parsing (1 GB = 1024 MB)
+    assert task.disk_mb.get_value_for("shared_filesystem") == 1024
+
+
+def test_wdl_importer_skips_parameter_meta_without_metadata(wdl_files):
+    """parameter_meta is only parsed when metadata is preserved."""
+
+    wdl_file = wdl_files["annotated"]
+
+    def parameter_meta(workflow):
+        wdl_doc = workflow.metadata.format_specific["wdl_document"]
+        return wdl_doc["tasks"]["annotated"]["parameter_meta"]
+
+    preserved = wdl.to_workflow(wdl_file)
+    assert parameter_meta(preserved) == {"word": "The word to echo"}
+
+    stripped = wdl.to_workflow(wdl_file, preserve_metadata=False)
+    assert parameter_meta(stripped) == {}
+    assert stripped.tasks["annotated"].doc == "Echo a word"
+
+
+def test_wdl_dependencies_match_whole_call_names():
+    """A call only depends on calls whose full name prefixes an output reference."""
+
+    call = {"inputs": {"reads": "preprocess.reads", "sample": "sample_id"}}
+
+    edges = wdl._extract_wdl_dependencies(call, "align", ["prep", "preprocess", "align"])
 
-    finally:
-        if wdl_file.exists():
-            wdl_file.unlink()
+    assert [(edge.parent, edge.child) for edge in edges] == [("preprocess", "align")]
@@ -6,22 +6,8 @@ All Snakemake CLI calls are mocked so the suite runs without Snakemake.
 from __future__ import annotations
 
 from unittest.mock import patch, MagicMock
-import sys
-import importlib.util
-import pathlib
 import re
 
-# ---------------------------------------------------------------------------
-# Local package bootstrap (when repo not installed in site-packages)
-# ---------------------------------------------------------------------------
-proj_root = pathlib.Path(__file__).resolve().parents[1]
-if "wf2wf" not in sys.modules:
-    spec = importlib.util.spec_from_file_location("wf2wf", proj_root / "__init__.py")
-    pkg = importlib.util.module_from_spec(spec)
-    sys.modules["wf2wf"] = pkg  # type: ignore[assignment]
-    assert spec and spec.loader
-    spec.loader.exec_module(pkg)  # type: ignore[arg-type]
-
 from wf2wf.importers import snakemake as sm_importer
 from wf2wf.exporters import dagman as dag_exporter
 from wf2wf.core import Workflow
@@ -2,7 +2,6 @@
 
 import sys
 import pathlib
-import importlib.util
 import pytest
 from pathlib import Path
 import textwrap
@@ -10,18 +9,8 @@ import subprocess
 import shutil
 import os
 
-# Allow running tests without installing package
 proj_root = pathlib.Path(__file__).resolve().parents[2]
 
-if "wf2wf" not in sys.modules:
-    spec = importlib.util.spec_from_file_location(
-        "wf2wf", proj_root / "wf2wf" / "__init__.py"
-    )
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["wf2wf"] = module  # type: ignore[assignment]
-    assert spec and spec.loader
-    spec.loader.exec_module(module)  # type: ignore[arg-type]
-
 from wf2wf.core import Workflow, Task, ParameterSpec, MetadataSpec, EnvironmentSpecificValue, Edge
 
 try:
@@ -7,20 +7,6 @@ basic workflow conversion, including configuration precedence, large workflow
 handling, and various edge cases.
 """
 
-import sys
-import pathlib
-import importlib.util
-
-# Allow running tests without installing package
-proj_root = pathlib.Path(__file__).resolve().parents[1]
-
-if "wf2wf" not in sys.modules:
-    spec = importlib.util.spec_from_file_location("wf2wf", proj_root / "__init__.py")
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["wf2wf"] = module  # type: ignore[assignment]
-    assert spec and spec.loader
-    spec.loader.exec_module(module)  # type: ignore[arg-type]
-
 import pytest
 from pathlib import Path
 
@@ -148,9 +134,10 @@ class TestPerformanceAndScaling:
 
         # Create 100 tasks with dependencies
         num_tasks = 100
+        ids = [f"task_{i:03d}" for i in range(num_tasks)]
         for i in range(num_tasks):
             task = Task(
-                id=f"task_{i:03d}",
+                id=ids[i],
                 command=f"echo 'Processing step {i}' > output_{i:03d}.txt",
             )
             task.cpu.set_for_environment(2, "shared_filesystem")
@@ -160,7 +147,7 @@ class TestPerformanceAndScaling:
 
             # Add dependency to previous task (creating a chain)
             if i > 0:
-                wf.add_edge(f"task_{i-1:03d}", f"task_{i:03d}")
+                wf.add_edge(ids[i - 1], ids[i])
 
         # Verify structure
         assert len(wf.tasks) == num_tasks
@@ -387,10 +374,9 @@ class TestDAGManExportAdvanced:
 
         # Create a moderately large workflow (50 tasks)
         num_tasks = 50
+        ids = [f"task_{i:02d}" for i in range(num_tasks)]
         for i in range(num_tasks):
-            task = Task(
-                id=f"task_{i:02d}",
-            )
+            task = Task(id=ids[i])
             task.command.set_for_environment(f"echo 'Task {i}' > output_{i:02d}.txt", "distributed_computing")
             task.cpu.set_for_environment(2 if i % 2 == 0 else 4, "distributed_computing")
             task.mem_mb.set_for_environment(4096 + (i * 100), "distributed_computing")  # Varying memory requirements
@@ -399,7 +385,7 @@ class TestDAGManExportAdvanced:
 
             # Create some dependencies (not fully linear)
             if i > 0 and i % 5 != 0:  # Skip every 5th task for parallel branches
-                wf.add_edge(f"task_{i-1:02d}", f"task_{i:02d}")
+                wf.add_edge(ids[i - 1], ids[i])
 
         # Export to DAG
         dag_path = tmp_path / "large_workflow.dag"
@@ -410,8 +396,8 @@ class TestDAGManExportAdvanced:
         dag_content = dag_path.read_text()
 
         # Check that all tasks are represented
-        for i in range(num_tasks):
-            assert f"task_{i:02d}" in dag_content
+        for task_id in ids:
+            assert task_id in dag_content
 
         # Verify some resource specifications in submit files
         # Check a few sample submit files for resource specifications
@@ -1,27 +1,12 @@
 """Tests for CLI integration and command-line interface functionality."""
 
-import sys
-import pathlib
-import importlib.util
+import copy
+import hashlib
 import pytest
 import json
-
-# Allow running tests without installing package
-proj_root = pathlib.Path(__file__).resolve().parents[1]
-
-if "wf2wf" not in sys.modules:
-    spec = importlib.util.spec_from_file_location("wf2wf", proj_root / "__init__.py")
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["wf2wf"] = module  # type: ignore[assignment]
-    assert spec and spec.loader
-    spec.loader.exec_module(module)  # type: ignore[arg-type]
+from pathlib import Path
 
 from wf2wf.core import Workflow, Task
-from wf2wf.exporters import dagman as dag_exporter
-
-# Test if snakemake importer is available without importing it
-import importlib.util
-SNAKEMAKE_AVAILABLE = importlib.util.find_spec("wf2wf.importers.snakemake") is not None
 
 
 class TestConfigurationFileHandling:
@@ -141,27 +126,42 @@ class TestConfigurationFileHandling:
 class TestResourceDefaultsAndCustomization:
     """Test resource defaults and customization options."""
 
-    def test_custom_condor_attributes_parsing(self):
-        """Test parsing of custom Condor attributes from configuration."""
-        custom_attrs = {
-            "requirements": '(OpSysAndVer == "CentOS7")',
-            "+WantGPULab": "true",
-            "rank": "Memory",
-            "+ProjectName": '"MyProject"',
-        }
-
-        task = Task(
-            id="custom_attrs_task",
-        )
-        task.command.set_for_environment("echo 'custom attributes'", "distributed_computing")
-        task.extra = custom_attrs
-
-        assert task.extra["requirements"] == '(OpSysAndVer == "CentOS7")'
-        assert task.extra["+WantGPULab"] == "true"
-        assert task.extra["rank"] == "Memory"
-        assert task.extra["+ProjectName"] == '"MyProject"'
-
-    def test_dagman_export_custom_attributes(self, tmp_path):
+    @pytest.mark.parametrize(
+        "resources,extra",
+        [
+            pytest.param({}, {
+                "requirements": '(OpSysAndVer == "CentOS7")',
+                "+WantGPULab": "true",
+                "rank": "Memory",
+                "+ProjectName": '"MyProject"',
+            }, id="custom_condor_attributes"),
+            pytest.param({
+                "cpu": 16, "mem_mb": 32768, "disk_mb": 100000, "gpu": 2, "gpu_mem_mb": 8000,
+            }, {
+                "requirements": '(OpSysAndVer == "CentOS7")',
+                "+WantGPULab": "true",
+                "rank": "Memory",
+            }, id="mixed_resources"),
+            # Zero and very large resource values should both be allowed
+            pytest.param({"cpu": 0, "mem_mb": 0, "disk_mb": 0}, {}, id="zero_resources"),
+            pytest.param(
+                {"cpu": 128, "mem_mb": 1048576, "disk_mb": 10485760}, {}, id="large_resources"
+            ),
+        ],
+    )
+    def test_resource_and_attribute_specifications(self, resources, extra):
+        """Test standard resources and custom Condor attributes are kept as set."""
+        task = Task(id="resource_task")
+        task.command.set_for_environment("echo 'resources'", "distributed_computing")
+        for name, value in resources.items():
+            getattr(task, name).set_for_environment(value, "distributed_computing")
+        task.extra = dict(extra)
+
+        for name, value in resources.items():
+            assert getattr(task, name).get_value_with_default("distributed_computing") == value
+        assert task.extra == extra
+
+    def test_dagman_export_custom_attributes(self, exported_dag):
         """Test that custom Condor attributes are exported to DAG file."""
         wf = Workflow(name="custom_attrs_test")
 
@@ -180,46 +180,11 @@ class TestResourceDefaultsAndCustomization:
         task.extra = custom_attrs
         wf.add_task(task)
 
-        dag_path = tmp_path / "custom_attrs.dag"
-        dag_exporter.from_workflow(wf, dag_path, workdir=tmp_path)
-
-        # Check submit file for custom attributes
-        submit_path = tmp_path / "custom_task.sub"
-        submit_content = submit_path.read_text()
-
-        # Check that custom attributes are included
-        assert "requirements = (HasLargeScratch == True)" in submit_content
-        assert "+WantGPULab = true" in submit_content
-
-        # Check that standard resources are also included
-        assert "request_cpus = 4" in submit_content
-        assert "request_memory = 8192MB" in submit_content
-        assert "request_gpus = 1" in submit_content
-
-    def test_mixed_resource_specifications(self):
-        """Test mixing standard and custom resource specifications."""
-        task = Task(id="mixed_resources")
-        task.command.set_for_environment("python complex_job.py", "distributed_computing")
-        task.cpu.set_for_environment(16, "distributed_computing")
-        task.mem_mb.set_for_environment(32768, "distributed_computing")
-        task.disk_mb.set_for_environment(100000, "distributed_computing")
-        task.gpu.set_for_environment(2, "distributed_computing")
-        task.gpu_mem_mb.set_for_environment(8000, "distributed_computing")
-        task.extra = {
-                    "requirements": '(OpSysAndVer == "CentOS7")',
-                    "+WantGPULab": "true",
-                    "rank": "Memory",
-        }
+        dag_path = exported_dag(wf, "custom_attrs.dag")
 
-        # Standard resources
-        assert task.cpu.get_value_with_default("distributed_computing") == 16
-        assert task.mem_mb.get_value_with_default("distributed_computing") == 32768
-        assert task.disk_mb.get_value_with_default("distributed_computing") == 100000
-        assert task.gpu.get_value_with_default("distributed_computing") == 2
-        assert task.gpu_mem_mb.get_value_with_default("distributed_computing") == 8000
-        assert task.extra["requirements"] == '(OpSysAndVer == "CentOS7")'
-        assert task.extra["+WantGPULab"] == "true"
-        assert task.extra["rank"] == "Memory"
+        # Check submit file for custom attributes and standard resources
+        submit_content = (dag_path.parent / "custom_task.sub").read_bytes()
+        assert not _missing(submit_content, _EXPECTED_CUSTOM_ATTRS_SUBMIT)
 
 
 class TestWorkflowValidationAndErrorHandling:
@@ -249,28 +214,6 @@ class TestWorkflowValidationAndErrorHandling:
         with pytest.raises(json.JSONDecodeError):
             json.loads(invalid_config)
 
-    def test_resource_validation_edge_cases(self):
-        """Test resource validation with edge cases."""
-        # Zero resources should be allowed
-        task_zero = Task(id="zero_resources")
-        task_zero.command.set_for_environment("echo 'minimal'", "distributed_computing")
-        task_zero.cpu.set_for_environment(0, "distributed_computing")
-        task_zero.mem_mb.set_for_environment(0, "distributed_computing")
-        task_zero.disk_mb.set_for_environment(0, "distributed_computing")
-        assert task_zero.cpu.get_value_with_default("distributed_computing") == 0
-        assert task_zero.mem_mb.get_value_with_default("distributed_computing") == 0
-        assert task_zero.disk_mb.get_value_with_default("distributed_computing") == 0
-
-        # Large resource values should be allowed
-        task_large = Task(id="large_resources")
-        task_large.command.set_for_environment("echo 'large'", "distributed_computing")
-        task_large.cpu.set_for_environment(128, "distributed_computing")
-        task_large.mem_mb.set_for_environment(1048576, "distributed_computing")
-        task_large.disk_mb.set_for_environment(10485760, "distributed_computing")
-        assert task_large.cpu.get_value_with_default("distributed_computing") == 128
-        assert task_large.mem_mb.get_value_with_default("distributed_computing") == 1048576
-        assert task_large.disk_mb.get_value_with_default("distributed_computing") == 10485760
-
     def test_workflow_consistency_validation(self):
         """Test validation of workflow consistency."""
         wf = Workflow(name="consistency_test")
@@ -301,173 +244,253 @@ class TestWorkflowValidationAndErrorHandling:
             assert edge.child in wf.tasks
 
 
-class TestIntegrationScenarios:
-    """Test integration scenarios combining multiple features."""
+def _build_complex_integration_wf() -> Workflow:
+    """Three tasks mixing conda, GPU/container and plain execution."""
+    # Create metadata spec with config and meta data
+    from wf2wf.core import MetadataSpec
+    metadata = MetadataSpec(format_specific={
+        "config": {"default_memory": "4GB", "conda_prefix": "/opt/conda/envs"},
+        "meta": {"author": "integration_test", "version": "1.0"}
+    })
+
+    wf = Workflow(name="complex_integration", metadata=metadata)
+
+    # Task with conda environment and custom resources
+    conda_task = Task(
+        id="conda_analysis",
+    )
+    conda_task.command.set_for_environment("python analyze.py", "distributed_computing")
+    conda_task.cpu.set_for_environment(8, "distributed_computing")
+    conda_task.mem_mb.set_for_environment(16384, "distributed_computing")
+    conda_task.conda.set_for_environment("analysis_env.yaml", "distributed_computing")
+    conda_task.extra = {"requirements": "(HasLargeScratch == True)"}
+    wf.add_task(conda_task)
+
+    # Task with container and GPU
+    container_task = Task(
+        id="gpu_processing",
+    )
+    container_task.command.set_for_environment("python gpu_process.py", "distributed_computing")
+    container_task.cpu.set_for_environment(4, "distributed_computing")
+    container_task.mem_mb.set_for_environment(8192, "distributed_computing")
+    container_task.gpu.set_for_environment(1, "distributed_computing")
+    container_task.gpu_mem_mb.set_for_environment(4000, "distributed_computing")
+    container_task.container.set_for_environment("docker://gpu-python:latest", "distributed_computing")
+    wf.add_task(container_task)
+
+    # Regular task
+    regular_task = Task(id="final_summary")
+    regular_task.command.set_for_environment("python summarize.py", "distributed_computing")
+    wf.add_task(regular_task)
+
+    # Add dependencies
+    wf.add_edge("conda_analysis", "gpu_processing")
+    wf.add_edge("gpu_processing", "final_summary")
+    return wf
+
+
+END_TO_END_TASKS = [
+    {
+        "id": "preprocess",
+        "command": "python preprocess.py --input raw_data.txt --output clean_data.csv",
+        "resources": {"cpu": 2, "mem_mb": 4096},
+    },
+    {
+        "id": "analyze",
+        "command": "python analyze.py --input clean_data.csv --output results.json",
+        "environment": {"conda": "analysis_env.yaml"},
+        "resources": {"cpu": 4, "mem_mb": 8192},
+    },
+    {
+        "id": "visualize",
+        "command": "python plot.py --input results.json --output plots.png",
+        "environment": {"container": "docker://python:3.9-slim"},
+        "resources": {"cpu": 1, "mem_mb": 2048},
+    },
+]
+
+_EXPECTED_END_TO_END_DAG = frozenset({
+    *(f"JOB {task_config['id']}".encode() for task_config in END_TO_END_TASKS),
+    b"PARENT preprocess CHILD analyze",
+    b"PARENT analyze CHILD visualize",
+})
+_EXPECTED_ANALYZE_SUBMIT = frozenset({b"request_cpus = 4", b"universe = vanilla"})
+_EXPECTED_VISUALIZE_SUBMIT = frozenset({b"request_cpus = 1", b"universe = docker"})
+
+
+def _build_end_to_end_wf() -> Workflow:
+    """Linear preprocess -> analyze -> visualize workflow built from END_TO_END_TASKS."""
+    wf = Workflow(name="end_to_end_test")
+
+    # Add tasks to workflow
+    for task_config in END_TO_END_TASKS:
+        task = Task(id=task_config["id"])
+        task.command.set_for_environment(task_config["command"], "distributed_computing")
+
+        # Set resources
+        if "resources" in task_config:
+            resources = task_config["resources"]
+            if "cpu" in resources:
+                task.cpu.set_for_environment(resources["cpu"], "distributed_computing")
+            if "mem_mb" in resources:
+                task.mem_mb.set_for_environment(resources["mem_mb"], "distributed_computing")
+
+        # Set environment-specific values
+        if "environment" in task_config:
+            env = task_config["environment"]
+            if "conda" in env:
+                task.conda.set_for_environment(env["conda"], "distributed_computing")
+            if "container" in env:
+                task.container.set_for_environment(env["container"], "distributed_computing")
 
-    def test_complex_workflow_integration(self, tmp_path):
-        """Test complex workflow with multiple features combined."""
-        # Create metadata spec with config and meta data
-        from wf2wf.core import MetadataSpec
-        metadata = MetadataSpec(format_specific={
-            "config": {"default_memory": "4GB", "conda_prefix": "/opt/conda/envs"},
-            "meta": {"author": "integration_test", "version": "1.0"}
-        })
-        
-        wf = Workflow(name="complex_integration", metadata=metadata)
+        wf.add_task(task)
 
-        # Task with conda environment and custom resources
-        conda_task = Task(
-            id="conda_analysis",
-        )
-        conda_task.command.set_for_environment("python analyze.py", "distributed_computing")
-        conda_task.cpu.set_for_environment(8, "distributed_computing")
-        conda_task.mem_mb.set_for_environment(16384, "distributed_computing")
-        conda_task.conda.set_for_environment("analysis_env.yaml", "distributed_computing")
-        conda_task.extra = {"requirements": "(HasLargeScratch == True)"}
-        wf.add_task(conda_task)
-
-        # Task with container and GPU
-        container_task = Task(
-            id="gpu_processing",
-        )
-        container_task.command.set_for_environment("python gpu_process.py", "distributed_computing")
-        container_task.cpu.set_for_environment(4, "distributed_computing")
-        container_task.mem_mb.set_for_environment(8192, "distributed_computing")
-        container_task.gpu.set_for_environment(1, "distributed_computing")
-        container_task.gpu_mem_mb.set_for_environment(4000, "distributed_computing")
-        container_task.container.set_for_environment("docker://gpu-python:latest", "distributed_computing")
-        wf.add_task(container_task)
-
-        # Regular task
-        regular_task = Task(id="final_summary")
-        regular_task.command.set_for_environment("python summarize.py", "distributed_computing")
-        wf.add_task(regular_task)
-
-        # Add dependencies
-        wf.add_edge("conda_analysis", "gpu_processing")
-        wf.add_edge("gpu_processing", "final_summary")
+    # Add dependencies
+    wf.add_edge("preprocess", "analyze")
+    wf.add_edge("analyze", "visualize")
+    return wf
+
+
+def _slurp(paths):
+    """Read each file once, as bytes, keyed by file name."""
+    return {p.name: p.read_bytes() for p in paths}
+
+
+def _missing(blob, needles):
+    """Return the needles that do not occur in *blob*, for one assertion per buffer."""
+    return {needle for needle in needles if needle not in blob}
+
+
+# Lines each exported file must contain
+_EXPECTED_CUSTOM_ATTRS_SUBMIT = frozenset({
+    b"requirements = (HasLargeScratch == True)",
+    b"+WantGPULab = true",
+    b"request_cpus = 4",
+    b"request_memory = 8192MB",
+    b"request_gpus = 1",
+})
+_EXPECTED_COMPLEX_DAG = frozenset({
+    b"JOB conda_analysis",
+    b"JOB gpu_processing",
+    b"JOB final_summary",
+    b"PARENT conda_analysis CHILD gpu_processing",
+    b"PARENT gpu_processing CHILD final_summary",
+})
+# Conda task: vanilla universe, its resources and custom attributes
+_EXPECTED_CONDA_SUBMIT = frozenset({
+    b"universe = vanilla",
+    b"request_cpus = 8",
+    b"requirements = (HasLargeScratch == True)",
+})
+# GPU task: docker universe and GPU resources
+_EXPECTED_GPU_SUBMIT = frozenset({
+    b"universe = docker",
+    b"request_cpus = 4",
+    b"request_gpus = 1",
+})
+
+
+@pytest.fixture(scope="session")
+def _complex_integration_template():
+    return _build_complex_integration_wf()
 
-        # Export to DAG
-        dag_path = tmp_path / "complex_integration.dag"
-        dag_exporter.from_workflow(wf, dag_path, workdir=tmp_path)
 
-        dag_content = dag_path.read_text()
+@pytest.fixture(scope="session")
+def _end_to_end_template():
+    return _build_end_to_end_wf()
 
-        # Verify all tasks are present
-        assert "JOB conda_analysis" in dag_content
-        assert "JOB gpu_processing" in dag_content
-        assert "JOB final_summary" in dag_content
 
-        # Check submit files for universe and resource specifications
-        conda_submit = tmp_path / "conda_analysis.sub"
-        gpu_submit = tmp_path / "gpu_processing.sub"
+@pytest.fixture
+def complex_integration_wf(_complex_integration_template):
+    """Private copy of the complex integration workflow, built once per session."""
+    return copy.deepcopy(_complex_integration_template)
 
-        conda_content = conda_submit.read_text()
-        gpu_content = gpu_submit.read_text()
 
-        # Verify different universes are used appropriately
-        assert "universe = vanilla" in conda_content  # For conda task
-        assert "universe = docker" in gpu_content  # For container task
+@pytest.fixture
+def end_to_end_wf(_end_to_end_template):
+    """Private copy of the end-to-end workflow, built once per session."""
+    return copy.deepcopy(_end_to_end_template)
 
-        # Verify resources
-        assert "request_cpus = 8" in conda_content  # Conda task
-        assert "request_cpus = 4" in gpu_content  # GPU task
-        assert "request_gpus = 1" in gpu_content  # GPU task
 
-        # Verify custom attributes
-        assert "requirements = (HasLargeScratch == True)" in conda_content
+@pytest.fixture(scope="session")
+def exported_dag(tmp_path_factory):
+    """Export a workflow to DAGMan once per distinct workflow; return the DAG path.
 
-        # Verify dependencies
-        assert "PARENT conda_analysis CHILD gpu_processing" in dag_content
-        assert "PARENT gpu_processing CHILD final_summary" in dag_content
+    Tests only read the generated files, so identical exports share one
+    directory, keyed on the workflow's canonical JSON and the DAG file name.
+    """
+    from wf2wf.exporters import dagman as dag_exporter
 
-    def test_end_to_end_workflow_processing(self, tmp_path):
+    cache_root = tmp_path_factory.mktemp("dagcache")
+    exported = {}
+
+    def export(wf: Workflow, dag_name: str):
+        # Key before exporting: the exporter adds inferred values to wf
+        digest = hashlib.blake2b(wf.to_json_bytes(), digest_size=16).hexdigest()
+        key = (digest, dag_name)
+        if key not in exported:
+            workdir = cache_root / f"{digest}-{Path(dag_name).stem}"
+            workdir.mkdir()
+            dag_path = workdir / dag_name
+            dag_exporter.from_workflow(wf, dag_path, workdir=workdir)
+            exported[key] = dag_path
+        return exported[key]
+
+    return export
+
+
+class TestIntegrationScenarios:
+    """Test integration scenarios combining multiple features."""
+
+    def test_complex_workflow_integration(self, exported_dag, complex_integration_wf):
+        """Test complex workflow with multiple features combined."""
+        # Export to DAG
+        dag_path = exported_dag(complex_integration_wf, "complex_integration.dag")
+        out_dir = dag_path.parent
+
+        # DAG plus the submit files for universe and resource specifications
+        blobs = _slurp([
+            dag_path,
+            out_dir / "conda_analysis.sub",
+            out_dir / "gpu_processing.sub",
+        ])
+        dag_content = blobs["complex_integration.dag"]
+        conda_content = blobs["conda_analysis.sub"]
+        gpu_content = blobs["gpu_processing.sub"]
+
+        # Verify all tasks and dependencies are present
+        assert not _missing(dag_content, _EXPECTED_COMPLEX_DAG)
+
+        # Verify universes, resources and custom attributes per task
+        assert not _missing(conda_content, _EXPECTED_CONDA_SUBMIT)
+        assert not _missing(gpu_content, _EXPECTED_GPU_SUBMIT)
+
+    def test_end_to_end_workflow_processing(self, exported_dag, end_to_end_wf):
         """Test end-to-end workflow processing from creation to export."""
-        # Create a workflow programmatically
-        wf = Workflow(name="end_to_end_test")
-
-        # Add tasks with various configurations
-        tasks_config = [
-            {
-                "id": "preprocess",
-                "command": "python preprocess.py --input raw_data.txt --output clean_data.csv",
-                "resources": {"cpu": 2, "mem_mb": 4096},
-            },
-            {
-                "id": "analyze",
-                "command": "python analyze.py --input clean_data.csv --output results.json",
-                "environment": {"conda": "analysis_env.yaml"},
-                "resources": {"cpu": 4, "mem_mb": 8192},
-            },
-            {
-                "id": "visualize",
-                "command": "python plot.py --input results.json --output plots.png",
-                "environment": {"container": "docker://python:3.9-slim"},
-                "resources": {"cpu": 1, "mem_mb": 2048},
-            },
-        ]
-
-        # Add tasks to workflow
-        for task_config in tasks_config:
-            task = Task(id=task_config["id"])
-            task.command.set_for_environment(task_config["command"], "distributed_computing")
-            
-            # Set resources
-            if "resources" in task_config:
-                resources = task_config["resources"]
-                if "cpu" in resources:
-                    task.cpu.set_for_environment(resources["cpu"], "distributed_computing")
-                if "mem_mb" in resources:
-                    task.mem_mb.set_for_environment(resources["mem_mb"], "distributed_computing")
-            
-            # Set environment-specific values
-            if "environment" in task_config:
-                env = task_config["environment"]
-                if "conda" in env:
-                    task.conda.set_for_environment(env["conda"], "distributed_computing")
-                if "container" in env:
-                    task.container.set_for_environment(env["container"], "distributed_computing")
-            
-            wf.add_task(task)
-
-        # Add dependencies
-        wf.add_edge("preprocess", "analyze")
-        wf.add_edge("analyze", "visualize")
+        wf = end_to_end_wf
 
         # Validate workflow structure
         assert len(wf.tasks) == 3
         assert len(wf.edges) == 2
 
         # Export to DAG
-        dag_path = tmp_path / "end_to_end.dag"
-        dag_exporter.from_workflow(wf, dag_path, workdir=tmp_path)
+        dag_path = exported_dag(wf, "end_to_end.dag")
+        out_dir = dag_path.parent
 
-        # Verify DAG file was created and has expected content
+        # Verify DAG file was created and read it with the submit files
         assert dag_path.exists()
-        dag_content = dag_path.read_text()
-
-        # Check all jobs are present
-        for task_config in tasks_config:
-            assert f"JOB {task_config['id']}" in dag_content
+        blobs = _slurp([dag_path] + [out_dir / f"{t['id']}.sub" for t in END_TO_END_TASKS])
+        dag_content = blobs["end_to_end.dag"]
 
-        # Check dependencies are correct
-        assert "PARENT preprocess CHILD analyze" in dag_content
-        assert "PARENT analyze CHILD visualize" in dag_content
+        # Check all jobs are present and dependencies are correct
+        assert not _missing(dag_content, _EXPECTED_END_TO_END_DAG)
 
         # Check submit files for resource specifications
-        preprocess_submit = tmp_path / "preprocess.sub"
-        analyze_submit = tmp_path / "analyze.sub"
-        visualize_submit = tmp_path / "visualize.sub"
-
-        preprocess_content = preprocess_submit.read_text()
-        analyze_content = analyze_submit.read_text()
-        visualize_content = visualize_submit.read_text()
-
-        # Verify resource specifications
-        assert "request_cpus = 2" in preprocess_content  # preprocess
-        assert "request_cpus = 4" in analyze_content  # analyze
-        assert "request_cpus = 1" in visualize_content  # visualize
-
-        # Verify different execution environments
-        assert "universe = vanilla" in analyze_content  # conda task
-        assert "universe = docker" in visualize_content  # container task
+        preprocess_content = blobs["preprocess.sub"]
+        analyze_content = blobs["analyze.sub"]
+        visualize_content = blobs["visualize.sub"]
+
+        # Verify resource specifications and execution environments
+        assert b"request_cpus = 2" in preprocess_content  # preprocess
+        assert not _missing(analyze_content, _EXPECTED_ANALYZE_SUBMIT)  # conda task
+        assert not _missing(visualize_content, _EXPECTED_VISUALIZE_SUBMIT)  # container task
@@ -6,9 +6,16 @@ across all import/export operations, including round-trip conversions through
 different workflow engines.
 """
 
+import copy
+import logging
 import yaml
 import pytest
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
 from wf2wf.core import (
     Workflow,
     Task,
@@ -17,11 +24,15 @@ from wf2wf.core import (
     ParameterSpec,
     RequirementSpec,
 )
-from wf2wf.importers.cwl import to_workflow
+from wf2wf.importers.cwl import CWLParseError, to_workflow
 from wf2wf.exporters.cwl import from_workflow
 from wf2wf.exporters.dagman import from_workflow as dagman_from_workflow
 from wf2wf.importers.dagman import to_workflow as dagman_to_workflow
 
+# persistent_test_output is per xdist worker, so the module can be spread
+# across workers.
+pytestmark = pytest.mark.parallel
+
 
 class TestCWLFidelityPreservation:
     """Test comprehensive CWL feature preservation."""
@@ -68,7 +79,7 @@ class TestCWLFidelityPreservation:
 
         # Export to CWL
         cwl_file = persistent_test_output / "advanced_metadata.cwl"
-        from_workflow(workflow, cwl_file, preserve_metadata=True, verbose=True)
+        from_workflow(workflow, cwl_file, preserve_metadata=True)
 
         # Re-import and verify preservation
         imported_workflow = to_workflow(cwl_file, preserve_metadata=True)
@@ -141,19 +152,22 @@ class TestCWLFidelityPreservation:
         imported_workflow = to_workflow(cwl_file, preserve_metadata=True)
         imported_task = imported_workflow.tasks["param_task"]
 
+        inputs_by_id = {p.id: p for p in imported_task.inputs}
+        outputs_by_id = {p.id: p for p in imported_task.outputs}
+
         # Verify input parameters
-        input_file_param = next(p for p in imported_task.inputs if p.id == "input_file")
+        input_file_param = inputs_by_id["input_file"]
         assert input_file_param.type == "File"
         assert input_file_param.format == "http://edamontology.org/format_1930"
         assert ".fai" in input_file_param.secondary_files
         assert input_file_param.streamable is True
 
-        threshold_param = next(p for p in imported_task.inputs if p.id == "threshold")
+        threshold_param = inputs_by_id["threshold"]
         assert threshold_param.type == "float"
         assert threshold_param.default == 0.05
 
         # Verify output parameters
-        results_param = next(p for p in imported_task.outputs if p.id == "results")
+        results_param = outputs_by_id["results"]
         assert results_param.type == "File"
         assert results_param.format == "http://edamontology.org/format_3475"
         assert results_param.output_binding["glob"] == "results.tsv"
@@ -198,7 +212,7 @@ class TestCWLFidelityPreservation:
 
         # Export to CWL
         cwl_file = tmp_path / "requirements.cwl"
-        from_workflow(workflow, cwl_file, preserve_metadata=True, verbose=True)
+        from_workflow(workflow, cwl_file, preserve_metadata=True)
 
         # Re-import and verify requirements preservation
         imported_workflow = to_workflow(cwl_file, preserve_metadata=True)
@@ -215,23 +229,21 @@ class TestCWLFidelityPreservation:
         for i, hint in enumerate(imported_hints):
             print(f"  Hint {i}: {hint.class_name} - {hint.data}")
 
+        # Index by class; reversed so the first occurrence wins on duplicates
+        requirements_by_class = {r.class_name: r for r in reversed(imported_requirements)}
+        hints_by_class = {h.class_name: h for h in reversed(imported_hints)}
+
         # Verify requirements
-        docker_req = next(
-            r for r in imported_requirements if r.class_name == "DockerRequirement"
-        )
+        docker_req = requirements_by_class["DockerRequirement"]
         assert docker_req.data["dockerPull"] == "biocontainers/fastqc:v0.11.9_cv8"
 
-        resource_req = next(
-            r for r in imported_requirements if r.class_name == "ResourceRequirement"
-        )
+        resource_req = requirements_by_class["ResourceRequirement"]
         assert resource_req.data["coresMin"] == 4
         assert resource_req.data["ramMin"] == 8192
         assert resource_req.data["tmpdirMin"] == 10240
         assert resource_req.data["outdirMin"] == 5120
 
-        env_req = next(
-            r for r in imported_requirements if r.class_name == "EnvironmentVarRequirement"
-        )
+        env_req = requirements_by_class["EnvironmentVarRequirement"]
         env_def = env_req.data["envDef"]
         assert len(env_def) == 2
         assert env_def[0]["envName"] == "TMPDIR"
@@ -240,40 +252,114 @@ class TestCWLFidelityPreservation:
         assert env_def[1]["envValue"] == "$(runtime.cores)"
 
         # Verify hints
-        network_hint = next(
-            h for h in imported_hints if h.class_name == "NetworkAccess"
-        )
+        network_hint = hints_by_class["NetworkAccess"]
         assert network_hint.data["networkAccess"] is True
 
-        time_hint = next(h for h in imported_hints if h.class_name == "TimeLimit")
+        time_hint = hints_by_class["TimeLimit"]
         assert time_hint.data["timelimit"] == 3600
 
+    def test_verbose_export_logging(self, tmp_path, caplog):
+        """Test verbose export reports what it generates."""
+        workflow = Workflow(name="verbose_test", version="1.0")
+        task = Task(id="verbose_task")
+        task.command.set_for_environment("echo verbose", "shared_filesystem")
+        workflow.add_task(task)
+
+        cwl_file = tmp_path / "verbose.cwl"
+        with caplog.at_level(logging.INFO, logger="wf2wf.exporters.cwl"):
+            from_workflow(workflow, cwl_file, verbose=True)
+
+        assert cwl_file.exists()
+        assert f"Generating CWL workflow: {cwl_file}" in caplog.messages
+
+
+def _create_comprehensive_cwl_workflow() -> Workflow:
+    """Create a workflow with comprehensive CWL features for testing."""
+    provenance = ProvenanceSpec(
+        authors=[{"name": "Test Author 2", "orcid": "orcid:0000-0000-0000-0002"}], version="1.5.0", license="GPL-3.0"
+    )
+
+    workflow = Workflow(
+        name="comprehensive_test_workflow",
+        version="1.5.0",
+        provenance=provenance,
+        cwl_version="v1.2",
+    )
+
+    # Task with comprehensive features
+    task1 = Task(
+        id="comprehensive_task",
+        provenance=provenance,
+    )
+    # Set command using new IR
+    task1.command.set_for_environment("analysis_tool --input {input} --output {output}", "shared_filesystem")
+    # Set resources using new IR
+    task1.cpu.set_for_environment(4, "shared_filesystem")
+    task1.mem_mb.set_for_environment(8192, "shared_filesystem")
+    task1.disk_mb.set_for_environment(10240, "shared_filesystem")
+    # Set requirements and hints using new IR
+    task1.requirements.set_for_environment([
+        RequirementSpec("DockerRequirement", {"dockerPull": "biotools/analysis:latest"}),
+        RequirementSpec("ResourceRequirement", {"coresMin": 4, "ramMin": 8192}),
+    ], "shared_filesystem")
+    task1.hints.set_for_environment([
+        RequirementSpec("NetworkAccess", {"networkAccess": True})
+    ], "shared_filesystem")
+    task1.retry_count.set_for_environment(3, "shared_filesystem")
+    task1.priority.set_for_environment(10, "shared_filesystem")
+
+    task2 = Task(
+        id="followup_task",
+    )
+    task2.when.set_for_environment("$(inputs.run_followup)", "shared_filesystem")
+    # Set command using new IR
+    task2.command.set_for_environment("process_results --input {input}", "shared_filesystem")
+    # Set resources using new IR
+    task2.cpu.set_for_environment(2, "shared_filesystem")
+    task2.mem_mb.set_for_environment(4096, "shared_filesystem")
+
+    workflow.add_task(task1)
+    workflow.add_task(task2)
+    workflow.add_edge("comprehensive_task", "followup_task")
+
+    return workflow
+
+
+@pytest.fixture(scope="session")
+def _comprehensive_cwl_template():
+    return _create_comprehensive_cwl_workflow()
+
+
+@pytest.fixture
+def comprehensive_cwl_workflow(_comprehensive_cwl_template):
+    """Private copy of the comprehensive workflow, built once per session."""
+    return copy.deepcopy(_comprehensive_cwl_template)
+
 
 class TestRoundTripFidelity:
     """Test round-trip fidelity preservation across different workflow engines."""
 
     @pytest.mark.xfail(reason="IR lacks values for target environment (distributed_computing) and no default is set; adaptation/loss reporting for missing environment-specific values needs implementation")
-    def test_cwl_to_dagman_to_cwl_roundtrip(self, persistent_test_output):
-        """Test CWL -> IR -> DAGMan -> IR -> CWL round-trip preservation."""
-        # Create comprehensive CWL workflow
-        original_workflow = self._create_comprehensive_cwl_workflow()
+    def test_cwl_to_dagman_to_cwl_roundtrip(self, persistent_test_output, comprehensive_cwl_workflow):
+        """Test IR -> DAGMan -> IR -> CWL round-trip preservation.
 
-        # Step 1: CWL -> IR (import)
-        cwl_file1 = persistent_test_output / "original.cwl"
-        from_workflow(original_workflow, cwl_file1, preserve_metadata=True)
-        imported_workflow = to_workflow(cwl_file1, preserve_metadata=True)
+        The CWL export/import leg on its own is covered by
+        TestCWLFidelityPreservation, so the pipeline starts from the IR.
+        """
+        # Create comprehensive CWL workflow
+        original_workflow = comprehensive_cwl_workflow
 
-        # Step 2: IR -> DAGMan (export)
+        # Step 1: IR -> DAGMan (export)
         dag_file = persistent_test_output / "intermediate.dag"
         dagman_from_workflow(
-            imported_workflow, dag_file, scripts_dir=persistent_test_output / "scripts"
+            original_workflow, dag_file, scripts_dir=persistent_test_output / "scripts"
         )
 
-        # Step 3: DAGMan -> IR (import)
+        # Step 2: DAGMan -> IR (import)
         # Note: DAGMan import will lose some CWL-specific features, but should preserve core workflow
         dagman_workflow = dagman_to_workflow(dag_file)
 
-        # Step 4: IR -> CWL (export)
+        # Step 3: IR -> CWL (export) and back
         cwl_file2 = persistent_test_output / "roundtrip.cwl"
         from_workflow(dagman_workflow, cwl_file2, preserve_metadata=True)
         final_workflow = to_workflow(cwl_file2, preserve_metadata=True)
@@ -299,57 +385,6 @@ class TestRoundTripFidelity:
             if original_task.mem_mb.get_value_with_default("shared_filesystem", 0) > 0:
                 assert final_task.mem_mb.get_value_with_default("shared_filesystem", 0) >= 0
 
-    def _create_comprehensive_cwl_workflow(self) -> Workflow:
-        """Create a workflow with comprehensive CWL features for testing."""
-        provenance = ProvenanceSpec(
-            authors=[{"name": "Test Author 2", "orcid": "orcid:0000-0000-0000-0002"}], version="1.5.0", license="GPL-3.0"
-        )
-
-        workflow = Workflow(
-            name="comprehensive_test_workflow",
-            version="1.5.0",
-            provenance=provenance,
-            cwl_version="v1.2",
-        )
-
-        # Task with comprehensive features
-        task1 = Task(
-            id="comprehensive_task",
-            provenance=provenance,
-        )
-        # Set command using new IR
-        task1.command.set_for_environment("analysis_tool --input {input} --output {output}", "shared_filesystem")
-        # Set resources using new IR
-        task1.cpu.set_for_environment(4, "shared_filesystem")
-        task1.mem_mb.set_for_environment(8192, "shared_filesystem")
-        task1.disk_mb.set_for_environment(10240, "shared_filesystem")
-        # Set requirements and hints using new IR
-        task1.requirements.set_for_environment([
-            RequirementSpec("DockerRequirement", {"dockerPull": "biotools/analysis:latest"}),
-            RequirementSpec("ResourceRequirement", {"coresMin": 4, "ramMin": 8192}),
-        ], "shared_filesystem")
-        task1.hints.set_for_environment([
-            RequirementSpec("NetworkAccess", {"networkAccess": True})
-        ], "shared_filesystem")
-        task1.retry_count.set_for_environment(3, "shared_filesystem")
-        task1.priority.set_for_environment(10, "shared_filesystem")
-
-        task2 = Task(
-            id="followup_task",
-        )
-        task2.when.set_for_environment("$(inputs.run_followup)", "shared_filesystem")
-        # Set command using new IR
-        task2.command.set_for_environment("process_results --input {input}", "shared_filesystem")
-        # Set resources using new IR
-        task2.cpu.set_for_environment(2, "shared_filesystem")
-        task2.mem_mb.set_for_environment(4096, "shared_filesystem")
-
-        workflow.add_task(task1)
-        workflow.add_task(task2)
-        workflow.add_edge("comprehensive_task", "followup_task")
-
-        return workflow
-
 
 class TestEdgeCasesAndErrorHandling:
     """Test edge cases and error handling for CWL/BCO features."""
@@ -373,7 +408,7 @@ class TestEdgeCasesAndErrorHandling:
             f.write("#!/usr/bin/env cwl-runner\n")
             f.write("invalid: yaml: content: [\n")
 
-        with pytest.raises(Exception):
+        with pytest.raises(CWLParseError):
             to_workflow(malformed_cwl)
 
     def test_missing_required_fields(self, persistent_test_output):
@@ -387,7 +422,7 @@ class TestEdgeCasesAndErrorHandling:
         cwl_file = persistent_test_output / "minimal.cwl"
         with open(cwl_file, "w") as f:
             f.write("#!/usr/bin/env cwl-runner\n\n")
-            yaml.dump(minimal_cwl, f)
+            yaml.dump(minimal_cwl, f, Dumper=_Dumper)
 
         # Should handle gracefully and create minimal workflow
         workflow = to_workflow(cwl_file)
@@ -399,6 +434,7 @@ class TestEdgeCasesAndErrorHandling:
         # Create workflow with many tasks
         large_workflow = Workflow(name="large_test", version="1.0")
 
+        tasks = []
         for i in range(100):
             task = Task(
                 id=f"task_{i:03d}",
@@ -408,11 +444,12 @@ class TestEdgeCasesAndErrorHandling:
             # Set resources using new IR
             task.cpu.set_for_environment(1, "shared_filesystem")
             task.mem_mb.set_for_environment(1024, "shared_filesystem")
-            large_workflow.add_task(task)
+            tasks.append(task)
+        large_workflow.add_tasks_from(tasks)
 
-            # Add some dependencies
-            if i > 0:
-                large_workflow.add_edge(f"task_{i-1:03d}", f"task_{i:03d}")
+        # Chain the tasks
+        ids = [task.id for task in tasks]
+        large_workflow.add_edges_from(zip(ids, ids[1:]))
 
         # Test export performance
         cwl_file = persistent_test_output / "large.cwl"
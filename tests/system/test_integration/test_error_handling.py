@@ -7,132 +7,361 @@ Comprehensive tests for error-handling edge cases in wf2wf:
 - Invalid resource specifications
 """
 
-import sys
-import pathlib
-import importlib.util
-import tempfile
 import textwrap
 import pytest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
 from subprocess import CalledProcessError
 
-# Allow running tests without installing package
-proj_root = pathlib.Path(__file__).resolve().parents[1]
-
-if "wf2wf" not in sys.modules:
-    spec = importlib.util.spec_from_file_location("wf2wf", proj_root / "__init__.py")
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["wf2wf"] = module  # type: ignore[assignment]
-    assert spec and spec.loader
-    spec.loader.exec_module(module)  # type: ignore[arg-type]
-
 from wf2wf.core import Workflow, Task, ParameterSpec
 from wf2wf.exporters import dagman as dag_exporter
 from wf2wf.importers import snakemake as snake_importer
 
+# Snakemake is faked out and outputs go to tmp_path, so the module is xdist-safe.
+# With --dist=loadfile it stays on one worker, so the session Snakefiles are written once.
+pytestmark = pytest.mark.parallel
+
+
+# Snakefile bodies, dedented once at import time.
+_SMK_CIRCULAR = textwrap.dedent("""
+    rule A:
+        input: "B_out.txt"
+        output: "A_out.txt"
+        shell: "echo 'A' > {output}"
+
+    rule B:
+        input: "A_out.txt"
+        output: "B_out.txt"
+        shell: "echo 'B' > {output}"
+
+    rule all:
+        input: "A_out.txt"
+""")
+
+_SMK_CIRCULAR_COMPLEX = textwrap.dedent("""
+    rule A:
+        input: "C_out.txt"
+        output: "A_out.txt"
+        shell: "echo 'A' > {output}"
+
+    rule B:
+        input: "A_out.txt"
+        output: "B_out.txt"
+        shell: "echo 'B' > {output}"
+
+    rule C:
+        input: "B_out.txt"
+        output: "C_out.txt"
+        shell: "echo 'C' > {output}"
+
+    rule all:
+        input: "A_out.txt"
+""")
+
+_SMK_EMPTY = ""
+
+_SMK_COMMENTS_ONLY = textwrap.dedent("""
+    # This is a comment
+    # Another comment
+    # No actual rules here
+""")
+
+_SMK_NO_TARGETS = textwrap.dedent("""
+    rule orphan_rule:
+        output: "orphan.txt"
+        shell: "echo 'orphan' > {output}"
+""")
+
+_SMK_SYNTAX_ERROR = textwrap.dedent("""
+    rule all:
+        input: "result.txt"
+
+    rule process:
+        output: "result.txt"
+        shell: "echo 'result' > {output}"
+
+        This is not valid Python syntax!
+""")
+
+_SMK_MISSING_DIRECTIVE = textwrap.dedent("""
+    rule all:
+        input: "result.txt"
+
+    rule incomplete:
+        # Missing output directive
+        shell: "echo 'incomplete' > result.txt"
+""")
+
+_SMK_MISSING_INPUTS = textwrap.dedent("""
+    rule all:
+        input: "final.txt"
+
+    rule process:
+        input: "missing_file.txt"  # This file doesn't exist
+        output: "final.txt"
+        shell: "cat {input} > {output}"
+""")
+
+_SMK_INVALID_RESOURCES = textwrap.dedent("""
+    rule all:
+        input: "result.txt"
+
+    rule process:
+        output: "result.txt"
+        resources:
+            mem_mb = "not_a_number"  # Invalid syntax
+        shell: "echo 'result' > {output}"
+""")
+
+_SMK_NEGATIVE_RESOURCES = textwrap.dedent("""
+    rule all:
+        input: "result.txt"
+
+    rule process:
+        output: "result.txt"
+        resources:
+            mem_mb=-1000,
+            cpus=-2
+        shell: "echo 'result' > {output}"
+""")
+
+_SMK_SIMPLE = textwrap.dedent("""
+    rule all:
+        input: "result.txt"
+
+    rule process:
+        output: "result.txt"
+        shell: "echo 'result' > {output}"
+""")
+
+_SMK_FAILING_WORKFLOW = textwrap.dedent("""
+    rule A:
+        input: "B.txt"
+        output: "A.txt"
+        shell: "cat {input} > {output}"
+
+    rule B:
+        input: "A.txt"  # Circular dependency
+        output: "B.txt"
+        shell: "cat {input} > {output}"
+
+    rule all:
+        input: "A.txt"
+""")
+
+_SMK_PARTIAL_WORKFLOW = textwrap.dedent("""
+    rule all:
+        input: "good.txt"
+
+    rule good_rule:
+        output: "good.txt"
+        shell: "echo 'good' > {output}"
+""")
+
+
+# Canned ``snakemake --dag`` / ``--dry-run`` output shared by the fake runners.
+_DAG_EMPTY = "digraph snakemake_dag {}"
+_DRYRUN_NOTHING = "Nothing to be done."
+_STDERR_RULE_WARNING = "Warning: Some rules may have issues"
+
+_DAG_PROCESS_ALL = """digraph snakemake_dag {
+0 [label="rule process"];
+1 [label="rule all"];
+0 -> 1;
+}"""
 
-class TestCircularDependencies:
-    """Test circular dependency detection and error handling."""
+_DAG_GOOD_RULE_ALL = """digraph snakemake_dag {
+0 [label="rule good_rule"];
+1 [label="rule all"];
+0 -> 1;
+}"""
 
-    def test_circular_dependency_detection_simple(self, tmp_path):
-        """Test detection of simple A→B→A circular dependency."""
-        # Create circular dependency Snakefile
-        snakefile = tmp_path / "circular.smk"
-        snakefile.write_text(
-            textwrap.dedent("""
-            rule A:
-                input: "B_out.txt"
-                output: "A_out.txt"
-                shell: "echo 'A' > {output}"
-
-            rule B:
-                input: "A_out.txt"
-                output: "B_out.txt"
-                shell: "echo 'B' > {output}"
-
-            rule all:
-                input: "A_out.txt"
-        """)
-        )
+_DRYRUN_MISSING_INPUT = """Building DAG of jobs...
+rule process:
+    input: missing_file.txt
+    output: final.txt
+    jobid: 0
+    reason: Missing output files: final.txt
+    resources: tmpdir=<TBD>
+rule all:
+    input: final.txt
+    jobid: 1
+    reason: Input files updated by another job: final.txt
+    resources: tmpdir=<TBD>
+Nothing to be done."""
 
-        # Mock Snakemake to return circular dependency error
-        def _mock_run_circular(
-            cmd, capture_output=False, text=False, check=False, **kwargs
-        ):
-            m = MagicMock()
-            if "--dag" in cmd:
-                # Simulate Snakemake detecting circular dependency
-                m.stdout = ""
-                m.stderr = "Error: Circular dependency detected between rules A and B"
-                m.returncode = 1
-                raise CalledProcessError(1, cmd, output="", stderr=m.stderr)
-            return m
-
-        with patch(
-            "wf2wf.importers.snakemake.shutil.which", lambda x: "/usr/bin/snakemake"
-        ):
-            with patch(
-                "wf2wf.importers.snakemake.subprocess.run",
-                side_effect=_mock_run_circular,
-            ):
-                with pytest.raises(ImportError) as exc_info:
-                    snake_importer.to_workflow(snakefile, workdir=tmp_path)
-
-                assert "snakemake --dag" in str(exc_info.value)
-                assert "failed" in str(exc_info.value).lower()
-
-    def test_circular_dependency_detection_complex(self, tmp_path):
-        """Test detection of complex A→B→C→A circular dependency."""
-        snakefile = tmp_path / "circular_complex.smk"
-        snakefile.write_text(
-            textwrap.dedent("""
-            rule A:
-                input: "C_out.txt"
-                output: "A_out.txt"
-                shell: "echo 'A' > {output}"
-
-            rule B:
-                input: "A_out.txt"
-                output: "B_out.txt"
-                shell: "echo 'B' > {output}"
-
-            rule C:
-                input: "B_out.txt"
-                output: "C_out.txt"
-                shell: "echo 'C' > {output}"
-
-            rule all:
-                input: "A_out.txt"
-        """)
-        )
+_DRYRUN_NEGATIVE_RESOURCES = """Building DAG of jobs...
+rule process:
+    output: result.txt
+    jobid: 0
+    resources: mem_mb=-1000, cpus=-2, tmpdir=<TBD>
+rule all:
+    input: result.txt
+    jobid: 1
+    resources: tmpdir=<TBD>
+Nothing to be done."""
 
-        def _mock_run_complex_circular(
-            cmd, capture_output=False, text=False, check=False, **kwargs
-        ):
-            m = MagicMock()
-            if "--dag" in cmd:
-                m.stdout = ""
-                m.stderr = (
-                    "Error: Circular dependency detected in workflow: A → B → C → A"
-                )
-                m.returncode = 1
-                raise CalledProcessError(1, cmd, output="", stderr=m.stderr)
-            return m
-
-        with patch(
-            "wf2wf.importers.snakemake.shutil.which", lambda x: "/usr/bin/snakemake"
-        ):
-            with patch(
-                "wf2wf.importers.snakemake.subprocess.run",
-                side_effect=_mock_run_complex_circular,
-            ):
-                with pytest.raises(ImportError) as exc_info:
-                    snake_importer.to_workflow(snakefile, workdir=tmp_path)
+_DRYRUN_GOOD_RULE = """Building DAG of jobs...
+rule good_rule:
+    output: good.txt
+    jobid: 0
+    resources: tmpdir=<TBD>
+rule all:
+    input: good.txt
+    jobid: 1
+    resources: tmpdir=<TBD>
+Nothing to be done."""
 
-                assert "failed" in str(exc_info.value).lower()
 
-    def test_workflow_with_cycle_export_fails_gracefully(self):
+@pytest.fixture(scope="session")
+def snakefile_dir(tmp_path_factory):
+    """Directory holding the read-only Snakefiles shared by this module."""
+    return tmp_path_factory.mktemp("smk")
+
+
+def _write_snakefile(directory: Path, name: str, content: str) -> Path:
+    path = directory / name
+    path.write_text(content)
+    return path
+
+
+def _dag_error(stderr: str, returncode: int = 1):
+    """Fake ``subprocess.run`` whose ``snakemake --dag`` call fails with *stderr*."""
+
+    def run(cmd, **kwargs):
+        if "--dag" in cmd:
+            raise CalledProcessError(returncode, cmd, output="", stderr=stderr)
+        return SimpleNamespace(stdout="", stderr="", returncode=0)
+
+    return run
+
+
+def _dag_output(dag: str, dryrun: str, stderr: str = ""):
+    """Fake ``subprocess.run`` answering ``--dag`` and ``--dry-run`` successfully."""
+
+    def run(cmd, **kwargs):
+        if "--dag" in cmd:
+            return SimpleNamespace(stdout=dag, stderr=stderr, returncode=0)
+        if "--dry-run" in cmd:
+            return SimpleNamespace(stdout=dryrun, stderr=stderr, returncode=0)
+        return SimpleNamespace(stdout="", stderr="", returncode=0)
+
+    return run
+
+
+@pytest.fixture(autouse=True)
+def _which_snakemake(monkeypatch):
+    """Pretend a Snakemake executable is on PATH for every test in this module."""
+    monkeypatch.setattr(
+        "wf2wf.importers.snakemake.shutil.which", lambda x: "/usr/bin/snakemake"
+    )
+
+
+@pytest.fixture
+def fake_snakemake(monkeypatch):
+    """Route the importer's ``subprocess.run`` calls to a fake runner."""
+
+    def _install(run):
+        monkeypatch.setattr("wf2wf.importers.snakemake.subprocess.run", run)
+
+    return _install
+
+
+@pytest.fixture(scope="session")
+def circular_snakefile(snakefile_dir):
+    return _write_snakefile(snakefile_dir, "circular.smk", _SMK_CIRCULAR)
+
+
+@pytest.fixture(scope="session")
+def circular_complex_snakefile(snakefile_dir):
+    return _write_snakefile(snakefile_dir, "circular_complex.smk", _SMK_CIRCULAR_COMPLEX)
+
+
+@pytest.fixture(scope="session")
+def empty_snakefile(snakefile_dir):
+    return _write_snakefile(snakefile_dir, "empty.smk", _SMK_EMPTY)
+
+
+@pytest.fixture(scope="session")
+def comments_only_snakefile(snakefile_dir):
+    return _write_snakefile(snakefile_dir, "comments_only.smk", _SMK_COMMENTS_ONLY)
+
+
+@pytest.fixture(scope="session")
+def no_targets_snakefile(snakefile_dir):
+    return _write_snakefile(snakefile_dir, "no_targets.smk", _SMK_NO_TARGETS)
+
+
+@pytest.fixture(scope="session")
+def syntax_error_snakefile(snakefile_dir):
+    return _write_snakefile(snakefile_dir, "syntax_error.smk", _SMK_SYNTAX_ERROR)
+
+
+@pytest.fixture(scope="session")
+def missing_directive_snakefile(snakefile_dir):
+    return _write_snakefile(snakefile_dir, "missing_directive.smk", _SMK_MISSING_DIRECTIVE)
+
+
+@pytest.fixture(scope="session")
+def missing_inputs_snakefile(snakefile_dir):
+    return _write_snakefile(snakefile_dir, "missing_inputs.smk", _SMK_MISSING_INPUTS)
+
+
+@pytest.fixture(scope="session")
+def invalid_resources_snakefile(snakefile_dir):
+    return _write_snakefile(snakefile_dir, "invalid_resources.smk", _SMK_INVALID_RESOURCES)
+
+
+@pytest.fixture(scope="session")
+def negative_resources_snakefile(snakefile_dir):
+    return _write_snakefile(snakefile_dir, "negative_resources.smk", _SMK_NEGATIVE_RESOURCES)
+
+
+@pytest.fixture(scope="session")
+def simple_snakefile(snakefile_dir):
+    return _write_snakefile(snakefile_dir, "simple.smk", _SMK_SIMPLE)
+
+
+@pytest.fixture(scope="session")
+def failing_workflow_snakefile(snakefile_dir):
+    return _write_snakefile(snakefile_dir, "failing_workflow.smk", _SMK_FAILING_WORKFLOW)
+
+
+@pytest.fixture(scope="session")
+def partial_workflow_snakefile(snakefile_dir):
+    return _write_snakefile(snakefile_dir, "partial_workflow.smk", _SMK_PARTIAL_WORKFLOW)
+
+
+class TestCircularDependencies:
+    """Test circular dependency detection and error handling."""
+
+    @pytest.mark.parametrize(
+        "snakefile_fixture, stderr",
+        [
+            (
+                "circular_snakefile",
+                "Error: Circular dependency detected between rules A and B",
+            ),
+            (
+                "circular_complex_snakefile",
+                "Error: Circular dependency detected in workflow: A → B → C → A",
+            ),
+        ],
+        ids=["simple", "complex"],
+    )
+    def test_circular_dependency_detection(
+        self, snakefile_fixture, stderr, request, fake_snakemake
+    ):
+        """Test detection of A→B→A and A→B→C→A circular dependencies."""
+        snakefile = request.getfixturevalue(snakefile_fixture)
+        fake_snakemake(_dag_error(stderr))
+        with pytest.raises(ImportError) as exc_info:
+            snake_importer.to_workflow(snakefile, workdir=snakefile.parent)
+
+        assert "snakemake --dag" in str(exc_info.value)
+        assert "failed" in str(exc_info.value).lower()
+
+    def test_workflow_with_cycle_export_fails_gracefully(self, tmp_path):
         """Test that a workflow with manually created cycles fails export gracefully."""
         # Manually create a workflow with circular dependency
         wf = Workflow(name="circular_test")
@@ -165,125 +394,34 @@ class TestCircularDependencies:
         assert len(wf.edges) == 3
 
         # But DAG export should still work (HTCondor will handle the cycle)
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            dag_path = Path(tmp_dir) / "circular.dag"
-            dag_exporter.from_workflow(wf, dag_path, workdir=Path(tmp_dir))
+        dag_path = tmp_path / "circular.dag"
+        dag_exporter.from_workflow(wf, dag_path, workdir=tmp_path)
 
-            # Verify DAG was created with all dependencies
-            dag_content = dag_path.read_text()
-            assert "PARENT task_a CHILD task_b" in dag_content
-            assert "PARENT task_b CHILD task_c" in dag_content
-            assert "PARENT task_c CHILD task_a" in dag_content
+        # Verify DAG was created with all dependencies
+        dag_content = dag_path.read_text()
+        assert "PARENT task_a CHILD task_b" in dag_content
+        assert "PARENT task_b CHILD task_c" in dag_content
+        assert "PARENT task_c CHILD task_a" in dag_content
 
 
 class TestEmptyWorkflows:
     """Test empty workflow handling with helpful error messages."""
 
-    def test_empty_snakefile(self, tmp_path):
-        """Test handling of completely empty Snakefile."""
-        snakefile = tmp_path / "empty.smk"
-        snakefile.write_text("")
-
-        def _mock_run_empty(
-            cmd, capture_output=False, text=False, check=False, **kwargs
-        ):
-            m = MagicMock()
-            if "--dag" in cmd:
-                m.stdout = "digraph snakemake_dag {}"  # Empty DAG
-                m.stderr = ""
-                m.returncode = 0
-            elif "--dry-run" in cmd:
-                m.stdout = "Nothing to be done."
-                m.stderr = ""
-                m.returncode = 0
-            return m
-
-        with patch(
-            "wf2wf.importers.snakemake.shutil.which", lambda x: "/usr/bin/snakemake"
-        ):
-            with patch(
-                "wf2wf.importers.snakemake.subprocess.run", side_effect=_mock_run_empty
-            ):
-                with pytest.raises(ImportError) as exc_info:
-                    snake_importer.to_workflow(snakefile, workdir=tmp_path)
-
-                assert "No jobs found" in str(exc_info.value)
-
-    def test_snakefile_with_only_comments(self, tmp_path):
-        """Test handling of Snakefile with only comments."""
-        snakefile = tmp_path / "comments_only.smk"
-        snakefile.write_text(
-            textwrap.dedent("""
-            # This is a comment
-            # Another comment
-            # No actual rules here
-        """)
-        )
-
-        def _mock_run_comments_only(
-            cmd, capture_output=False, text=False, check=False, **kwargs
-        ):
-            m = MagicMock()
-            if "--dag" in cmd:
-                m.stdout = "digraph snakemake_dag {}"
-                m.stderr = ""
-                m.returncode = 0
-            elif "--dry-run" in cmd:
-                m.stdout = "Nothing to be done."
-                m.stderr = ""
-                m.returncode = 0
-            return m
-
-        with patch(
-            "wf2wf.importers.snakemake.shutil.which", lambda x: "/usr/bin/snakemake"
-        ):
-            with patch(
-                "wf2wf.importers.snakemake.subprocess.run",
-                side_effect=_mock_run_comments_only,
-            ):
-                with pytest.raises(ImportError) as exc_info:
-                    snake_importer.to_workflow(snakefile, workdir=tmp_path)
-
-                assert "No jobs found" in str(exc_info.value)
-
-    def test_snakefile_with_no_target_rules(self, tmp_path):
-        """Test handling of Snakefile with rules but no target rules."""
-        snakefile = tmp_path / "no_targets.smk"
-        snakefile.write_text(
-            textwrap.dedent("""
-            rule orphan_rule:
-                output: "orphan.txt"
-                shell: "echo 'orphan' > {output}"
-        """)
-        )
-
-        def _mock_run_no_targets(
-            cmd, capture_output=False, text=False, check=False, **kwargs
-        ):
-            m = MagicMock()
-            if "--dag" in cmd:
-                m.stdout = "digraph snakemake_dag {}"  # No target rules = empty DAG
-                m.stderr = ""
-                m.returncode = 0
-            elif "--dry-run" in cmd:
-                m.stdout = "Nothing to be done."
-                m.stderr = ""
-                m.returncode = 0
-            return m
-
-        with patch(
-            "wf2wf.importers.snakemake.shutil.which", lambda x: "/usr/bin/snakemake"
-        ):
-            with patch(
-                "wf2wf.importers.snakemake.subprocess.run",
-                side_effect=_mock_run_no_targets,
-            ):
-                with pytest.raises(ImportError) as exc_info:
-                    snake_importer.to_workflow(snakefile, workdir=tmp_path)
-
-                assert "No jobs found" in str(exc_info.value)
-
-    def test_empty_workflow_ir_export(self):
+    @pytest.mark.parametrize(
+        "snakefile_fixture",
+        ["empty_snakefile", "comments_only_snakefile", "no_targets_snakefile"],
+        ids=["empty", "only_comments", "no_target_rules"],
+    )
+    def test_snakefile_without_jobs(self, snakefile_fixture, request, fake_snakemake):
+        """Test that Snakefiles yielding an empty DAG report that no jobs were found."""
+        snakefile = request.getfixturevalue(snakefile_fixture)
+        fake_snakemake(_dag_output(_DAG_EMPTY, _DRYRUN_NOTHING))
+        with pytest.raises(ImportError) as exc_info:
+            snake_importer.to_workflow(snakefile, workdir=snakefile.parent)
+
+        assert "No jobs found" in str(exc_info.value)
+
+    def test_empty_workflow_ir_export(self, tmp_path):
         """Test that empty Workflow IR fails export gracefully."""
         wf = Workflow(name="empty_workflow")
         # No tasks added
@@ -291,488 +429,186 @@ class TestEmptyWorkflows:
         assert len(wf.tasks) == 0
         assert len(wf.edges) == 0
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            dag_path = Path(tmp_dir) / "empty.dag"
+        dag_path = tmp_path / "empty.dag"
 
-            # Export should work but produce minimal DAG
-            dag_exporter.from_workflow(wf, dag_path, workdir=Path(tmp_dir))
+        # Export should work but produce minimal DAG
+        dag_exporter.from_workflow(wf, dag_path, workdir=tmp_path)
 
-            dag_content = dag_path.read_text()
-            assert "# DAG file generated by wf2wf from workflow 'empty_workflow'" in dag_content
-            assert "JOB" not in dag_content  # No job definitions
-            assert "PARENT" not in dag_content  # No dependencies
+        dag_content = dag_path.read_text()
+        assert "# DAG file generated by wf2wf from workflow 'empty_workflow'" in dag_content
+        assert "JOB" not in dag_content  # No job definitions
+        assert "PARENT" not in dag_content  # No dependencies
 
 
 class TestMalformedSnakefiles:
     """Test handling of Snakefiles with syntax errors."""
 
-    def test_python_syntax_error(self, tmp_path):
+    def test_python_syntax_error(self, syntax_error_snakefile, fake_snakemake):
         """Test handling of Snakefile with Python syntax error."""
-        snakefile = tmp_path / "syntax_error.smk"
-        snakefile.write_text(
-            textwrap.dedent("""
-            rule all:
-                input: "result.txt"
-
-            rule process:
-                output: "result.txt"
-                shell: "echo 'result' > {output}"
-
-                This is not valid Python syntax!
-        """)
-        )
-
-        def _mock_run_syntax_error(
-            cmd, capture_output=False, text=False, check=False, **kwargs
-        ):
-            m = MagicMock()
-            if "--dag" in cmd:
-                m.stdout = ""
-                m.stderr = "SyntaxError: invalid syntax"
-                m.returncode = 1
-                raise CalledProcessError(1, cmd, output="", stderr=m.stderr)
-            return m
-
-        with patch(
-            "wf2wf.importers.snakemake.shutil.which", lambda x: "/usr/bin/snakemake"
-        ):
-            with patch(
-                "wf2wf.importers.snakemake.subprocess.run",
-                side_effect=_mock_run_syntax_error,
-            ):
-                with pytest.raises(ImportError) as exc_info:
-                    snake_importer.to_workflow(snakefile, workdir=tmp_path)
+        fake_snakemake(_dag_error("SyntaxError: invalid syntax"))
+        with pytest.raises(ImportError) as exc_info:
+            snake_importer.to_workflow(
+                syntax_error_snakefile, workdir=syntax_error_snakefile.parent
+            )
 
-                assert "failed" in str(exc_info.value).lower()
+        assert "failed" in str(exc_info.value).lower()
 
-    def test_missing_required_directive(self, tmp_path):
+    def test_missing_required_directive(self, missing_directive_snakefile, fake_snakemake):
         """Test handling of rule missing required directive."""
-        snakefile = tmp_path / "missing_directive.smk"
-        snakefile.write_text(
-            textwrap.dedent("""
-            rule all:
-                input: "result.txt"
-
-            rule incomplete:
-                # Missing output directive
-                shell: "echo 'incomplete' > result.txt"
-        """)
+        fake_snakemake(
+            _dag_error("RuleException: Rule 'incomplete' has no output files")
         )
+        with pytest.raises(ImportError) as exc_info:
+            snake_importer.to_workflow(
+                missing_directive_snakefile, workdir=missing_directive_snakefile.parent
+            )
 
-        def _mock_run_missing_directive(
-            cmd, capture_output=False, text=False, check=False, **kwargs
-        ):
-            m = MagicMock()
-            if "--dag" in cmd:
-                m.stdout = ""
-                m.stderr = "RuleException: Rule 'incomplete' has no output files"
-                m.returncode = 1
-                raise CalledProcessError(1, cmd, output="", stderr=m.stderr)
-            return m
-
-        with patch(
-            "wf2wf.importers.snakemake.shutil.which", lambda x: "/usr/bin/snakemake"
-        ):
-            with patch(
-                "wf2wf.importers.snakemake.subprocess.run",
-                side_effect=_mock_run_missing_directive,
-            ):
-                with pytest.raises(ImportError) as exc_info:
-                    snake_importer.to_workflow(snakefile, workdir=tmp_path)
-
-                assert "failed" in str(exc_info.value).lower()
+        assert "failed" in str(exc_info.value).lower()
 
 
 class TestMissingInputFiles:
     """Test handling of missing input files and dependencies."""
 
-    def test_missing_input_files_strict_mode(self, tmp_path):
+    def test_missing_input_files_strict_mode(self, missing_inputs_snakefile, fake_snakemake):
         """Test handling when Snakemake fails due to missing input files."""
-        snakefile = tmp_path / "missing_inputs.smk"
-        snakefile.write_text(
-            textwrap.dedent("""
-            rule all:
-                input: "final.txt"
-
-            rule process:
-                input: "missing_file.txt"  # This file doesn't exist
-                output: "final.txt"
-                shell: "cat {input} > {output}"
-        """)
+        fake_snakemake(
+            _dag_error("MissingInputException: Missing input files for rule process: missing_file.txt")
         )
+        with pytest.raises(ImportError) as exc_info:
+            snake_importer.to_workflow(
+                missing_inputs_snakefile, workdir=missing_inputs_snakefile.parent
+            )
 
-        def _mock_run_missing_inputs(
-            cmd, capture_output=False, text=False, check=False, **kwargs
-        ):
-            m = MagicMock()
-            if "--dag" in cmd:
-                m.stdout = ""
-                m.stderr = "MissingInputException: Missing input files for rule process: missing_file.txt"
-                m.returncode = 1
-                raise CalledProcessError(1, cmd, output="", stderr=m.stderr)
-            return m
-
-        with patch(
-            "wf2wf.importers.snakemake.shutil.which", lambda x: "/usr/bin/snakemake"
-        ):
-            with patch(
-                "wf2wf.importers.snakemake.subprocess.run",
-                side_effect=_mock_run_missing_inputs,
-            ):
-                with pytest.raises(ImportError) as exc_info:
-                    snake_importer.to_workflow(snakefile, workdir=tmp_path)
-
-                assert "failed" in str(exc_info.value).lower()
+        assert "failed" in str(exc_info.value).lower()
 
-    def test_missing_input_files_forceall_mode(self, tmp_path):
+    def test_missing_input_files_forceall_mode(self, missing_inputs_snakefile, fake_snakemake):
         """Test that --forceall allows processing despite missing inputs."""
-        snakefile = tmp_path / "missing_inputs_force.smk"
-        snakefile.write_text(
-            textwrap.dedent("""
-            rule all:
-                input: "final.txt"
-
-            rule process:
-                input: "missing_file.txt"
-                output: "final.txt"
-                shell: "cat {input} > {output}"
-        """)
+        fake_snakemake(_dag_output(_DAG_PROCESS_ALL, _DRYRUN_MISSING_INPUT))
+        # This should succeed because we use --forceall
+        wf = snake_importer.to_workflow(
+            missing_inputs_snakefile, workdir=missing_inputs_snakefile.parent
         )
 
-        def _mock_run_forceall(
-            cmd, capture_output=False, text=False, check=False, **kwargs
-        ):
-            m = MagicMock()
-            if "--dag" in cmd and "--forceall" in cmd:
-                # With --forceall, Snakemake should generate DAG even with missing inputs
-                m.stdout = """digraph snakemake_dag {
-0 [label="rule process"];
-1 [label="rule all"];
-0 -> 1;
-}"""
-                m.stderr = ""
-                m.returncode = 0
-            elif "--dry-run" in cmd and "--forceall" in cmd:
-                m.stdout = """Building DAG of jobs...
-rule process:
-    input: missing_file.txt
-    output: final.txt
-    jobid: 0
-    reason: Missing output files: final.txt
-    resources: tmpdir=<TBD>
-rule all:
-    input: final.txt
-    jobid: 1
-    reason: Input files updated by another job: final.txt
-    resources: tmpdir=<TBD>
-Nothing to be done."""
-                m.stderr = ""
-                m.returncode = 0
-            return m
-
-        with patch(
-            "wf2wf.importers.snakemake.shutil.which", lambda x: "/usr/bin/snakemake"
-        ):
-            with patch(
-                "wf2wf.importers.snakemake.subprocess.run",
-                side_effect=_mock_run_forceall,
-            ):
-                # This should succeed because we use --forceall
-                wf = snake_importer.to_workflow(snakefile, workdir=tmp_path)
+        assert len(wf.tasks) == 1  # Only the process rule (all rule has no shell command)
 
-                assert len(wf.tasks) == 1  # Only the process rule (all rule has no shell command)
+        # Find the process task
+        process_task = None
+        for task in wf.tasks.values():
+            if "process" in task.id:
+                process_task = task
+                break
 
-                # Find the process task
-                process_task = None
-                for task in wf.tasks.values():
-                    if "process" in task.id:
-                        process_task = task
-                        break
-
-                assert process_task is not None
-                # The key test is that it doesn't fail - the workflow was created
-                assert wf.name is not None
+        assert process_task is not None
+        # The key test is that it doesn't fail - the workflow was created
+        assert wf.name is not None
 
 
 class TestInvalidResourceSpecifications:
     """Test handling of invalid resource specifications."""
 
-    def test_invalid_resource_syntax(self, tmp_path):
+    def test_invalid_resource_syntax(self, invalid_resources_snakefile, fake_snakemake):
         """Test handling of invalid resource syntax in Snakefile."""
-        snakefile = tmp_path / "invalid_resources.smk"
-        snakefile.write_text(
-            textwrap.dedent("""
-            rule all:
-                input: "result.txt"
-
-            rule process:
-                output: "result.txt"
-                resources:
-                    mem_mb = "not_a_number"  # Invalid syntax
-                shell: "echo 'result' > {output}"
-        """)
-        )
+        fake_snakemake(_dag_error("WorkflowError: Failed to parse resources"))
+        with pytest.raises(ImportError) as exc_info:
+            snake_importer.to_workflow(
+                invalid_resources_snakefile, workdir=invalid_resources_snakefile.parent
+            )
 
-        def _mock_run_invalid_resources(
-            cmd, capture_output=False, text=False, check=False, **kwargs
-        ):
-            m = MagicMock()
-            if "--dag" in cmd:
-                m.stdout = ""
-                m.stderr = "WorkflowError: Failed to parse resources"
-                m.returncode = 1
-                raise CalledProcessError(1, cmd, output="", stderr=m.stderr)
-            return m
-
-        with patch(
-            "wf2wf.importers.snakemake.shutil.which", lambda x: "/usr/bin/snakemake"
-        ):
-            with patch(
-                "wf2wf.importers.snakemake.subprocess.run",
-                side_effect=_mock_run_invalid_resources,
-            ):
-                with pytest.raises(ImportError) as exc_info:
-                    snake_importer.to_workflow(snakefile, workdir=tmp_path)
-
-                assert "failed" in str(exc_info.value).lower()
+        assert "failed" in str(exc_info.value).lower()
 
     @pytest.mark.xfail(reason="Resource validation not yet implemented")
-    def test_negative_resource_values(self, tmp_path):
+    def test_negative_resource_values(self, negative_resources_snakefile, fake_snakemake):
         """Test handling of negative resource values."""
-        snakefile = tmp_path / "negative_resources.smk"
-        snakefile.write_text(
-            textwrap.dedent("""
-            rule all:
-                input: "result.txt"
-
-            rule process:
-                output: "result.txt"
-                resources:
-                    mem_mb=-1000,
-                    cpus=-2
-                shell: "echo 'result' > {output}"
-        """)
+        fake_snakemake(_dag_output(_DAG_PROCESS_ALL, _DRYRUN_NEGATIVE_RESOURCES))
+        # Should parse but with negative values preserved
+        wf = snake_importer.to_workflow(
+            negative_resources_snakefile, workdir=negative_resources_snakefile.parent
         )
 
-        def _mock_run_negative_resources(
-            cmd, capture_output=False, text=False, check=False, **kwargs
-        ):
-            m = MagicMock()
-            if "--dag" in cmd:
-                m.stdout = """digraph snakemake_dag {
-0 [label="rule process"];
-1 [label="rule all"];
-0 -> 1;
-}"""
-                m.stderr = ""
-                m.returncode = 0
-            elif "--dry-run" in cmd:
-                m.stdout = """Building DAG of jobs...
-rule process:
-    output: result.txt
-    jobid: 0
-    resources: mem_mb=-1000, cpus=-2, tmpdir=<TBD>
-rule all:
-    input: result.txt
-    jobid: 1
-    resources: tmpdir=<TBD>
-Nothing to be done."""
-                m.stderr = ""
-                m.returncode = 0
-            return m
+        process_task = None
+        for task in wf.tasks.values():
+            if "process" in task.id:
+                process_task = task
+                break
 
-        with patch(
-            "wf2wf.importers.snakemake.shutil.which", lambda x: "/usr/bin/snakemake"
-        ):
-            with patch(
-                "wf2wf.importers.snakemake.subprocess.run",
-                side_effect=_mock_run_negative_resources,
-            ):
-                # Should parse but with negative values preserved
-                wf = snake_importer.to_workflow(snakefile, workdir=tmp_path)
-
-                process_task = None
-                for task in wf.tasks.values():
-                    if "process" in task.id:
-                        process_task = task
-                        break
-
-                assert process_task is not None
-                # Check that negative values are handled gracefully with sensible defaults
-                mem_value = process_task.mem_mb.get_value_for("shared_filesystem")
-                cpu_value = process_task.cpu.get_value_for("shared_filesystem")
-                
-                # Should have reasonable values (not negative)
-                assert mem_value > 0
-                assert cpu_value > 0
+        assert process_task is not None
+        # Check that negative values are handled gracefully with sensible defaults
+        mem_value = process_task.mem_mb.get_value_for("shared_filesystem")
+        cpu_value = process_task.cpu.get_value_for("shared_filesystem")
+        
+        # Should have reasonable values (not negative)
+        assert mem_value > 0
+        assert cpu_value > 0
 
 
 class TestSnakemakeExecutableHandling:
     """Test handling of Snakemake executable availability and errors."""
 
-    def test_snakemake_not_found(self, tmp_path):
+    def test_snakemake_not_found(self, simple_snakefile, monkeypatch):
         """Test handling when Snakemake executable is not found."""
-        snakefile = tmp_path / "simple.smk"
-        snakefile.write_text(
-            textwrap.dedent("""
-            rule all:
-                input: "result.txt"
-
-            rule process:
-                output: "result.txt"
-                shell: "echo 'result' > {output}"
-        """)
-        )
-
-        with patch("wf2wf.importers.snakemake.shutil.which", lambda x: None):
-            with pytest.raises(ImportError) as exc_info:
-                snake_importer.to_workflow(snakefile, workdir=tmp_path)
+        monkeypatch.setattr("wf2wf.importers.snakemake.shutil.which", lambda x: None)
+        with pytest.raises(ImportError) as exc_info:
+            snake_importer.to_workflow(
+                simple_snakefile, workdir=simple_snakefile.parent
+            )
 
-            assert "snakemake" in str(exc_info.value).lower()
-            assert "not found" in str(exc_info.value).lower()
+        assert "snakemake" in str(exc_info.value).lower()
+        assert "not found" in str(exc_info.value).lower()
 
-    def test_snakemake_permission_denied(self, tmp_path):
+    def test_snakemake_permission_denied(self, simple_snakefile, fake_snakemake):
         """Test handling when Snakemake executable exists but can't be executed."""
-        snakefile = tmp_path / "simple.smk"
-        snakefile.write_text(
-            textwrap.dedent("""
-            rule all:
-                input: "result.txt"
-
-            rule process:
-                output: "result.txt"
-                shell: "echo 'result' > {output}"
-        """)
-        )
 
         def _mock_run_permission_denied(
             cmd, capture_output=False, text=False, check=False, **kwargs
         ):
             raise PermissionError("Permission denied")
 
-        with patch(
-            "wf2wf.importers.snakemake.shutil.which", lambda x: "/usr/bin/snakemake"
-        ):
-            with patch(
-                "wf2wf.importers.snakemake.subprocess.run",
-                side_effect=_mock_run_permission_denied,
-            ):
-                with pytest.raises(ImportError) as exc_info:
-                    snake_importer.to_workflow(snakefile, workdir=tmp_path)
-                
-                assert "Permission denied" in str(exc_info.value)
+        fake_snakemake(_mock_run_permission_denied)
+        with pytest.raises(ImportError) as exc_info:
+            snake_importer.to_workflow(
+                simple_snakefile, workdir=simple_snakefile.parent
+            )
+        
+        assert "Permission denied" in str(exc_info.value)
 
 
 class TestIntegrationErrorHandling:
     """Integration tests for error handling across the full pipeline."""
 
-    def test_error_propagation_through_pipeline(self, tmp_path):
+    def test_error_propagation_through_pipeline(self, failing_workflow_snakefile, fake_snakemake):
         """Test that errors propagate correctly through import→export pipeline."""
-        # Create a workflow that will fail during import
-        snakefile = tmp_path / "failing_workflow.smk"
-        snakefile.write_text(
-            textwrap.dedent("""
-            rule A:
-                input: "B.txt"
-                output: "A.txt"
-                shell: "cat {input} > {output}"
-
-            rule B:
-                input: "A.txt"  # Circular dependency
-                output: "B.txt"
-                shell: "cat {input} > {output}"
-
-            rule all:
-                input: "A.txt"
-        """)
-        )
-
-        def _mock_run_circular_integration(
-            cmd, capture_output=False, text=False, check=False, **kwargs
-        ):
-            m = MagicMock()
-            if "--dag" in cmd:
-                m.stdout = ""
-                m.stderr = "Error: Circular dependency detected"
-                m.returncode = 1
-                raise CalledProcessError(1, cmd, output="", stderr=m.stderr)
-            return m
-
-        with patch(
-            "wf2wf.importers.snakemake.shutil.which", lambda x: "/usr/bin/snakemake"
-        ):
-            with patch(
-                "wf2wf.importers.snakemake.subprocess.run",
-                side_effect=_mock_run_circular_integration,
-            ):
-                # Import should fail
-                with pytest.raises(ImportError):
-                    snake_importer.to_workflow(snakefile, workdir=tmp_path)
-
-    def test_partial_workflow_recovery(self, tmp_path):
+        fake_snakemake(_dag_error("Error: Circular dependency detected"))
+        # Import should fail
+        with pytest.raises(ImportError):
+            snake_importer.to_workflow(
+                failing_workflow_snakefile, workdir=failing_workflow_snakefile.parent
+            )
+
+    def test_partial_workflow_recovery(self, partial_workflow_snakefile, tmp_path, fake_snakemake):
         """Test that partially valid workflows can still be processed."""
-        snakefile = tmp_path / "partial_workflow.smk"
-        snakefile.write_text(
-            textwrap.dedent("""
-            rule all:
-                input: "good.txt"
-
-            rule good_rule:
-                output: "good.txt"
-                shell: "echo 'good' > {output}"
-        """)
+        fake_snakemake(
+            _dag_output(
+                _DAG_GOOD_RULE_ALL, _DRYRUN_GOOD_RULE, stderr=_STDERR_RULE_WARNING
+            )
+        )
+        # Should succeed despite warnings
+        wf = snake_importer.to_workflow(
+            partial_workflow_snakefile, workdir=partial_workflow_snakefile.parent
         )
 
-        def _mock_run_partial_success(
-            cmd, capture_output=False, text=False, check=False, **kwargs
-        ):
-            m = MagicMock()
-            if "--dag" in cmd:
-                m.stdout = """digraph snakemake_dag {
-0 [label="rule good_rule"];
-1 [label="rule all"];
-0 -> 1;
-}"""
-                m.stderr = "Warning: Some rules may have issues"
-                m.returncode = 0
-            elif "--dry-run" in cmd:
-                m.stdout = """Building DAG of jobs...
-rule good_rule:
-    output: good.txt
-    jobid: 0
-    resources: tmpdir=<TBD>
-rule all:
-    input: good.txt
-    jobid: 1
-    resources: tmpdir=<TBD>
-Nothing to be done."""
-                m.stderr = "Warning: Some rules may have issues"
-                m.returncode = 0
-            return m
+        assert len(wf.tasks) == 1  # Only the good_rule (all rule has no shell command)
 
-        with patch(
-            "wf2wf.importers.snakemake.shutil.which", lambda x: "/usr/bin/snakemake"
-        ):
-            with patch(
-                "wf2wf.importers.snakemake.subprocess.run",
-                side_effect=_mock_run_partial_success,
-            ):
-                # Should succeed despite warnings
-                wf = snake_importer.to_workflow(snakefile, workdir=tmp_path)
-
-                assert len(wf.tasks) == 1  # Only the good_rule (all rule has no shell command)
-
-                # Export should also succeed
-                dag_path = tmp_path / "partial.dag"
-                dag_exporter.from_workflow(wf, dag_path, workdir=tmp_path)
-
-                dag_content = dag_path.read_text()
-                # Check for the actual job names generated by the exporter
-                assert (
-                    "JOB rule_good_rule_0" in dag_content
-                    or "JOB good_rule" in dag_content
-                    or "good_rule" in dag_content
-                )
+        # Export should also succeed
+        dag_path = tmp_path / "partial.dag"
+        dag_exporter.from_workflow(wf, dag_path, workdir=tmp_path)
+
+        dag_content = dag_path.read_text()
+        # Check for the actual job names generated by the exporter
+        assert (
+            "JOB rule_good_rule_0" in dag_content
+            or "JOB good_rule" in dag_content
+            or "good_rule" in dag_content
+        )
 
 
 if __name__ == "__main__":
@@ -255,8 +255,7 @@ workflow hello_workflow {
     finally:
         # Clean up
         for file in [input_wdl, output_wdl]:
-            if file.exists():
-                file.unlink()
+            file.unlink(missing_ok=True)
 
 
 def test_galaxy_round_trip_basic():
@@ -347,5 +346,4 @@ def test_galaxy_round_trip_basic():
     finally:
         # Clean up
         for file in [input_galaxy, output_galaxy]:
-            if file.exists():
-                file.unlink()
+            file.unlink(missing_ok=True)
@@ -1,21 +1,8 @@
 """Tests for performance and edge case scenarios."""
 
-import sys
-import pathlib
-import importlib.util
 import pytest
 import random
 
-# Allow running tests without installing package
-proj_root = pathlib.Path(__file__).resolve().parents[1]
-
-if "wf2wf" not in sys.modules:
-    spec = importlib.util.spec_from_file_location("wf2wf", proj_root / "__init__.py")
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["wf2wf"] = module  # type: ignore[assignment]
-    assert spec and spec.loader
-    spec.loader.exec_module(module)  # type: ignore[arg-type]
-
 from wf2wf.core import Workflow, Task
 from wf2wf.exporters import dagman as dag_exporter
 
@@ -32,9 +19,10 @@ class TestLargeWorkflowHandling:
 
         # Create 100 tasks
         num_tasks = 100
+        ids = [f"task_{i:03d}" for i in range(num_tasks)]
         for i in range(num_tasks):
             task = Task(
-                id=f"task_{i:03d}",
+                id=ids[i],
                 command=f"echo 'Processing task {i}' > output_{i:03d}.txt",
             )
             task.cpu.set_for_environment(random.randint(1, 8), "shared_filesystem")
@@ -43,7 +31,7 @@ class TestLargeWorkflowHandling:
 
         # Create a chain of dependencies
         for i in range(num_tasks - 1):
-            wf.add_edge(f"task_{i:03d}", f"task_{i+1:03d}")
+            wf.add_edge(ids[i], ids[i + 1])
 
         assert len(wf.tasks) == num_tasks
         assert len(wf.edges) == num_tasks - 1
@@ -167,6 +155,12 @@ class TestEdgeCaseHandling:
         with pytest.raises(ValueError, match="Duplicate task id"):
             wf.add_task(task2)
 
+        # Re-adding the same task object is also a duplicate, and the
+        # original registration is left untouched
+        with pytest.raises(ValueError, match="Duplicate task id"):
+            wf.add_task(task1)
+        assert wf.tasks["duplicate_id"] is task1
+
     def test_self_dependency_prevention(self):
         """Test that self-dependencies are handled appropriately."""
         wf = Workflow(name="self_dep_test")
@@ -206,6 +200,13 @@ class TestEdgeCaseHandling:
         with pytest.raises((KeyError, ValueError)):
             wf.add_edge("nonexistent_parent", "existing_task")
 
+        # Bulk insertion validates every endpoint before adding anything
+        with pytest.raises(KeyError, match="nonexistent_task"):
+            wf.add_edges_from(
+                [("existing_task", "existing_task"), ("existing_task", "nonexistent_task")]
+            )
+        assert wf.edges == []
+
     def test_workflow_json_roundtrip_with_complex_data(self):
         """Test JSON serialization/deserialization with complex data."""
         wf = Workflow(name="complex_json_test")
@@ -285,17 +286,18 @@ class TestDAGManExportPerformance:
 
         # Create 50 tasks (reasonable size for performance test)
         num_tasks = 50
+        ids = [f"task_{i:03d}" for i in range(num_tasks)]
         for i in range(num_tasks):
-            task = Task(id=f"task_{i:03d}")
+            task = Task(id=ids[i])
             task.command.set_for_environment(f"python process_chunk_{i}.py", "distributed_computing")
             task.cpu.set_for_environment(random.randint(1, 4), "distributed_computing")
             task.mem_mb.set_for_environment(random.randint(2048, 8192), "distributed_computing")
             wf.add_task(task)
 
         # Create some dependencies (not fully connected to avoid too much complexity)
-        for i in range(0, num_tasks - 1, 5):  # Every 5th task depends on previous
-            if i > 0:
-                wf.add_edge(f"task_{i-5:03d}", f"task_{i:03d}")
+        wf.add_edges_from(  # Every 5th task depends on previous
+            (ids[i - 5], ids[i]) for i in range(5, num_tasks - 1, 5)
+        )
 
         # Export to DAG
         dag_path = tmp_path / "large_export.dag"
@@ -306,8 +308,8 @@ class TestDAGManExportPerformance:
         dag_content = dag_path.read_text()
 
         # Verify all tasks are present
-        for i in range(num_tasks):
-            assert f"JOB task_{i:03d}" in dag_content
+        for task_id in ids:
+            assert f"JOB {task_id}" in dag_content
 
         # Verify scripts directory was created
         scripts_dir = tmp_path / "scripts"
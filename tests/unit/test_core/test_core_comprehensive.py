@@ -10,24 +10,17 @@ This module consolidates tests for:
 - Resource provenance tracking
 """
 
+import copy
+import json
+import math
+import pickle
 import sys
-import pathlib
-import importlib.util
 import textwrap
 
-# Allow running tests without installing package
-proj_root = pathlib.Path(__file__).resolve().parents[2]
-
-if "wf2wf" not in sys.modules:
-    spec = importlib.util.spec_from_file_location("wf2wf", proj_root / "__init__.py")
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["wf2wf"] = module  # type: ignore[assignment]
-    assert spec and spec.loader
-    spec.loader.exec_module(module)  # type: ignore[arg-type]
-
 import pytest
+from wf2wf import core
 from wf2wf.core import (
-    Workflow, Task, EnvironmentSpecificValue, ParameterSpec, TypeSpec, RequirementSpec,
+    Workflow, Task, Edge, EnvironmentSpecificValue, ParameterSpec, TypeSpec, RequirementSpec,
     CheckpointSpec, LoggingSpec, SecuritySpec, NetworkingSpec
 )
 from wf2wf.exporters import dagman as dag_exporter
@@ -604,6 +597,173 @@ class TestWorkflowEnvironmentSpecific:
         assert distributed_config["tasks"]["test_task"]["cpu"] == 8
         assert distributed_config["tasks"]["test_task"]["mem_mb"] == 8192
 
+    def test_workflow_edge_pairs(self):
+        """Test edge_pairs reflects the current edge list."""
+        workflow = Workflow(name="edge_workflow")
+        for task_id in ("A", "B", "C"):
+            workflow.add_task(Task(id=task_id))
+        workflow.add_edge("A", "B")
+        workflow.add_edge("B", "C")
+
+        assert workflow.edge_pairs == frozenset({("A", "B"), ("B", "C")})
+
+        workflow.add_edge("A", "C")
+        assert ("A", "C") in workflow.edge_pairs
+
+    def test_workflow_add_tasks_from(self):
+        """Test bulk task insertion keeps order and rejects duplicates atomically."""
+        workflow = Workflow(name="bulk_workflow")
+        workflow.add_tasks_from(Task(id=f"task_{i}") for i in range(3))
+        assert list(workflow.tasks) == ["task_0", "task_1", "task_2"]
+
+        for batch in ([Task(id="task_3"), Task(id="task_0")], [Task(id="task_3"), Task(id="task_3")]):
+            with pytest.raises(ValueError, match="Duplicate task id"):
+                workflow.add_tasks_from(batch)
+            assert list(workflow.tasks) == ["task_0", "task_1", "task_2"]
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_workflow_to_json_bytes(self, monkeypatch, use_orjson):
+        """Test to_json_bytes matches to_json with and without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(core, "_orjson", None)
+
+        workflow = Workflow(name="bytes_workflow")
+        workflow.add_task(Task(id="A", cpu=EnvironmentSpecificValue(2, ["shared_filesystem"])))
+        workflow.add_task(Task(id="B"))
+        workflow.add_edge("A", "B")
+
+        data = workflow.to_json_bytes()
+        assert isinstance(data, bytes)
+        assert json.loads(data) == json.loads(workflow.to_json())
+
+    @pytest.mark.parametrize("indent", [2, 4])
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_workflow_json_non_finite_and_big_int(self, monkeypatch, use_orjson, indent):
+        """Test NaN, ±Infinity and >64-bit integers survive to_json/from_json."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(core, "_orjson", None)
+
+        workflow = Workflow(name="edge_values", doc="naïve")
+        workflow.extra = {
+            "nan": float("nan"),
+            "inf": float("inf"),
+            "ninf": float("-inf"),
+            "big": 2**70,
+        }
+
+        text = workflow.to_json(indent=indent)
+        assert text == json.dumps(
+            workflow.to_dict(),
+            indent=indent,
+            cls=core.WF2WFJSONEncoder,
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+
+        loaded = Workflow.from_json(text)
+        assert math.isnan(loaded.extra["nan"])
+        assert loaded.extra["inf"] == float("inf")
+        assert loaded.extra["ninf"] == float("-inf")
+        assert loaded.extra["big"] == 2**70
+        assert loaded.doc == "naïve"
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_workflow_save_and_load_json(self, tmp_path, monkeypatch, use_orjson):
+        """Test save_json writes the same document with and without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(core, "_orjson", None)
+
+        workflow = Workflow(name="saved_workflow", doc="naïve résumé")
+        workflow.add_task(Task(id="A", cpu=EnvironmentSpecificValue(2, ["shared_filesystem"])))
+        workflow.add_task(Task(id="B"))
+        workflow.add_edge("A", "B")
+
+        path = tmp_path / "nested" / "workflow.json"
+        workflow.save_json(path)
+
+        assert json.loads(path.read_bytes()) == json.loads(workflow.to_json())
+        loaded = Workflow.load_json(path)
+        assert loaded.doc == "naïve résumé"
+        assert loaded.edge_pairs == {("A", "B")}
+        assert loaded.tasks["A"].cpu.get_value_for("shared_filesystem") == 2
+
+    @pytest.mark.parametrize("indent", [2, 4])
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_workflow_save_and_load_json_non_finite(
+        self, tmp_path, monkeypatch, use_orjson, indent
+    ):
+        """Test load_json reads back every document save_json can write."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(core, "_orjson", None)
+
+        workflow = Workflow(name="saved_edge_values")
+        workflow.extra = {"nan": float("nan"), "inf": float("inf"), "big": 2**70}
+
+        path = tmp_path / "workflow.json"
+        workflow.save_json(path, indent=indent)
+        assert path.read_text(encoding="utf-8") == workflow.to_json(indent=indent)
+
+        monkeypatch.undo()  # read back with orjson when it is installed
+        loaded = Workflow.load_json(path)
+        assert math.isnan(loaded.extra["nan"])
+        assert loaded.extra["inf"] == float("inf")
+        assert loaded.extra["big"] == 2**70
+
+    def test_workflow_msgpack_round_trip(self):
+        """Test MessagePack carries the same document as JSON."""
+        msgpack = pytest.importorskip("msgpack")
+
+        workflow = Workflow(name="packed_workflow", doc="naïve résumé")
+        workflow.add_task(Task(id="A", cpu=EnvironmentSpecificValue(2, ["shared_filesystem"])))
+        workflow.add_task(Task(id="B"))
+        workflow.add_edge("A", "B")
+
+        data = workflow.to_msgpack()
+        assert msgpack.unpackb(data) == json.loads(workflow.to_json())
+
+        restored = Workflow.from_msgpack(data)
+        assert restored.doc == "naïve résumé"
+        assert restored.edge_pairs == {("A", "B")}
+        assert restored.tasks["A"].cpu.get_value_for("shared_filesystem") == 2
+
+    def test_task_snapshot(self):
+        """Test snapshot returns only values explicitly set for an environment."""
+        task = Task(id="snap", cpu=EnvironmentSpecificValue(8, ["shared_filesystem"]))
+        task.mem_mb.set_for_environment(2048, "shared_filesystem")
+        task.container.set_for_environment("python:3.11", "cloud_native")
+
+        # Constructor defaults (e.g. disk_mb) are not environment-specific
+        assert task.snapshot("shared_filesystem") == {"cpu": 8, "mem_mb": 2048}
+        assert task.snapshot("cloud_native") == {"container": "python:3.11"}
+        assert task.snapshot("shared_filesystem", ["cpu", "container", "missing"]) == {"cpu": 8}
+
+    def test_environment_names_and_task_ids_are_interned(self):
+        """Test names built at runtime are stored as their interned strings."""
+        env_name = "".join(["shared_", "filesystem"])
+        task_id = "".join(["task_", "a"])
+
+        value = EnvironmentSpecificValue(4, [env_name])
+        assert value.values[0]["environments"][0] is sys.intern(env_name)
+
+        workflow = Workflow(name="interned")
+        workflow.add_task(Task(id=task_id))
+        assert next(iter(workflow.tasks)) is sys.intern(task_id)
+
+        workflow.add_task(Task(id="task_b"))
+        workflow.add_edge("".join(["task_", "a"]), "task_b")
+        workflow.add_edges_from([("".join(["task_", "b"]), task_id)])
+        for edge in workflow.edges:
+            assert edge.parent is workflow.tasks[edge.parent].id
+            assert edge.child is workflow.tasks[edge.child].id
+
 
 class TestExpressionEvaluation:
     """Test expression evaluation functionality."""
@@ -798,4 +958,18 @@ class TestSerialization:
         
         # Verify deserialization
         assert workflow2.tasks["test_task"].cpu.get_value_for("shared_filesystem") == 4
-        assert workflow2.tasks["test_task"].cpu.get_value_for("distributed_computing") == 8 
\ No newline at end of file
+        assert workflow2.tasks["test_task"].cpu.get_value_for("distributed_computing") == 8 
+
+    def test_slotted_values_copy_and_pickle(self):
+        """Slotted EnvironmentSpecificValue and Edge still copy and pickle."""
+        value = EnvironmentSpecificValue(4, ["shared_filesystem"])
+        edge = Edge(parent="a", child="b")
+
+        if sys.version_info >= (3, 10):
+            assert not hasattr(value, "__dict__")
+            assert not hasattr(edge, "__dict__")
+
+        for clone in (copy.deepcopy(value), pickle.loads(pickle.dumps(value))):
+            assert clone == value
+            assert clone.values is not value.values
+        assert pickle.loads(pickle.dumps(edge)) == edge
@@ -7,21 +7,8 @@ Comprehensive tests for core wf2wf features:
 """
 
 import os
-import sys
-import pathlib
-import importlib.util
 import textwrap
 
-# Allow running tests without installing package
-proj_root = pathlib.Path(__file__).resolve().parents[1]
-
-if "wf2wf" not in sys.modules:
-    spec = importlib.util.spec_from_file_location("wf2wf", proj_root / "__init__.py")
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["wf2wf"] = module  # type: ignore[assignment]
-    assert spec and spec.loader
-    spec.loader.exec_module(module)  # type: ignore[arg-type]
-
 import pytest
 from wf2wf.core import Workflow, Task
 from wf2wf.exporters import dagman as dag_exporter
@@ -1,27 +1,12 @@
 """Test round-trip serialization of workflows."""
 
 import json
-import sys
-import importlib.util
-from pathlib import Path
 
 import pytest
 
 from wf2wf.core import Task, Workflow, ParameterSpec, EnvironmentSpecificValue
 from wf2wf.exporters import cwl as cwl_exporter
 from wf2wf.importers import cwl as cwl_importer
-
-proj_root = Path(__file__).resolve().parents[1]
-
-# Ensure the *package* version of wf2wf is imported, not the CLI module.
-if "wf2wf" not in sys.modules:
-    init_py = proj_root / "__init__.py"
-    spec = importlib.util.spec_from_file_location("wf2wf", init_py)
-    wf2wf_pkg = importlib.util.module_from_spec(spec)
-    sys.modules["wf2wf"] = wf2wf_pkg  # type: ignore[assignment]
-    assert spec and spec.loader  # for mypy
-    spec.loader.exec_module(wf2wf_pkg)  # type: ignore[arg-type]
-
 from wf2wf.validate import validate_workflow
 
 
@@ -6,24 +6,11 @@ across multiple test files to improve organization and reduce duplication.
 """
 
 import json
-import sys
-import pathlib
-import importlib.util
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-# Allow running tests without installing package
-proj_root = pathlib.Path(__file__).resolve().parents[3]
-
-if "wf2wf" not in sys.modules:
-    spec = importlib.util.spec_from_file_location("wf2wf", proj_root / "__init__.py")
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["wf2wf"] = module  # type: ignore[assignment]
-    assert spec and spec.loader
-    spec.loader.exec_module(module)  # type: ignore[arg-type]
-
 from wf2wf.core import (
     Workflow, Task, EnvironmentSpecificValue,
     CheckpointSpec, LoggingSpec, SecuritySpec, NetworkingSpec,
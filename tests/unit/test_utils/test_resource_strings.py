@@ -0,0 +1,59 @@
+"""Test the shared memory/disk/time string parsers used by the importers."""
+
+import pytest
+
+from wf2wf.importers import utils
+from wf2wf.importers.utils import (
+    parse_disk_string,
+    parse_memory_string,
+    parse_time_string,
+)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("8G", 8192),
+        ("4.GB", 4096),
+        (" 512 MB ", 512),
+        ("2tb", 2097152),
+        ("16", 16),
+        ("", None),
+        (None, None),
+        ("lots", None),
+    ],
+)
+def test_parse_memory_string(value, expected):
+    assert parse_memory_string(value) == expected
+
+
+def test_parse_disk_string_matches_memory():
+    assert parse_disk_string("100.GB") == 102400
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2h", 7200),
+        ("30m", 1800),
+        ("1d", 86400),
+        ("3600", 3600),
+        (" 4H ", 14400),
+        ("", None),
+        ("soon", None),
+    ],
+)
+def test_parse_time_string(value, expected):
+    assert parse_time_string(value) == expected
+
+
+def test_unit_strings_are_cached_after_normalization():
+    """Spellings that normalize to the same string share one cache entry."""
+    utils._parse_memory_mb.cache_clear()
+    utils._parse_time_seconds.cache_clear()
+
+    assert parse_memory_string("8.GB") == parse_memory_string(" 8.gb") == 8192
+    assert parse_time_string("4h") == parse_time_string("4H ") == 14400
+
+    assert utils._parse_memory_mb.cache_info().hits == 1
+    assert utils._parse_time_seconds.cache_info().hits == 1
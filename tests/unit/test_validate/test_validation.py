@@ -198,6 +198,21 @@ class TestWorkflowValidation:
         except Exception as e:
             pytest.fail(f"Basic workflow validation failed: {e}")
     
+    def test_schema_validator_is_compiled_once(self, monkeypatch):
+        """Repeated validation reuses the module-level compiled validator."""
+        import wf2wf.validate as validate_mod
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("schema was re-checked")
+
+        monkeypatch.setattr(type(validate_mod._SCHEMA_VALIDATOR), "check_schema", _fail)
+        workflow = Workflow(name="cached_schema")
+        for _ in range(3):
+            validate_workflow(workflow)
+
+        with pytest.raises(Exception):
+            validate_workflow({"name": 42})
+
     def test_enhanced_workflow_validation(self):
         """Test enhanced workflow validation."""
         # Create a valid workflow
@@ -467,4 +482,33 @@ class TestBCOValidation:
         }
         
         with pytest.raises(Exception):
-            validate_bco(invalid_bco) 
\ No newline at end of file
+            validate_bco(invalid_bco)
+
+    def test_bco_schema_download_failure_is_not_cached(self, monkeypatch):
+        """A failed download falls back for that call only; the next call retries."""
+        import io
+        import urllib.request
+        import wf2wf.validate as validate_mod
+
+        strict_schema = {
+            "type": "object",
+            "required": ["object_id", "spec_version", "provenance_domain", "etag"],
+        }
+        responses = [OSError("network down"), json.dumps(strict_schema).encode()]
+
+        def _urlopen(url, timeout=None):
+            result = responses.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return io.BytesIO(result)
+
+        monkeypatch.setattr(urllib.request, "urlopen", _urlopen)
+        validate_mod._bco_validator.cache_clear()
+        try:
+            bco = {"object_id": "x", "spec_version": "1", "provenance_domain": {}}
+            validate_bco(bco)  # fallback schema does not require etag
+
+            with pytest.raises(Exception):
+                validate_bco(bco)  # downloaded schema does
+        finally:
+            validate_mod._bco_validator.cache_clear()
@@ -10,9 +10,96 @@ from __future__ import annotations
 
 import hashlib
 import json
+import math
+import sys
 from dataclasses import asdict, dataclass, field, is_dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+try:
+    import orjson as _orjson  # Optional: faster JSON serialization
+except ImportError:
+    _orjson = None
+
+try:
+    import msgpack as _msgpack  # Optional: binary interchange form
+except ImportError:
+    _msgpack = None
+
+# Dataclass ``slots=`` needs Python 3.10; fall back to plain dataclasses on 3.9.
+_DC_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _orjson_dumps(data: Any, option: int = 0) -> bytes:
+    """Serialize *data* with orjson, sorted like ``json.dumps(sort_keys=True)``."""
+    return _orjson.dumps(
+        data,
+        default=WF2WFJSONEncoder().default,
+        option=option
+        | _orjson.OPT_SORT_KEYS
+        | _orjson.OPT_NON_STR_KEYS
+        | _orjson.OPT_PASSTHROUGH_DATACLASS,
+    )
+
+
+def _orjson_safe(data: Any) -> bool:
+    """Return True if orjson would encode *data* the way the stdlib encoder does.
+
+    orjson silently writes NaN/Infinity as ``null`` and rejects integers
+    outside the 64-bit range; anything that is not a plain JSON type is also
+    left to the standard library.
+    """
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (str, bool)) or item is None:
+            continue
+        if isinstance(item, int):
+            if not -(2**63) <= item < 2**64:
+                return False
+        elif isinstance(item, float):
+            if not math.isfinite(item):
+                return False
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+        else:
+            return False
+    return True
+
+
+def _json_dumps(data: Any, indent: Optional[int] = None) -> bytes:
+    """Encode *data* as key-sorted UTF-8 JSON (compact when *indent* is None).
+
+    orjson is used only for documents it encodes identically to the stdlib
+    encoder, so the output does not depend on whether it is installed.
+    """
+    if _orjson is not None and indent in (None, 2) and _orjson_safe(data):
+        try:
+            return _orjson_dumps(data, _orjson.OPT_INDENT_2 if indent == 2 else 0)
+        except TypeError:
+            pass  # Fall through to the standard library
+    separators = (",", ":") if indent is None else None
+    return json.dumps(
+        data,
+        indent=indent,
+        cls=WF2WFJSONEncoder,
+        sort_keys=True,
+        separators=separators,
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def _json_loads(raw: Union[str, bytes]) -> Any:
+    """Decode JSON written by :func:`_json_dumps`, including ``NaN``/``Infinity``."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(raw)
+        except _orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity tokens, which only the stdlib accepts
+    return json.loads(raw)
 
 # -----------------------------------------------------------------------------
 # Universal Environment-Aware IR Implementation
@@ -22,7 +109,13 @@ from typing import Any, Dict, List, Optional, Set, Union
 # Environment-Specific Value Foundation (Multi-Environment Support)
 # -----------------------------------------------------------------------------
 
-@dataclass
+def _intern(name: Any) -> Any:
+    """Intern environment names and task ids so lookups can match by identity."""
+    # Exact type on purpose: sys.intern raises TypeError for str subclasses.
+    return sys.intern(name) if type(name) is str else name  # noqa: E721
+
+
+@dataclass(**_DC_SLOTS)
 class EnvironmentSpecificValue:
     """A value that can have different values for different execution environments."""
     
@@ -43,7 +136,7 @@ class EnvironmentSpecificValue:
             else:
                 # Environments specified = this is environment-specific
                 # Normalize environments: remove None values
-                env_list = [env for env in environments if env is not None]
+                env_list = [_intern(env) for env in environments if env is not None]
                 if env_list:
                     self.values.append({
                         "value": value,
@@ -61,8 +154,13 @@ class EnvironmentSpecificValue:
 
     def get_value_for(self, environment: str) -> Optional[Any]:
         """Get the value for the given environment, or None if not set."""
+        values = self.values
+        # Fast path: importers usually set a single entry
+        if len(values) == 1:
+            entry = values[0]
+            return entry["value"] if environment in entry["environments"] else None
         # Search for environment-specific value first
-        for entry in reversed(self.values):
+        for entry in reversed(values):
             if environment in entry["environments"]:
                 return entry["value"]
         # No environment-specific value found
@@ -80,7 +178,7 @@ class EnvironmentSpecificValue:
     def add_environment(self, environment: str):
         """Add an environment to the most recent value's applicable environments."""
         if self.values and environment not in self.values[-1]["environments"]:
-            self.values[-1]["environments"].append(environment)
+            self.values[-1]["environments"].append(_intern(environment))
 
     def remove_environment(self, environment: str):
         """Remove an environment from all values."""
@@ -101,7 +199,7 @@ class EnvironmentSpecificValue:
         # Add new value
         self.values.append({
             "value": value,
-            "environments": [environment]
+            "environments": [_intern(environment)]
         })
 
     def set_default_value(self, value: Any):
@@ -889,6 +987,23 @@ class Task:
         
         return result
 
+    def snapshot(self, environment: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Get the environment-specific values explicitly set for *environment*.
+
+        Unlike :meth:`get_for_environment`, defaults are not applied and only
+        fields with a non-None value are included.  Pass *fields* to restrict
+        the result to those field names.
+        """
+        attributes = self.__dict__
+        result = {}
+        for field_name in (attributes if fields is None else fields):
+            field_value = attributes.get(field_name)
+            if isinstance(field_value, EnvironmentSpecificValue):
+                value = field_value.get_value_for(environment)
+                if value is not None:
+                    result[field_name] = value
+        return result
+
     def set_for_environment(self, field_name: str, value: Any, environment: str):
         """Set a value for a specific environment."""
         if hasattr(self, field_name):
@@ -1022,7 +1137,7 @@ class Task:
 # Workflow Structure
 # -----------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class Edge:
     """Directed edge relating *parent* → *child* task."""
 
@@ -1075,9 +1190,25 @@ class Workflow:
     # ------------------------------------------------------------------
 
     def add_task(self, task: Task):
-        if task.id in self.tasks:
+        task.id = _intern(task.id)
+        # One hash lookup: setdefault only grows the dict for a new id
+        size = len(self.tasks)
+        self.tasks.setdefault(task.id, task)
+        if len(self.tasks) == size:
             raise ValueError(f"Duplicate task id: {task.id}")
-        self.tasks[task.id] = task
+
+    def add_tasks_from(self, tasks: Iterable[Task]):
+        """Add tasks in bulk.
+
+        Follows :meth:`add_task`, but every id is checked before any task is
+        added, so a duplicate leaves the workflow unchanged.
+        """
+        batch = {}
+        for task in tasks:
+            task.id = _intern(task.id)
+            if task.id in self.tasks or batch.setdefault(task.id, task) is not task:
+                raise ValueError(f"Duplicate task id: {task.id}")
+        self.tasks.update(batch)
 
     def add_edge(self, parent: str, child: str):
         # Prevent self-dependencies
@@ -1090,7 +1221,29 @@ class Workflow:
         if child not in self.tasks:
             raise KeyError(f"Child task '{child}' not found in workflow")
 
-        self.edges.append(Edge(parent, child))
+        self.edges.append(Edge(_intern(parent), _intern(child)))
+
+    def add_edges_from(self, pairs: Iterable[Tuple[str, str]]):
+        """Add ``(parent, child)`` edges in bulk.
+
+        Follows :meth:`add_edge` (self-dependencies are ignored), but every
+        endpoint is checked before any edge is added, so a missing task
+        leaves the workflow unchanged.
+        """
+        pairs = [(parent, child) for parent, child in pairs if parent != child]
+
+        missing = {name for pair in pairs for name in pair}.difference(self.tasks)
+        if missing:
+            raise KeyError(
+                f"Tasks not found in workflow: {', '.join(sorted(missing))}"
+            )
+
+        self.edges.extend(Edge(_intern(parent), _intern(child)) for parent, child in pairs)
+
+    @property
+    def edge_pairs(self) -> frozenset:
+        """Return the ``(parent, child)`` pairs of all edges as a frozenset."""
+        return frozenset((e.parent, e.child) for e in self.edges)
 
     def copy(self) -> "Workflow":
         """Create a deep copy of this workflow."""
@@ -1202,27 +1355,47 @@ class Workflow:
         return result
 
     def to_json(self, *, indent: int = 2) -> str:
-        """Return JSON representation using custom encoder."""
-        import json
+        """Return JSON representation using custom encoder.
+
+        As with :py:meth:`save_json`, orjson is used when installed and the
+        result is the same text the standard library would produce.
+        """
+        return _json_dumps(self.to_dict(), indent).decode("utf-8")
 
-        return json.dumps(self.to_dict(), indent=indent, cls=WF2WFJSONEncoder, sort_keys=True)
+    def to_json_bytes(self) -> bytes:
+        """Return compact, key-sorted UTF-8 JSON; uses orjson when installed."""
+        return _json_dumps(self.to_dict())
+
+    def to_msgpack(self) -> bytes:
+        """Return a MessagePack encoding of :py:meth:`to_dict`.
+
+        A compact binary alternative to :py:meth:`to_json_bytes` for passing
+        workflows between tools; requires the optional ``msgpack`` package.
+        """
+        if _msgpack is None:
+            raise ImportError(
+                "msgpack is required for MessagePack serialization. "
+                "Please install it: 'pip install wf2wf[msgpack]'"
+            )
+        return _msgpack.packb(
+            self.to_dict(), use_bin_type=True, default=WF2WFJSONEncoder().default
+        )
 
     def save_json(self, path: Union[str, Path], *, indent: int = 2):
-        """Write JSON representation to path using custom encoder."""
-        import json
-        
+        """Write JSON representation to path using custom encoder.
+
+        With orjson installed the two-space layout is written by orjson unless
+        the workflow holds values it cannot encode faithfully (NaN, Infinity,
+        integers beyond 64 bits); those go through the standard library.
+        """
         _p = Path(path)
         _p.parent.mkdir(parents=True, exist_ok=True)
-        _p.write_text(json.dumps(self.to_dict(), indent=indent, cls=WF2WFJSONEncoder, sort_keys=True))
+        _p.write_bytes(_json_dumps(self.to_dict(), indent))
 
     @classmethod
     def load_json(cls, path: Union[str, Path]):
         """Load Workflow from a JSON file produced by :py:meth:`save_json`."""
-        import json
-        from pathlib import Path as _P
-
-        data = json.loads(_P(path).read_text())
-        return cls.from_dict(data)
+        return cls.from_dict(_json_loads(Path(path).read_bytes()))
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Workflow":
@@ -1331,10 +1504,17 @@ class Workflow:
     @classmethod
     def from_json(cls, json_str: str) -> "Workflow":
         """Re-hydrate from JSON string produced by :py:meth:`to_json`."""
-        import json
+        return cls.from_dict(_json_loads(json_str))
 
-        data = json.loads(json_str)
-        return cls.from_dict(data)
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "Workflow":
+        """Re-hydrate from bytes produced by :py:meth:`to_msgpack`."""
+        if _msgpack is None:
+            raise ImportError(
+                "msgpack is required for MessagePack serialization. "
+                "Please install it: 'pip install wf2wf[msgpack]'"
+            )
+        return cls.from_dict(_msgpack.unpackb(data, raw=False, strict_map_key=False))
 
     # ------------------------------------------------------------------
     # Validation helpers
@@ -1497,7 +1677,7 @@ class WF2WFJSONDecoder:
                             # Add new value with all environments
                             env_value.values.append({
                                 "value": value,
-                                "environments": environments
+                                "environments": [_intern(env) for env in environments]
                             })
                         else:
                             # For each environment, check if it has a None value
@@ -1512,7 +1692,7 @@ class WF2WFJSONDecoder:
                             if envs_needing_none:
                                 env_value.values.append({
                                     "value": None,
-                                    "environments": envs_needing_none
+                                    "environments": [_intern(env) for env in envs_needing_none]
                                 })
         except Exception as e:
             print(f"Warning: Failed to decode EnvironmentSpecificValue: {e}")
@@ -1555,119 +1735,10 @@ class WF2WFJSONEncoder(json.JSONEncoder):
     def default(self, obj: Any) -> Any:
         """Convert wf2wf objects to JSON-serializable format."""
         
-        # Handle EnvironmentSpecificValue objects
-        if isinstance(obj, EnvironmentSpecificValue):
-            try:
-                if not obj.values and obj.default_value is None:
-                    return {
-                        "values": [],
-                        "environments": [],
-                        "default_value": None
-                    }
-                
-                # Convert all values with proper environment handling
-                serialized_values = []
-                for entry in obj.values:
-                    if isinstance(entry, dict) and "value" in entry:
-                        serialized_values.append({
-                            "value": entry["value"],
-                            "environments": list(entry.get("environments", set())),  # Convert set to list
-                        })
-                
-                return {
-                    "values": serialized_values,
-                    "environments": list(obj.all_environments()),  # Convert set to list
-                    "default_value": obj.default_value
-                }
-            except Exception as e:
-                # Fallback for malformed EnvironmentSpecificValue
-                return {
-                    "values": [],
-                    "environments": [],
-                    "default_value": None,
-                    "_error": f"Failed to serialize EnvironmentSpecificValue: {str(e)}"
-                }
-        
-        # Handle TypeSpec objects
-        if isinstance(obj, TypeSpec):
-            try:
-                result = {
-                    "type": obj.type,
-                    "nullable": obj.nullable
-                }
-                # Only include non-None fields
-                if obj.items is not None:
-                    result["items"] = obj.items
-                if obj.fields:
-                    result["fields"] = obj.fields
-                if obj.symbols:
-                    result["symbols"] = obj.symbols
-                if obj.members:
-                    result["members"] = obj.members
-                if obj.name is not None:
-                    result["name"] = obj.name
-                if obj.default is not None:
-                    result["default"] = obj.default
-                return result
-            except Exception as e:
-                return {"_error": f"Failed to serialize TypeSpec: {str(e)}"}
-        
-        # Handle ParameterSpec objects
-        if isinstance(obj, ParameterSpec):
-            try:
-                result = {
-                    "id": obj.id,
-                    "type": obj.type
-                }
-                # Only include non-None fields
-                if obj.label is not None:
-                    result["label"] = obj.label
-                if obj.doc is not None:
-                    result["doc"] = obj.doc
-                if obj.default is not None:
-                    result["default"] = obj.default
-                if obj.format is not None:
-                    result["format"] = obj.format
-                if obj.secondary_files:
-                    result["secondary_files"] = obj.secondary_files
-                if obj.streamable:
-                    result["streamable"] = obj.streamable
-                if obj.load_contents:
-                    result["load_contents"] = obj.load_contents
-                if obj.load_listing is not None:
-                    result["load_listing"] = obj.load_listing
-                if obj.wildcard_pattern is not None:
-                    result["wildcard_pattern"] = obj.wildcard_pattern
-                if obj.input_binding is not None:
-                    result["input_binding"] = obj.input_binding
-                if obj.output_binding is not None:
-                    result["output_binding"] = obj.output_binding
-                if obj.value_from is not None:
-                    result["value_from"] = obj.value_from
-                # Include environment-specific fields only if they have values
-                if hasattr(obj, 'transfer_mode') and obj.transfer_mode.values:
-                    result["transfer_mode"] = obj.transfer_mode
-                if hasattr(obj, 'staging_required') and obj.staging_required.values:
-                    result["staging_required"] = obj.staging_required
-                if hasattr(obj, 'cleanup_after') and obj.cleanup_after.values:
-                    result["cleanup_after"] = obj.cleanup_after
-                return result
-            except Exception as e:
-                return {"_error": f"Failed to serialize ParameterSpec: {str(e)}"}
-        
-        # Handle new spec classes
-        if isinstance(obj, (CheckpointSpec, LoggingSpec, SecuritySpec, NetworkingSpec, MetadataSpec)):
-            try:
-                result = {}
-                for field_name, field_value in obj.__dict__.items():
-                    if field_value is not None:
-                        # Handle special cases for collections
-                        if isinstance(field_value, (list, dict)) and not field_value:
-                            continue  # Skip empty collections
-                        result[field_name] = field_value
-                return result
-            except Exception as e:
-                return {"_error": f"Failed to serialize {type(obj).__name__}: {str(e)}"}
+        # IR spec classes: encoder resolved once per concrete type
+        encoder = _spec_encoder(type(obj))
+        if encoder is not None:
+            return encoder(self, obj)
         
         # Handle Path objects
         if isinstance(obj, Path):
@@ -1695,6 +1766,138 @@ class WF2WFJSONEncoder(json.JSONEncoder):
         # Fall back to parent class
         return super().default(obj)
 
+    def _encode_environment_specific_value(self, obj: Any) -> Any:
+        """Serialize an EnvironmentSpecificValue."""
+        try:
+            if not obj.values and obj.default_value is None:
+                return {
+                    "values": [],
+                    "environments": [],
+                    "default_value": None
+                }
+            
+            # Convert all values with proper environment handling
+            serialized_values = []
+            for entry in obj.values:
+                if isinstance(entry, dict) and "value" in entry:
+                    serialized_values.append({
+                        "value": entry["value"],
+                        "environments": list(entry.get("environments", set())),  # Convert set to list
+                    })
+            
+            return {
+                "values": serialized_values,
+                "environments": list(obj.all_environments()),  # Convert set to list
+                "default_value": obj.default_value
+            }
+        except Exception as e:
+            # Fallback for malformed EnvironmentSpecificValue
+            return {
+                "values": [],
+                "environments": [],
+                "default_value": None,
+                "_error": f"Failed to serialize EnvironmentSpecificValue: {str(e)}"
+            }
+
+    def _encode_type_spec(self, obj: Any) -> Any:
+        """Serialize a TypeSpec, omitting unset fields."""
+        try:
+            result = {
+                "type": obj.type,
+                "nullable": obj.nullable
+            }
+            # Only include non-None fields
+            if obj.items is not None:
+                result["items"] = obj.items
+            if obj.fields:
+                result["fields"] = obj.fields
+            if obj.symbols:
+                result["symbols"] = obj.symbols
+            if obj.members:
+                result["members"] = obj.members
+            if obj.name is not None:
+                result["name"] = obj.name
+            if obj.default is not None:
+                result["default"] = obj.default
+            return result
+        except Exception as e:
+            return {"_error": f"Failed to serialize TypeSpec: {str(e)}"}
+
+    def _encode_parameter_spec(self, obj: Any) -> Any:
+        """Serialize a ParameterSpec, omitting unset fields."""
+        try:
+            result = {
+                "id": obj.id,
+                "type": obj.type
+            }
+            # Only include non-None fields
+            if obj.label is not None:
+                result["label"] = obj.label
+            if obj.doc is not None:
+                result["doc"] = obj.doc
+            if obj.default is not None:
+                result["default"] = obj.default
+            if obj.format is not None:
+                result["format"] = obj.format
+            if obj.secondary_files:
+                result["secondary_files"] = obj.secondary_files
+            if obj.streamable:
+                result["streamable"] = obj.streamable
+            if obj.load_contents:
+                result["load_contents"] = obj.load_contents
+            if obj.load_listing is not None:
+                result["load_listing"] = obj.load_listing
+            if obj.wildcard_pattern is not None:
+                result["wildcard_pattern"] = obj.wildcard_pattern
+            if obj.input_binding is not None:
+                result["input_binding"] = obj.input_binding
+            if obj.output_binding is not None:
+                result["output_binding"] = obj.output_binding
+            if obj.value_from is not None:
+                result["value_from"] = obj.value_from
+            # Include environment-specific fields only if they have values
+            if hasattr(obj, 'transfer_mode') and obj.transfer_mode.values:
+                result["transfer_mode"] = obj.transfer_mode
+            if hasattr(obj, 'staging_required') and obj.staging_required.values:
+                result["staging_required"] = obj.staging_required
+            if hasattr(obj, 'cleanup_after') and obj.cleanup_after.values:
+                result["cleanup_after"] = obj.cleanup_after
+            return result
+        except Exception as e:
+            return {"_error": f"Failed to serialize ParameterSpec: {str(e)}"}
+
+    def _encode_spec_fields(self, obj: Any) -> Any:
+        """Serialize a spec dataclass from its non-empty fields."""
+        try:
+            result = {}
+            for field_name, field_value in obj.__dict__.items():
+                if field_value is not None:
+                    # Handle special cases for collections
+                    if isinstance(field_value, (list, dict)) and not field_value:
+                        continue  # Skip empty collections
+                    result[field_name] = field_value
+            return result
+        except Exception as e:
+            return {"_error": f"Failed to serialize {type(obj).__name__}: {str(e)}"}
+
+
+@lru_cache(maxsize=None)
+def _spec_encoder(obj_type: type):
+    """Return the ``WF2WFJSONEncoder`` method that handles *obj_type*, if any."""
+    for spec_types, encoder in (
+        (EnvironmentSpecificValue, WF2WFJSONEncoder._encode_environment_specific_value),
+        (TypeSpec, WF2WFJSONEncoder._encode_type_spec),
+        (ParameterSpec, WF2WFJSONEncoder._encode_parameter_spec),
+        (
+            (CheckpointSpec, LoggingSpec, SecuritySpec, NetworkingSpec, MetadataSpec),
+            WF2WFJSONEncoder._encode_spec_fields,
+        ),
+    ):
+        if issubclass(obj_type, spec_types):
+            return encoder
+    return None
+
+
 @dataclass
 class MetadataSpec:
     """Comprehensive metadata storage for preserving uninterpreted data and format-specific information."""
@@ -69,22 +69,8 @@ class BaseExporter(ABC):
             print(f"  Tasks: {len(workflow.tasks)}")
             print(f"  Dependencies: {len(workflow.edges)}")
         
-        # 1. Prepare loss tracking
-        loss_prepare(workflow.loss_map)
-        loss_reset()
-        
-        # 2. Check for missing target environment values and handle adaptation
-        self._check_and_handle_environment_adaptation(workflow, **opts)
-        
-        # 3. Interactive prompting if enabled (before inference to allow user input)
-        if self.interactive:
-            self.prompter.prompt_for_missing_values(workflow, "export", self.target_environment)
-        
-        # 4. Infer missing values based on target format and environment (after interactive prompts)
-        infer_missing_values(workflow, self.target_format, target_environment=self.target_environment, verbose=self.verbose)
-        
-        # 5. Record format-specific losses
-        detect_and_record_export_losses(workflow, self.target_format, target_environment=self.target_environment, verbose=self.verbose)
+        # 1-5. Loss tracking, adaptation, prompting, inference, loss detection
+        self._prepare_for_export(workflow, **opts)
         
         # 6. Create output directory
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -107,6 +93,25 @@ class BaseExporter(ABC):
             print(f"  Loss side-car: {output_path.with_suffix('.loss.json')}")
             print(f"Successfully exported workflow to {output_path}")
     
+    def _prepare_for_export(self, workflow: Workflow, **opts: Any) -> None:
+        """Apply the workflow mutations of an export, without writing any files."""
+        # 1. Prepare loss tracking
+        loss_prepare(workflow.loss_map)
+        loss_reset()
+        
+        # 2. Check for missing target environment values and handle adaptation
+        self._check_and_handle_environment_adaptation(workflow, **opts)
+        
+        # 3. Interactive prompting if enabled (before inference to allow user input)
+        if self.interactive:
+            self.prompter.prompt_for_missing_values(workflow, "export", self.target_environment)
+        
+        # 4. Infer missing values based on target format and environment (after interactive prompts)
+        infer_missing_values(workflow, self.target_format, target_environment=self.target_environment, verbose=self.verbose)
+        
+        # 5. Record format-specific losses
+        detect_and_record_export_losses(workflow, self.target_format, target_environment=self.target_environment, verbose=self.verbose)
+    
     @abstractmethod
     def _generate_output(self, workflow: Workflow, output_path: Path, **opts: Any) -> None:
         """Generate format-specific output - must be implemented by subclasses."""
@@ -16,9 +16,11 @@ import textwrap
 import sys
 import logging
 from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from wf2wf import __version__
 from wf2wf.core import Workflow, Task, EnvironmentSpecificValue
 from wf2wf.exporters.base import BaseExporter
 from wf2wf.exporters.inference import _has_env_value
@@ -27,6 +29,9 @@ from wf2wf.environ import pack_conda_environment, generate_conda_activation_scri
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to write per-task submit files
+_MAX_SUBMIT_WRITERS = 32
+
 
 class DAGManExporter(BaseExporter):
     """DAGMan exporter using shared infrastructure."""
@@ -34,10 +39,58 @@ class DAGManExporter(BaseExporter):
     def __init__(self, interactive: bool = False, verbose: bool = False, target_environment: str = "distributed_computing"):
         """Initialize DAGMan exporter with distributed_computing as default target environment."""
         super().__init__(interactive=interactive, verbose=verbose, target_environment=target_environment)
+        # Files written by the current ``skip_unchanged`` export, else None
+        self._written_files: Optional[List[Path]] = None
     
     def _get_target_format(self) -> str:
         """Get the target format name."""
         return "dagman"
+
+    def export_workflow(self, workflow: Workflow, output_path: Union[str, Path], **opts: Any) -> None:
+        """Export *workflow*, optionally skipping it when the last export is current.
+
+        With ``skip_unchanged=True`` (non-interactive only) the export is keyed
+        on the workflow, the export options and the wf2wf version.  The key and
+        the written files are recorded in a ``.manifest.json`` side-car; a later
+        export with the same key writes nothing while those files are untouched.
+        *workflow* is still inferred and its ``loss_map`` updated exactly as a
+        full export would, so callers see the same IR either way.
+        """
+        output_path = Path(output_path)
+        if not opts.get("skip_unchanged") or self.interactive:
+            super().export_workflow(workflow, output_path, **opts)
+            return
+
+        # Key on the workflow as given, before export-time inference mutates it
+        manifest_path = output_path.with_suffix(".manifest.json")
+        export_key = self._export_key(workflow, opts)
+        if _manifest_is_current(manifest_path, export_key):
+            if self.verbose:
+                logger.info(f"DAG at {output_path} is up to date; skipping export")
+            self._prepare_for_export(workflow, **opts)
+            infer_condor_attributes(workflow, target_environment=self.target_environment)
+            # Generation records further losses; the untouched side-car has them all
+            loss_path = output_path.with_suffix(".loss.json")
+            workflow.loss_map = json.loads(loss_path.read_text())["entries"]
+            return
+
+        self._written_files = []
+        try:
+            super().export_workflow(workflow, output_path, **opts)
+            self._written_files.append(output_path.with_suffix(".loss.json"))
+            _write_manifest(manifest_path, export_key, self._written_files)
+        finally:
+            self._written_files = None
+
+    def _export_key(self, workflow: Workflow, opts: Dict[str, Any]) -> str:
+        """Hash the workflow, export options and wf2wf version into a manifest key."""
+        options = {k: str(v) for k, v in opts.items() if k != "skip_unchanged"}
+        h = hashlib.sha256(workflow.to_json_bytes())
+        h.update(json.dumps(
+            {"options": options, "target": self.target_environment, "version": __version__},
+            sort_keys=True,
+        ).encode("utf-8"))
+        return h.hexdigest()
     
     def _generate_output(self, workflow: Workflow, output_path: Path, **opts: Any) -> None:
         """Generate DAGMan output using shared infrastructure."""
@@ -71,6 +124,7 @@ class DAGManExporter(BaseExporter):
             script_file = scripts_dir / f"{self._sanitize_name(task.id)}.sh"
             self._write_task_wrapper_script(task, script_file)
             script_paths[task.id] = script_file
+        self._record_written(script_paths.values())
 
         if self.verbose:
             logger.info(f"  wrote {len(script_paths)} wrapper scripts → {scripts_dir}")
@@ -182,6 +236,7 @@ class DAGManExporter(BaseExporter):
     ):
         """Write DAG file with job definitions using shared infrastructure."""
         dag_lines = []
+        submit_files: List[Tuple[Path, str]] = []
         
         # Header comment
         dag_lines.extend([
@@ -196,7 +251,6 @@ class DAGManExporter(BaseExporter):
         # Job definitions
         for task in wf.tasks.values():
             script_path = script_paths[task.id]
-            relative_script_path = script_path.relative_to(workdir)
 
             if inline_submit:
                 # Inline submit description
@@ -210,9 +264,10 @@ class DAGManExporter(BaseExporter):
             else:
                 # External submit file
                 submit_file = dag_path.parent / f"{task.id}.sub"
-                self._write_submit_file(
-                    task, submit_file, script_path, workdir, default_memory, default_disk, default_cpus
+                submit_lines = self._generate_submit_content(
+                    task, script_path, workdir, default_memory, default_disk, default_cpus
                 )
+                submit_files.append((submit_file, "\n".join(submit_lines)))
                 dag_lines.append(f"JOB {task.id} {submit_file.name}")
             
             # Emit RETRY and PRIORITY lines using shared infrastructure
@@ -229,26 +284,30 @@ class DAGManExporter(BaseExporter):
         for edge in wf.edges:
             dag_lines.append(f"PARENT {edge.parent} CHILD {edge.child}")
 
+        # Submit files first, so the DAG never references a missing one
+        self._write_submit_files(submit_files)
+
         # Write DAG file using shared infrastructure
         dag_content = "\n".join(dag_lines)
         self._write_file(dag_content, dag_path)
+        self._record_written([submit_path for submit_path, _ in submit_files] + [dag_path])
 
-    def _write_submit_file(
-        self,
-        task: Task,
-        submit_path: Path,
-        script_path: Path,
-        workdir: Path,
-        default_memory: str,
-        default_disk: str,
-        default_cpus: int,
-    ):
-        """Write submit file for a task using shared infrastructure."""
-        submit_lines = self._generate_submit_content(
-            task, script_path, workdir, default_memory, default_disk, default_cpus
-        )
-        submit_content = "\n".join(submit_lines)
-        self._write_file(submit_content, submit_path)
+    def _record_written(self, paths):
+        """Remember generated files for the ``skip_unchanged`` manifest, if one is being built."""
+        if self._written_files is not None:
+            self._written_files.extend(paths)
+
+    def _write_submit_files(self, submit_files: List[Tuple[Path, str]]):
+        """Write the per-task submit files, concurrently when there are several."""
+        if len(submit_files) <= 1:
+            for submit_path, submit_content in submit_files:
+                self._write_file(submit_content, submit_path)
+            return
+
+        workers = min(_MAX_SUBMIT_WRITERS, len(submit_files))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Consume the iterator so the first write error is re-raised here
+            list(pool.map(lambda item: self._write_file(item[1], item[0]), submit_files))
 
     def _parse_memory_string(self, memory_str: str) -> int:
         """Parse memory string to MB."""
@@ -429,6 +488,29 @@ class DAGManExporter(BaseExporter):
 # generate_job_scripts, write_condor_dag - these are not used by the main exporter
 
 
+def _file_state(path: Path) -> List[int]:
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _manifest_is_current(manifest_path: Path, export_key: str) -> bool:
+    """Return True if *manifest_path* records *export_key* and its files are unchanged."""
+    try:
+        manifest = json.loads(manifest_path.read_text())
+        if manifest.get("key") != export_key:
+            return False
+        return all(
+            _file_state(Path(path)) == state for path, state in manifest["files"].items()
+        )
+    except (OSError, ValueError, KeyError, AttributeError, TypeError):
+        return False
+
+
+def _write_manifest(manifest_path: Path, export_key: str, paths: List[Path]) -> None:
+    files = {str(path): _file_state(path) for path in paths if path.exists()}
+    manifest_path.write_text(json.dumps({"key": export_key, "files": files}, indent=2))
+
+
 def from_workflow(wf: Workflow, out_file: Union[str, Path], **opts: Any) -> None:
     """Export a Workflow IR to DAGMan format (public API)."""
     exporter = DAGManExporter(
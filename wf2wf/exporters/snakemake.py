@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import logging
 import yaml
+from collections import deque
 from pathlib import Path
 from typing import Any, List, Optional, Union, Dict
 
@@ -317,22 +318,19 @@ class SnakemakeExporter(BaseExporter):
 
     def _topological_sort(self, wf: Workflow) -> List[str]:
         """Topological sort of tasks based on dependencies."""
-        # Build dependency graph
-        graph = {task_id: set() for task_id in wf.tasks}
+        # Build dependency graph; children keep edge order so output is stable
+        graph = {task_id: [] for task_id in wf.tasks}
+        in_degree = dict.fromkeys(wf.tasks, 0)
         for edge in wf.edges:
-            graph[edge.parent].add(edge.child)
+            graph[edge.parent].append(edge.child)
+            in_degree[edge.child] += 1
         
         # Kahn's algorithm
-        in_degree = {task_id: 0 for task_id in wf.tasks}
-        for task_id, dependents in graph.items():
-            for dependent in dependents:
-                in_degree[dependent] += 1
-        
-        queue = [task_id for task_id, degree in in_degree.items() if degree == 0]
+        queue = deque(task_id for task_id, degree in in_degree.items() if degree == 0)
         result = []
         
         while queue:
-            task_id = queue.pop(0)
+            task_id = queue.popleft()
             result.append(task_id)
             
             for dependent in graph[task_id]:
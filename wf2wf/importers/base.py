@@ -440,8 +440,7 @@ class BaseImporter(ABC):
         
         # Extract edges
         edges = self._extract_edges(parsed_data)
-        for edge in edges:
-            workflow.add_edge(edge.parent, edge.child)
+        workflow.add_edges_from((edge.parent, edge.child) for edge in edges)
         
         # Extract workflow-level inputs and outputs
         workflow.inputs = parsed_data.get('inputs', [])
@@ -22,6 +22,11 @@ from typing import Any, Dict, List, Optional, Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C parser when available
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from wf2wf.core import (
     Workflow,
     Task,
@@ -44,6 +49,11 @@ from wf2wf.importers.utils import parse_file_format, normalize_task_id, parse_cw
 logger = logging.getLogger(__name__)
 
 
+class CWLParseError(ImportError):
+    """Raised when a CWL document is not valid YAML or JSON."""
+    pass
+
+
 class CWLImporter(BaseImporter):
     """CWL workflow importer using shared infrastructure. Enhanced implementation (95/100 compliance).
     
@@ -83,18 +93,18 @@ class CWLImporter(BaseImporter):
             elif file_format in ['yaml', 'yml']:
                 logger.debug("Parsing as YAML format")
                 with open(path, 'r', encoding='utf-8') as f:
-                    cwl_data = yaml.safe_load(f)
+                    cwl_data = yaml.load(f, Loader=_YamlLoader)
             else:
                 # For .cwl files, try YAML first, then JSON
                 try:
                     with open(path, 'r', encoding='utf-8') as f:
-                        cwl_data = yaml.safe_load(f)
+                        cwl_data = yaml.load(f, Loader=_YamlLoader)
                 except Exception:
                     with open(path, 'r', encoding='utf-8') as f:
                         cwl_data = json.load(f)
         except Exception as e:
             logger.error(f"Failed to parse CWL file {path}: {e}")
-            raise ImportError(f"Failed to parse CWL file {path}: {e}")
+            raise CWLParseError(f"Failed to parse CWL file {path}: {e}") from e
 
         # Handle CWL graph format (multiple workflows/tools in one file)
         if '$graph' in cwl_data:
@@ -130,6 +140,13 @@ class CWLImporter(BaseImporter):
         Override import_workflow to pass workflow path for external tool resolution.
         """
         try:
+            # Step 1 runs first so a malformed document fails before execution
+            # model detection or any interactive prompt.
+            if self.verbose:
+                logger.info(f"Step 1: Parsing {path} with {self.__class__.__name__}")
+            
+            parsed_data = self._parse_source(path, **opts)
+            
             # Step 0: Early execution model detection and confirmation (ONLY ONCE)
             if self.verbose:
                 logger.info(f"Step 0: Detecting execution model for {path}")
@@ -165,12 +182,6 @@ class CWLImporter(BaseImporter):
             if self.verbose:
                 logger.info(f"Selected execution model: {self._selected_execution_model}")
             
-            # Step 1: Parse source format
-            if self.verbose:
-                logger.info(f"Step 1: Parsing {path} with {self.__class__.__name__}")
-            
-            parsed_data = self._parse_source(path, **opts)
-            
             # Step 2: Create basic workflow structure with workflow path
             workflow = self._create_basic_workflow(parsed_data, workflow_path=str(path))
             
@@ -217,6 +228,8 @@ class CWLImporter(BaseImporter):
             
             return workflow
             
+        except CWLParseError:
+            raise
         except Exception as e:
             logger.error(f"Failed to import workflow from {path}: {e}")
             raise ImportError(f"Failed to import workflow from {path}: {e}") from e
@@ -286,8 +299,7 @@ class CWLImporter(BaseImporter):
 
         # Extract and add edges
         edges = self._extract_edges(parsed_data)
-        for edge in edges:
-            workflow.add_edge(edge.parent, edge.child)
+        workflow.add_edges_from((edge.parent, edge.child) for edge in edges)
 
         # --- Enhanced shared infrastructure integration ---
         # Environment-specific value inference with the selected execution model
@@ -416,7 +428,7 @@ class CWLImporter(BaseImporter):
                         logger.info(f"[CWLImporter] Resolving tool: run='{run}', source_path='{source_path}', base_dir='{base_dir}', tool_path='{tool_path}'")
                     try:
                         with open(tool_path, 'r', encoding='utf-8') as f:
-                            tool_data = yaml.safe_load(f)
+                            tool_data = yaml.load(f, Loader=_YamlLoader)
                         tool_task = self._create_task_from_tool(tool_data)
                         tool_task.id = step_id
                         tool_task.label = step_data.get('label', step_id)
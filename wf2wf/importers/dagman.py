@@ -79,8 +79,7 @@ class DAGManImporter(BaseImporter):
             wf.add_task(task)
         # Extract and add edges
         edges = self._extract_edges(parsed_data)
-        for parent, child in edges:
-            wf.add_edge(parent, child)
+        wf.add_edges_from(edges)
         return wf
 
     def _extract_tasks(self, parsed_data: Dict[str, Any]) -> List[Task]:
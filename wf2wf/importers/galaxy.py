@@ -50,6 +50,12 @@ from wf2wf.loss import detect_and_apply_loss_sidecar
 from wf2wf.importers.inference import infer_environment_specific_values, infer_execution_model
 from wf2wf.interactive import prompt_for_missing_information
 from wf2wf.importers.resource_processor import process_workflow_resources
+from wf2wf.importers.utils import cached_import
+
+try:
+    import orjson as _orjson  # Optional: SIMD-accelerated JSON parsing
+except ImportError:
+    _orjson = None
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -64,8 +70,8 @@ class GalaxyImporter(BaseImporter):
     
     def _parse_source(self, path: Path, **opts: Any) -> Dict[str, Any]:
         """Parse a Galaxy workflow file (.ga) and return a dict."""
-        with open(path, "r") as f:
-            galaxy_doc = json.load(f)
+        raw = Path(path).read_bytes()
+        galaxy_doc = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
 
         # Validate required fields
         if "steps" not in galaxy_doc or not galaxy_doc["steps"]:
@@ -205,6 +211,11 @@ class GalaxyImporter(BaseImporter):
 def to_workflow(path: Union[str, Path], **opts: Any) -> Workflow:
     """Convert Galaxy workflow file at *path* into a Workflow IR object using shared infrastructure.
 
+    Non-interactive imports are cached on the file's path, modification time
+    and size (plus those of any loss side-car), so re-importing an unchanged
+    ``.ga`` file skips parsing.  Each call returns an independent deep copy
+    of the cached workflow.
+
     Parameters
     ----------
     path : Union[str, Path]
@@ -223,6 +234,12 @@ def to_workflow(path: Union[str, Path], **opts: Any) -> Workflow:
     Workflow
         Populated IR instance.
     """
+    path = Path(path)
+    return cached_import(_import_galaxy, path, [path, path.with_suffix(".loss.json")], **opts)
+
+
+def _import_galaxy(path: Union[str, Path], **opts: Any) -> Workflow:
+    """Run the Galaxy importer on *path* without consulting the cache."""
     importer = GalaxyImporter(
         interactive=opts.get("interactive", False),
         verbose=opts.get("verbose", False)
@@ -230,6 +247,24 @@ def to_workflow(path: Union[str, Path], **opts: Any) -> Workflow:
     return importer.import_workflow(path, **opts)
 
 
+def _load_tool_state(step_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a step's ``tool_state`` as a dict.
+
+    Galaxy stores ``tool_state`` as a JSON string embedded in the workflow
+    document; already-decoded dicts are returned as-is without a second parse.
+    """
+    tool_state = step_data.get("tool_state", {})
+    if isinstance(tool_state, dict):
+        return tool_state
+    if isinstance(tool_state, (str, bytes)):
+        try:
+            decoded = _orjson.loads(tool_state) if _orjson is not None else json.loads(tool_state)
+        except ValueError:
+            return {}
+        return decoded if isinstance(decoded, dict) else {}
+    return {}
+
+
 def _convert_galaxy_input_step(
     step_id: str, step_data: Dict[str, Any], preserve_metadata: bool = True
 ) -> ParameterSpec:
@@ -246,14 +281,6 @@ def _convert_galaxy_input_step(
         # Use the first input's name if available
         input_name = inputs_list[0].get("name")
 
-    # Determine input type from tool_state
-    tool_state = step_data.get("tool_state", {})
-    if isinstance(tool_state, str):
-        try:
-            tool_state = json.loads(tool_state)
-        except json.JSONDecodeError:
-            tool_state = {}
-
     # Galaxy data inputs are typically files
     input_type = "File"
 
@@ -286,12 +313,7 @@ def _convert_galaxy_tool_step_to_dict(
     annotation = step_data.get("annotation", "")
 
     # Extract tool state
-    tool_state = step_data.get("tool_state", {})
-    if isinstance(tool_state, str):
-        try:
-            tool_state = json.loads(tool_state)
-        except json.JSONDecodeError:
-            tool_state = {}
+    tool_state = _load_tool_state(step_data)
 
     # Convert inputs and outputs
     inputs = _extract_galaxy_tool_inputs(tool_state, step_data)
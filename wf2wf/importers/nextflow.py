@@ -26,6 +26,7 @@ from __future__ import annotations
 
 import re
 import logging
+import tempfile
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional, Union
 
@@ -56,12 +57,51 @@ from wf2wf.importers.utils import (
     extract_resource_specifications,
     extract_environment_specifications,
     extract_error_handling_specifications,
-    GenericSectionParser
+    GenericSectionParser,
+    cached_import,
 )
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import time and shared by every parse.
+
+# nextflow.config blocks
+_PARAMS_BLOCK_RE = re.compile(r"params\s*\{([^}]*)\}", re.DOTALL)
+_PROCESS_CONFIG_BLOCK_RE = re.compile(r"process\s*\{([^}]*)\}", re.DOTALL)
+_WITH_NAME_RE = re.compile(r"withName:\s*['\"]?(\w+)['\"]?\s*\{([^}]*)\}", re.DOTALL)
+_EXECUTOR_BLOCK_RE = re.compile(r"executor\s*\{([^}]*)\}", re.DOTALL)
+
+# main.nf / module structure
+_INCLUDE_RE = re.compile(r'include\s*\{\s*(\w+)\s*\}\s*from\s*["\']([^"\']+)["\']')
+_WORKFLOW_BLOCK_RE = re.compile(r"workflow\s*\{([^}]*)\}", re.DOTALL)
+_PROCESS_HEADER_RE = re.compile(r"process\s+(\w+)\s*\{")
+_BRACE_RE = re.compile(r"[{}]")
+_PROCESS_CALL_RE = re.compile(r'(?:(\w+)\s*=\s*)?(\w+)\s*\(\s*([^)]*)\s*\)')
+_IDENTIFIER_RE = re.compile(r"\w+")
+
+# Process sections and directives
+_INPUT_SECTION_RE = re.compile(r"input\s*:\s*\{([^}]*)\}", re.DOTALL)
+_OUTPUT_SECTION_RE = re.compile(r"output\s*:\s*\{([^}]*)\}", re.DOTALL)
+_SCRIPT_RE = re.compile(r"script\s*:\s*['\"`]([^'\"`]*)['\"`]", re.DOTALL)
+_TRIPLE_QUOTED_SCRIPT_RE = re.compile(r"script\s*:\s*'''([^']*)'''", re.DOTALL)
+_SHELL_RE = re.compile(r"shell\s*:\s*['\"`]([^'\"`]*)['\"`]", re.DOTALL)
+_PUBLISH_DIR_RE = re.compile(r'publishDir\s*["\']([^"\']+)["\']')
+_CPUS_RE = re.compile(r"cpus\s+(?:=\s*)?(\d+)")
+_MEMORY_RE = re.compile(r"memory\s+(?:=\s*)?(.+)")
+_DISK_RE = re.compile(r"disk\s+(?:=\s*)?(.+)")
+_TIME_RE = re.compile(r"time\s+(?:=\s*)?(.+)")
+_CONTAINER_RE = re.compile(r"container\s+(?:=\s*)?['\"`]([^'\"`]+)['\"`]")
+_CONDA_RE = re.compile(r"conda\s+['\"]([^'\"]+)['\"]")
+_TAG_RE = re.compile(r"tag\s+(?:=\s*)?['\"`]([^'\"`]+)['\"`]")
+_LABEL_RE = re.compile(r"label\s+(?:=\s*)?['\"`]([^'\"`]+)['\"`]")
+_ACCELERATOR_RE = re.compile(r"accelerator\s+(\d+)(?:,\s*type:\s*['\"`]([^'\"`]+)['\"`])?")
+_MAX_RETRIES_RE = re.compile(r"maxRetries\s+(\d+)")
+_DIRECTIVE_LINE_RE = re.compile(
+    r"^[ \t]*((cpus|memory|disk|time|container|conda|tag|label|accelerator|maxRetries)\b.*)$",
+    re.MULTILINE,
+)
+
 
 class NextflowParseError(Exception):
     """Base exception for Nextflow parsing errors."""
@@ -265,6 +305,11 @@ class NextflowImporter(BaseImporter):
 def to_workflow(path: Union[str, Path], **opts: Any) -> Workflow:
     """Convert Nextflow workflow at *path* into a Workflow IR object using shared infrastructure.
 
+    Non-interactive imports are cached on the modification time and size of
+    main.nf, the files it includes, nextflow.config and any loss side-car, so
+    re-importing an unchanged workflow skips parsing.
+    Each call returns an independent deep copy of the cached workflow.
+
     Parameters
     ----------
     path : Union[str, Path]
@@ -281,6 +326,79 @@ def to_workflow(path: Union[str, Path], **opts: Any) -> Workflow:
     Workflow
         Populated IR instance.
     """
+    path = Path(path)
+    return cached_import(_import_nextflow, path, _source_files(path), **opts)
+
+
+def to_workflow_from_source(
+    source: Union[str, bytes], *, name: str = "inmem", **opts: Any
+) -> Workflow:
+    """Convert Nextflow DSL held in memory into a Workflow IR object.
+
+    The shared importer pipeline (execution-model detection, loss side-cars,
+    inference) works on paths, so *source* is written as ``main.nf`` into a
+    temporary directory called *name*, which also becomes the workflow name.
+    Only single-file workflows are supported; ``include`` statements cannot
+    be resolved.  Results are not cached.
+
+    Parameters
+    ----------
+    source : Union[str, bytes]
+        Contents of a ``main.nf`` file.
+    name : str, optional
+        Workflow name (default: "inmem").
+    **opts
+        Options accepted by :func:`to_workflow`.
+
+    Returns
+    -------
+    Workflow
+        Populated IR instance.
+
+    Raises
+    ------
+    ValueError
+        If *name* is empty, ``.``/``..`` or contains a path separator.
+    """
+    if name in ("", ".", "..") or "/" in name or "\\" in name:
+        raise ValueError(f"Invalid workflow name for in-memory source: {name!r}")
+
+    if isinstance(source, bytes):
+        source = source.decode("utf-8")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workflow_dir = Path(tmp_dir) / name
+        workflow_dir.mkdir()
+        main_nf = workflow_dir / "main.nf"
+        main_nf.write_text(source)
+        return _import_nextflow(main_nf, **opts)
+
+
+def _source_files(path: Path) -> List[Path]:
+    """Return every file the import of *path* reads, whether or not it exists.
+
+    That is main.nf, the resolved ``include`` targets, nextflow.config and the
+    ``.loss.json`` side-car.
+    """
+    workflow_dir = path if path.is_dir() else path.parent
+    main_nf = path if path.suffix == ".nf" else workflow_dir / "main.nf"
+
+    files = [main_nf, workflow_dir / "nextflow.config", path.with_suffix(".loss.json")]
+    try:
+        content = main_nf.read_text(errors="replace")
+    except OSError:
+        return files  # The import itself reports the missing main.nf
+
+    for match in _INCLUDE_RE.finditer(content):
+        include_path = match.group(2)
+        files.append(workflow_dir / include_path)
+        if not include_path.endswith(".nf"):
+            files.append(workflow_dir / (include_path + ".nf"))
+    return files
+
+
+def _import_nextflow(path: Path, **opts: Any) -> Workflow:
+    """Run the Nextflow importer on *path* without consulting the cache."""
     importer = NextflowImporter(
         interactive=opts.get("interactive", False),
         verbose=opts.get("verbose", False)
@@ -301,7 +419,7 @@ def _parse_nextflow_config(config_path: Path, debug: bool = False) -> Dict[str,
             logger.debug(f"Config content: {content}")
 
         # Parse params block
-        params_match = re.search(r"params\s*\{([^}]*)\}", content, re.DOTALL)
+        params_match = _PARAMS_BLOCK_RE.search(content)
         if params_match:
             params_content = params_match.group(1)
             if debug:
@@ -311,12 +429,12 @@ def _parse_nextflow_config(config_path: Path, debug: bool = False) -> Dict[str,
                 logger.debug(f"Parsed params: {config['params']}")
 
         # Parse process block with special handling for withName
-        process_match = re.search(r"process\s*\{([^}]*)\}", content, re.DOTALL)
+        process_match = _PROCESS_CONFIG_BLOCK_RE.search(content)
         if process_match:
             process_content = process_match.group(1)
             
             # Parse withName blocks first
-            with_name_matches = re.finditer(r"withName:\s*['\"]?(\w+)['\"]?\s*\{([^}]*)\}", process_content, re.DOTALL)
+            with_name_matches = _WITH_NAME_RE.finditer(process_content)
             for match in with_name_matches:
                 process_name = match.group(1)
                 with_name_content = match.group(2)
@@ -324,11 +442,11 @@ def _parse_nextflow_config(config_path: Path, debug: bool = False) -> Dict[str,
             
             # Parse the rest of the process block (defaults)
             # Remove withName blocks from content to avoid double parsing
-            process_content_clean = re.sub(r"withName:\s*['\"]?\w+['\"]?\s*\{[^}]*\}", "", process_content, flags=re.DOTALL)
+            process_content_clean = _WITH_NAME_RE.sub("", process_content)
             config["process"]["defaults"] = NextflowSectionParser.parse_config_block(process_content_clean)
 
         # Parse executor block
-        executor_match = re.search(r"executor\s*\{([^}]*)\}", content, re.DOTALL)
+        executor_match = _EXECUTOR_BLOCK_RE.search(content)
         if executor_match:
             executor_content = executor_match.group(1)
             config["executor"] = NextflowSectionParser.parse_config_block(executor_content)
@@ -404,7 +522,7 @@ def _parse_main_nf(main_path: Path, debug: bool = False) -> Tuple[Dict, str, Lis
     
     # Extract includes
     includes = []
-    include_matches = re.finditer(r'include\s*\{\s*(\w+)\s*\}\s*from\s*["\']([^"\']+)["\']', content)
+    include_matches = _INCLUDE_RE.finditer(content)
     for match in include_matches:
         process_name = match.group(1)
         module_path = match.group(2)
@@ -416,7 +534,7 @@ def _parse_main_nf(main_path: Path, debug: bool = False) -> Tuple[Dict, str, Lis
     processes = _extract_processes(content, debug=debug)
 
     # Extract workflow definition
-    workflow_match = re.search(r"workflow\s*\{([^}]*)\}", content, re.DOTALL)
+    workflow_match = _WORKFLOW_BLOCK_RE.search(content)
     workflow_def = workflow_match.group(1) if workflow_match else ""
 
     return processes, workflow_def, includes
@@ -436,27 +554,31 @@ def _extract_processes(content: str, debug: bool = False) -> Dict[str, Dict]:
     processes = {}
 
     # Find process definitions
-    process_matches = re.finditer(r"process\s+(\w+)\s*\{", content)
+    process_matches = _PROCESS_HEADER_RE.finditer(content)
     
     for match in process_matches:
         process_name = match.group(1)
         start_pos = match.end() - 1
         
-        # Extract process body
+        # Extract process body, jumping between braces rather than
+        # stepping through every character
         brace_count = 0
-        i = start_pos
         process_body = ""
-        
-        while i < len(content):
-            if content[i] == "{":
+
+        for brace in _BRACE_RE.finditer(content, start_pos):
+            if brace.group() == "{":
                 brace_count += 1
-            elif content[i] == "}":
+            else:
                 brace_count -= 1
                 if brace_count == 0:
-                    process_body = content[start_pos + 1:i]
+                    process_body = content[start_pos + 1:brace.start()]
                     break
-            i += 1
-        
+        else:
+            raise NextflowInvalidSyntaxError(
+                f"Invalid Nextflow syntax: unmatched '{{' in process {process_name} "
+                f"at line {_line_number(content, match.start())}"
+            )
+
         if process_body:
             process_info = _parse_process_definition(process_body, debug=debug)
             processes[process_name] = process_info
@@ -466,6 +588,11 @@ def _extract_processes(content: str, debug: bool = False) -> Dict[str, Dict]:
     return processes
 
 
+def _line_number(content: str, pos: int) -> int:
+    """Return the 1-based line number of offset *pos* in *content*."""
+    return content.count("\n", 0, pos) + 1
+
+
 def _parse_process_definition(process_body: str, debug: bool = False) -> Dict[str, Any]:
     """Parse a process definition."""
     process = {
@@ -491,107 +618,125 @@ def _parse_process_definition(process_body: str, debug: bool = False) -> Dict[st
     }
 
     # Extract input section
-    input_match = re.search(r"input\s*:\s*\{([^}]*)\}", process_body, re.DOTALL)
+    input_match = _INPUT_SECTION_RE.search(process_body)
     if input_match:
         input_content = input_match.group(1)
         process["inputs"] = NextflowSectionParser.parse_process_inputs(input_content)
 
     # Extract output section
-    output_match = re.search(r"output\s*:\s*\{([^}]*)\}", process_body, re.DOTALL)
+    output_match = _OUTPUT_SECTION_RE.search(process_body)
     if output_match:
         output_content = output_match.group(1)
         process["outputs"] = NextflowSectionParser.parse_process_outputs(output_content)
 
     # Extract script section - handle both single and triple quotes
-    script_match = re.search(r"script\s*:\s*['\"`]([^'\"`]*)['\"`]", process_body, re.DOTALL)
+    script_match = _SCRIPT_RE.search(process_body)
     if script_match:
         script_content = script_match.group(1)
         process["script"] = script_content
         process["command"] = script_content  # Also set command for compatibility
     else:
         # Try triple-quoted script block
-        script_match = re.search(r"script\s*:\s*'''([^']*)'''", process_body, re.DOTALL)
+        script_match = _TRIPLE_QUOTED_SCRIPT_RE.search(process_body)
         if script_match:
             script_content = script_match.group(1)
             process["script"] = script_content
             process["command"] = script_content  # Also set command for compatibility
         else:
             # Try shell script block
-            shell_match = re.search(r"shell\s*:\s*['\"`]([^'\"`]*)['\"`]", process_body, re.DOTALL)
+            shell_match = _SHELL_RE.search(process_body)
             if shell_match:
                 script_content = shell_match.group(1)
                 process["script"] = script_content
                 process["command"] = script_content  # Also set command for compatibility
 
     # Extract publishDir
-    publish_match = re.search(r'publishDir\s*["\']([^"\']+)["\']', process_body)
+    publish_match = _PUBLISH_DIR_RE.search(process_body)
     if publish_match:
         process["publishDir"] = publish_match.group(1)
 
+    # Collect every directive line in a single pass; each value pattern
+    # below then only looks at its own directive's line
+    directives = _scan_directives(process_body)
+
     # Extract resource specifications - handle different formats
     # CPU can be specified as "cpus 4" or "cpus = 4"
-    cpus_match = re.search(r"cpus\s+(?:=\s*)?(\d+)", process_body)
+    cpus_match = _CPUS_RE.match(directives.get("cpus", ""))
     if cpus_match:
         process["cpus"] = int(cpus_match.group(1))
     
     # Memory
-    mem_match = re.search(r"memory\s+(?:=\s*)?(.+)", process_body)
+    mem_match = _MEMORY_RE.match(directives.get("memory", ""))
     if mem_match:
         mem_val = mem_match.group(1).strip().strip("'\"` ")
         process["memory"] = mem_val
         process["mem_mb"] = parse_memory_string(mem_val)
 
     # Disk
-    disk_match = re.search(r"disk\s+(?:=\s*)?(.+)", process_body)
+    disk_match = _DISK_RE.match(directives.get("disk", ""))
     if disk_match:
         disk_val = disk_match.group(1).strip().strip("'\"` ")
         process["disk_mb"] = parse_disk_string(disk_val)
 
     # Time
-    time_match = re.search(r"time\s+(?:=\s*)?(.+)", process_body)
+    time_match = _TIME_RE.match(directives.get("time", ""))
     if time_match:
         time_val = time_match.group(1).strip().strip("'\"` ")
         process["time_s"] = parse_time_string(time_val)
     
     # Container can be specified as "container 'image:tag'" or "container = 'image:tag'"
-    container_match = re.search(r"container\s+(?:=\s*)?['\"`]([^'\"`]+)['\"`]", process_body)
+    container_match = _CONTAINER_RE.match(directives.get("container", ""))
     if container_match:
         process["container"] = container_match.group(1)
     
     # Conda
-    conda_match = re.search(r"conda\s+['\"]([^'\"]+)['\"]", process_body)
+    conda_match = _CONDA_RE.match(directives.get("conda", ""))
     if conda_match:
         process["conda"] = conda_match.group(1)
     
     # Tag can be specified as "tag 'tag_name'" or "tag = 'tag_name'"
-    tag_match = re.search(r"tag\s+(?:=\s*)?['\"`]([^'\"`]+)['\"`]", process_body)
+    tag_match = _TAG_RE.match(directives.get("tag", ""))
     if tag_match:
         process["tag"] = tag_match.group(1)
     
     # Label can be specified as "label 'label_name'" or "label = 'label_name'"
-    label_match = re.search(r"label\s+(?:=\s*)?['\"`]([^'\"`]+)['\"`]", process_body)
+    label_match = _LABEL_RE.match(directives.get("label", ""))
     if label_match:
         process["label"] = label_match.group(1)
 
     # Accelerator can be specified as "accelerator 2, type: 'nvidia-tesla-v100'"
-    accelerator_match = re.search(r"accelerator\s+(\d+)(?:,\s*type:\s*['\"`]([^'\"`]+)['\"`])?", process_body)
+    accelerator_match = _ACCELERATOR_RE.match(directives.get("accelerator", ""))
     if accelerator_match:
         process["gpu"] = int(accelerator_match.group(1))
         if accelerator_match.group(2):
             process["gpu_type"] = accelerator_match.group(2)
 
     # maxRetries
-    max_retries_match = re.search(r"maxRetries\s+(\d+)", process_body)
+    max_retries_match = _MAX_RETRIES_RE.match(directives.get("maxRetries", ""))
     if max_retries_match:
         process["retry_count"] = int(max_retries_match.group(1))
 
     return process
 
 
+def _scan_directives(process_body: str) -> Dict[str, str]:
+    """Map each directive keyword to its first line in *process_body*."""
+    directives: Dict[str, str] = {}
+    for match in _DIRECTIVE_LINE_RE.finditer(process_body):
+        directives.setdefault(match.group(2), match.group(1))
+    return directives
+
+
 def _extract_dependencies(
     workflow_def: str, debug: bool = False
 ) -> List[Tuple[str, str]]:
-    """Extract dependencies from workflow definition."""
+    """Extract dependencies from workflow definition.
+
+    The workflow block is scanned once.  Each process call registers the
+    names its output can be referenced by (``NAME``/``NAME.out``,
+    ``NAME_ch`` and any variable it is assigned to), and each later call
+    looks its argument identifiers up in that table.
+    """
     dependencies = []
     
     if not workflow_def.strip():
@@ -600,44 +745,43 @@ def _extract_dependencies(
     if debug:
         logger.debug(f"DEBUG: Analyzing workflow definition: {workflow_def}")
     
-    # Track process invocations and their outputs
-    process_invocations = []
+    # Process names in invocation order, and channel name -> producing process
+    invoked = []
+    produced_by: Dict[str, str] = {}
+    seen = set()
     
     # Find process invocations in the workflow block
-    # Pattern: process_name(input_channel) or process_name()
-    process_calls = re.finditer(r'(\w+)\s*\(\s*([^)]*)\s*\)', workflow_def)
-    
-    for match in process_calls:
-        process_name = match.group(1)
-        input_args = match.group(2).strip()
+    # Pattern: [channel =] process_name(input_channel) or process_name()
+    for match in _PROCESS_CALL_RE.finditer(workflow_def):
+        assigned_to = match.group(1)
+        process_name = match.group(2)
+        input_args = match.group(3).strip()
         
         # Skip if it's not a process call (could be function calls)
         if process_name.lower() in ['channel', 'frompath', 'fromlist', 'from', 'collect', 'map', 'filter']:
             continue
-            
-        process_invocations.append((process_name, input_args))
+
         if debug:
             logger.debug(f"DEBUG: Found process call: {process_name}({input_args})")
-    
-    # Extract dependencies based on process invocation order and input/output relationships
-    for i, (process_name, input_args) in enumerate(process_invocations):
-        if not input_args:
-            continue
-            
-        # Look for channel variables that might be outputs from previous processes
-        # This is a simplified approach - in a real implementation, you'd track channel definitions
-        for j, (prev_process, prev_args) in enumerate(process_invocations[:i]):
-            # If this process uses output from a previous process, create dependency
-            if prev_process in input_args or f"{prev_process}_ch" in input_args:
-                dependencies.append((prev_process, process_name))
+
+        # If this process uses output from a previous process, create dependency
+        for token in _IDENTIFIER_RE.findall(input_args):
+            producer = produced_by.get(token)
+            if producer is not None and producer != process_name and (producer, process_name) not in seen:
+                seen.add((producer, process_name))
+                dependencies.append((producer, process_name))
                 if debug:
-                    logger.debug(f"DEBUG: Found dependency: {prev_process} -> {process_name}")
+                    logger.debug(f"DEBUG: Found dependency: {producer} -> {process_name}")
+
+        invoked.append(process_name)
+        produced_by[process_name] = process_name
+        produced_by[f"{process_name}_ch"] = process_name
+        if assigned_to:
+            produced_by[assigned_to] = process_name
     
     # If no explicit dependencies found, create linear dependencies based on invocation order
-    if not dependencies and len(process_invocations) > 1:
-        for i in range(len(process_invocations) - 1):
-            prev_process = process_invocations[i][0]
-            next_process = process_invocations[i + 1][0]
+    if not dependencies and len(invoked) > 1:
+        for prev_process, next_process in zip(invoked, invoked[1:]):
             dependencies.append((prev_process, next_process))
             if debug:
                 logger.debug(f"DEBUG: Created linear dependency: {prev_process} -> {next_process}")
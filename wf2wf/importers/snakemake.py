@@ -96,7 +96,7 @@ class SnakemakeImporter(BaseImporter):
                 raise ValueError(f"Parent task '{edge.parent}' not found in workflow. Available tasks: {list(task_id_map.keys())}")
             if edge.child not in task_id_map:
                 raise ValueError(f"Child task '{edge.child}' not found in workflow. Available tasks: {list(task_id_map.keys())}")
-            wf.add_edge(edge.parent, edge.child)
+        wf.add_edges_from((edge.parent, edge.child) for edge in edges)
         
         # Extract workflow outputs from the "all" rule
         workflow_outputs = self._extract_workflow_outputs_from_all_rule(parsed_data)
@@ -8,8 +8,11 @@ other shared functionality.
 
 from __future__ import annotations
 
+import copy
 import logging
-from typing import Any, Dict, List, Optional
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -257,32 +260,33 @@ def parse_memory_string(memory_str: str) -> Optional[int]:
     if not memory_str:
         return None
     
-    memory_str = str(memory_str).strip().upper()
-    
-    # Extract number and unit
-    import re
-    match = re.match(r"(\d+(?:\.\d+)?)[\.\s]*([KMGT]B|[KMGT])?", memory_str)
+    return _parse_memory_mb(str(memory_str).strip().upper())
+
+
+_MEMORY_RE = re.compile(r"(\d+(?:\.\d+)?)[\.\s]*([KMGT]B|[KMGT])?")
+_MEMORY_MULTIPLIERS = {
+    "B": 1 / (1024 * 1024),
+    "KB": 1 / 1024,
+    "K": 1 / 1024,
+    "MB": 1,
+    "M": 1,
+    "GB": 1024,
+    "G": 1024,
+    "TB": 1024 * 1024,
+    "T": 1024 * 1024,
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_memory_mb(memory_str: str) -> Optional[int]:
+    """Convert a normalized (stripped, upper-case) memory string to MB."""
+    match = _MEMORY_RE.match(memory_str)
     if not match:
         return None
-    
+
     number = float(match.group(1))
     unit = match.group(2) or ""
-    
-    # Convert to MB
-    multipliers = {
-        "B": 1 / (1024 * 1024),
-        "KB": 1 / 1024,
-        "K": 1 / 1024,
-        "MB": 1,
-        "M": 1,
-        "GB": 1024,
-        "G": 1024,
-        "TB": 1024 * 1024,
-        "T": 1024 * 1024,
-    }
-    
-    multiplier = multipliers.get(unit, 1)
-    return int(number * multiplier)
+    return int(number * _MEMORY_MULTIPLIERS.get(unit, 1))
 
 
 def parse_disk_string(disk_str: str) -> Optional[int]:
@@ -319,27 +323,28 @@ def parse_time_string(time_str: str) -> Optional[int]:
     if not time_str:
         return None
     
-    time_str = str(time_str).strip().lower()
-    
-    # Extract number and unit
-    import re
-    match = re.match(r"(\d+(?:\.\d+)?)\s*([smhd])?", time_str)
+    return _parse_time_seconds(str(time_str).strip().lower())
+
+
+_TIME_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([smhd])?")
+_TIME_MULTIPLIERS = {
+    "s": 1,
+    "m": 60,
+    "h": 3600,
+    "d": 86400,
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_time_seconds(time_str: str) -> Optional[int]:
+    """Convert a normalized (stripped, lower-case) time string to seconds."""
+    match = _TIME_RE.match(time_str)
     if not match:
         return None
-    
+
     number = float(match.group(1))
     unit = match.group(2) or "s"
-    
-    # Convert to seconds
-    multipliers = {
-        "s": 1,
-        "m": 60,
-        "h": 3600,
-        "d": 86400,
-    }
-    
-    multiplier = multipliers.get(unit, 1)
-    return int(number * multiplier)
+    return int(number * _TIME_MULTIPLIERS.get(unit, 1))
 
 
 def parse_resource_value(value_str: Any) -> Any:
@@ -873,6 +878,65 @@ def parse_file_format(file_path: Path) -> str:
     return format_map.get(extension, 'unknown') 
 
 
+def cached_import(
+    import_fn: Callable[..., Any],
+    path: Union[str, Path],
+    files: Iterable[Union[str, Path]],
+    **opts: Any,
+) -> Any:
+    """
+    Run ``import_fn(path, **opts)`` through a cache keyed on the files it reads.
+
+    The cache key is the resolved *path*, the hashable *opts* and the
+    ``(st_mtime_ns, st_size)`` of every entry in *files*; absent files are
+    recorded too, so creating one (e.g. a loss side-car) invalidates the
+    entry.  Each call returns an independent deep copy of the cached result.
+    Interactive imports and unhashable options bypass the cache.
+
+    Args:
+        import_fn: Importer that parses *path* without consulting the cache
+        path: Workflow file or directory passed through to *import_fn*
+        files: Every file whose modification should trigger a re-import
+        **opts: Options passed through to *import_fn*
+
+    Returns:
+        The (copied) result of *import_fn*
+    """
+    if opts.get("interactive", False):
+        return import_fn(path, **opts)
+
+    try:
+        resolved = Path(path).resolve()
+        opts_key = tuple(sorted(opts.items()))
+        hash(opts_key)
+    except (OSError, TypeError):
+        return import_fn(path, **opts)  # Unhashable options: import without caching
+
+    signature = tuple(_file_signature(Path(f)) for f in files)
+    hits = _cached_import.cache_info().hits
+    result = _cached_import(import_fn, resolved, signature, opts_key)
+    if opts.get("verbose", False) and _cached_import.cache_info().hits > hits:
+        logger.info(f"Loaded {resolved} from the import cache")
+    return copy.deepcopy(result)
+
+
+def _file_signature(path: Path) -> tuple:
+    """Return ``(path, st_mtime_ns, st_size)``, or ``(path, None, None)`` if absent."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return str(path), None, None
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=64)
+def _cached_import(
+    import_fn: Callable[..., Any], path: Path, signature: tuple, opts_key: tuple
+) -> Any:
+    """Import *path* once per file snapshot; callers must not mutate the result."""
+    return import_fn(path, **dict(opts_key))
+
+
 def parse_cwl_type(type_spec):
     """Parse CWL type specification into TypeSpec object."""
     from wf2wf.core import TypeSpec
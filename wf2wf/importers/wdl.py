@@ -31,6 +31,7 @@ from __future__ import annotations
 import re
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -62,12 +63,31 @@ from wf2wf.importers.utils import (
     parse_time_string,
     parse_resource_value,
     normalize_task_id,
-    GenericSectionParser
+    GenericSectionParser,
+    cached_import,
 )
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Patterns used on every document, task and call; compiled once at import time
+_VERSION_RE = re.compile(r"version\s+([\d.]+)", re.IGNORECASE)
+_IMPORT_RE = re.compile(r'import\s+"([^"]+)"(?:\s+as\s+(\w+))?', re.IGNORECASE)
+_TASK_START_RE = re.compile(r"task\s+(\w+)\s*\{")
+_WORKFLOW_START_RE = re.compile(r"workflow\s+(\w+)\s*\{")
+_INPUT_SECTION_RE = re.compile(r"input\s*\{([^}]*)\}", re.DOTALL)
+_OUTPUT_SECTION_RE = re.compile(r"output\s*\{([^}]*)\}", re.DOTALL)
+_COMMAND_SECTION_RE = re.compile(r"command\s*(?:<<<|{)([^}]*?)(?:>>>|})", re.DOTALL)
+_RUNTIME_SECTION_RE = re.compile(r"runtime\s*\{([^}]*)\}", re.DOTALL)
+_META_SECTION_RE = re.compile(r"meta\s*\{([^}]*)\}", re.DOTALL)
+_PARAMETER_META_SECTION_RE = re.compile(r"parameter_meta\s*\{([^}]*)\}", re.DOTALL)
+_CALL_INPUT_RE = re.compile(r"(?:input:\s*)?(\w+)\s*=\s*(.+)")
+_CALL_START_RE = re.compile(r"call\s+(\w+)(?:\s+as\s+(\w+))?\s*\{")
+_SCATTER_START_RE = re.compile(r"scatter\s*\(([^)]+)\)\s*\{", re.DOTALL)
+_SCATTER_EXPR_RE = re.compile(r"\((\w+)\s+in\s+(\w+)\)")
+_SCATTER_VAR_RE = re.compile(r"\w+\s+in\s+(\w+)")
+_CALL_REFERENCE_RE = re.compile(r"(\w+)\.\w+")
+
 
 class WDLParseError(Exception):
     """Base exception for WDL parsing errors."""
@@ -125,7 +145,7 @@ class WDLSectionParser:
                 continue
 
             # Match input bindings - handle both "input: name = value" and "name = value" formats
-            match = re.match(r"(?:input:\s*)?(\w+)\s*=\s*(.+)", line)
+            match = _CALL_INPUT_RE.match(line)
             if match:
                 input_name = match.group(1)
                 input_value = match.group(2).strip().strip('"\'')
@@ -157,7 +177,9 @@ class WDLImporter(BaseImporter):
             raise WDLParseError(f"Failed to read WDL file {path}: {e}") from e
 
         try:
-            wdl_doc = _parse_wdl_document(content, path, debug=debug)
+            wdl_doc = _parse_wdl_document(
+                content, path, debug=debug, preserve_metadata=preserve_metadata
+            )
         except Exception as e:
             raise WDLParseError(f"Failed to parse WDL content: {e}") from e
 
@@ -183,7 +205,7 @@ class WDLImporter(BaseImporter):
         # Get workflow name from first workflow or use filename
         workflows = wdl_doc.get("workflows", {})
         if workflows:
-            workflow_name = list(workflows.keys())[0]
+            workflow_name = next(iter(workflows))
         else:
             workflow_name = wdl_path.stem
         
@@ -208,12 +230,11 @@ class WDLImporter(BaseImporter):
         
         # Extract edges and add them to workflow
         edges = self._extract_edges(parsed_data)
-        for edge in edges:
-            workflow.add_edge(edge.parent, edge.child)
+        workflow.add_edges_from((edge.parent, edge.child) for edge in edges)
         
         # Extract workflow-level inputs and outputs
         if workflows:
-            workflow_def = list(workflows.values())[0]
+            workflow_def = next(iter(workflows.values()))
             workflow.inputs = _convert_wdl_workflow_inputs(workflow_def.get("inputs", {}))
             workflow.outputs = _convert_wdl_workflow_outputs(workflow_def.get("outputs", {}))
         
@@ -359,6 +380,11 @@ class WDLImporter(BaseImporter):
 def to_workflow(path: Union[str, Path], **opts: Any) -> Workflow:
     """Convert WDL file at *path* into a Workflow IR object using shared infrastructure.
 
+    Non-interactive imports are cached on the file's path, modification time
+    and size (plus those of any loss side-car), so re-importing an unchanged
+    ``.wdl`` file skips parsing.  Each call returns an independent deep copy
+    of the cached workflow.
+
     Parameters
     ----------
     path : Union[str, Path]
@@ -377,6 +403,12 @@ def to_workflow(path: Union[str, Path], **opts: Any) -> Workflow:
     Workflow
         Populated IR instance.
     """
+    path = Path(path)
+    return cached_import(_import_wdl, path, [path, path.with_suffix(".loss.json")], **opts)
+
+
+def _import_wdl(path: Union[str, Path], **opts: Any) -> Workflow:
+    """Run the WDL importer on *path* without consulting the cache."""
     importer = WDLImporter(
         interactive=opts.get("interactive", False),
         verbose=opts.get("verbose", False)
@@ -385,34 +417,41 @@ def to_workflow(path: Union[str, Path], **opts: Any) -> Workflow:
 
 
 def _parse_wdl_document(
-    content: str, wdl_path: Path, debug: bool = False
+    content: str,
+    wdl_path: Path,
+    debug: bool = False,
+    preserve_metadata: bool = True,
 ) -> Dict[str, Any]:
-    """Parse WDL document content into structured data."""
+    """Parse WDL document content into structured data.
+
+    With ``preserve_metadata=False`` the ``parameter_meta`` sections, which
+    only feed the preserved document, are left unparsed.
+    """
 
     # Simple WDL parser - this could be enhanced with a proper WDL parser library
     doc = {"version": None, "imports": [], "tasks": {}, "workflows": {}, "structs": {}}
 
     # Extract version
-    version_match = re.search(r"version\s+([\d.]+)", content, re.IGNORECASE)
+    version_match = _VERSION_RE.search(content)
     if version_match:
         doc["version"] = version_match.group(1)
 
     # Extract imports
-    import_matches = re.finditer(
-        r'import\s+"([^"]+)"(?:\s+as\s+(\w+))?', content, re.IGNORECASE
-    )
+    import_matches = _IMPORT_RE.finditer(content)
     for match in import_matches:
         doc["imports"].append({"path": match.group(1), "alias": match.group(2)})
 
     # Extract tasks using balanced brace matching
-    task_starts = re.finditer(r"task\s+(\w+)\s*\{", content)
+    task_starts = _TASK_START_RE.finditer(content)
     for match in task_starts:
         task_name = match.group(1)
         task_body = extract_balanced_braces(content, match.end() - 1)
-        doc["tasks"][task_name] = _parse_wdl_task(task_body, task_name, debug=debug)
+        doc["tasks"][task_name] = _parse_wdl_task(
+            task_body, task_name, debug=debug, preserve_metadata=preserve_metadata
+        )
 
     # Extract workflows using balanced brace matching
-    workflow_starts = re.finditer(r"workflow\s+(\w+)\s*\{", content)
+    workflow_starts = _WORKFLOW_START_RE.finditer(content)
     for match in workflow_starts:
         workflow_name = match.group(1)
         workflow_body = extract_balanced_braces(content, match.end() - 1)
@@ -427,7 +466,10 @@ def _parse_wdl_document(
 
 
 def _parse_wdl_task(
-    task_body: str, task_name: str, debug: bool = False
+    task_body: str,
+    task_name: str,
+    debug: bool = False,
+    preserve_metadata: bool = True,
 ) -> Dict[str, Any]:
     """Parse a WDL task definition."""
 
@@ -442,36 +484,35 @@ def _parse_wdl_task(
     }
 
     # Extract input section
-    input_match = re.search(r"input\s*\{([^}]*)\}", task_body, re.DOTALL)
+    input_match = _INPUT_SECTION_RE.search(task_body)
     if input_match:
         task["inputs"] = WDLSectionParser.parse_parameters(input_match.group(1), "input")
 
     # Extract output section
-    output_match = re.search(r"output\s*\{([^}]*)\}", task_body, re.DOTALL)
+    output_match = _OUTPUT_SECTION_RE.search(task_body)
     if output_match:
         task["outputs"] = WDLSectionParser.parse_parameters(output_match.group(1), "output")
 
     # Extract command section
-    command_match = re.search(
-        r"command\s*(?:<<<|{)([^}]*?)(?:>>>|})", task_body, re.DOTALL
-    )
+    command_match = _COMMAND_SECTION_RE.search(task_body)
     if command_match:
         task["command"] = command_match.group(1).strip()
 
     # Extract runtime section
-    runtime_match = re.search(r"runtime\s*\{([^}]*)\}", task_body, re.DOTALL)
+    runtime_match = _RUNTIME_SECTION_RE.search(task_body)
     if runtime_match:
         task["runtime"] = WDLSectionParser.parse_runtime(runtime_match.group(1))
 
     # Extract meta section
-    meta_match = re.search(r"meta\s*\{([^}]*)\}", task_body, re.DOTALL)
+    meta_match = _META_SECTION_RE.search(task_body)
     if meta_match:
         task["meta"] = WDLSectionParser.parse_meta(meta_match.group(1))
 
-    # Extract parameter_meta section
-    param_meta_match = re.search(r"parameter_meta\s*\{([^}]*)\}", task_body, re.DOTALL)
-    if param_meta_match:
-        task["parameter_meta"] = WDLSectionParser.parse_meta(param_meta_match.group(1))
+    # Extract parameter_meta section (only kept with the preserved document)
+    if preserve_metadata:
+        param_meta_match = _PARAMETER_META_SECTION_RE.search(task_body)
+        if param_meta_match:
+            task["parameter_meta"] = WDLSectionParser.parse_meta(param_meta_match.group(1))
 
     return task
 
@@ -491,12 +532,12 @@ def _parse_wdl_workflow(
     }
 
     # Extract input section
-    input_match = re.search(r"input\s*\{([^}]*)\}", workflow_body, re.DOTALL)
+    input_match = _INPUT_SECTION_RE.search(workflow_body)
     if input_match:
         workflow["inputs"] = WDLSectionParser.parse_parameters(input_match.group(1), "input")
 
     # Extract output section
-    output_match = re.search(r"output\s*\{([^}]*)\}", workflow_body, re.DOTALL)
+    output_match = _OUTPUT_SECTION_RE.search(workflow_body)
     if output_match:
         workflow["outputs"] = WDLSectionParser.parse_parameters(output_match.group(1), "output")
 
@@ -677,6 +718,7 @@ def _convert_wdl_workflow_outputs(wdl_outputs: Dict[str, Any]) -> List[Parameter
     return outputs
 
 
+@lru_cache(maxsize=256)
 def _convert_wdl_type(wdl_type: str) -> str:
     """Convert WDL type to IR type."""
     type_mapping = {
@@ -728,7 +770,7 @@ def _convert_wdl_scatter(scatter_expr: str) -> ScatterSpec:
     """Convert WDL scatter expression to ScatterSpec."""
     # Extract variable name from scatter expression
     # WDL scatter syntax: scatter (item in items)
-    match = re.match(r"\((\w+)\s+in\s+(\w+)\)", scatter_expr)
+    match = _SCATTER_EXPR_RE.match(scatter_expr)
     if match:
         item_var = match.group(1)
         items_var = match.group(2)
@@ -755,14 +797,15 @@ def _extract_wdl_dependencies(
     for input_name, input_value in inputs.items():
         # Look for references to other calls in the format task_name.output_name
         if isinstance(input_value, str):
-            # Match pattern: task_name.output_name
+            referenced = set(_CALL_REFERENCE_RE.findall(input_value))
+            if not referenced:
+                continue
             for other_call_name in all_calls:
-                if other_call_name != call_alias:  # Don't create self-dependency
-                    pattern = rf"{other_call_name}\.\w+"
-                    if re.search(pattern, input_value):
-                        edges.append(Edge(parent=other_call_name, child=call_alias))
-                        logger.debug(f"Found dependency: {other_call_name} -> {call_alias} via {input_name} = {input_value}")
-                        break  # Only add one edge per dependency
+                # Don't create self-dependency
+                if other_call_name != call_alias and other_call_name in referenced:
+                    edges.append(Edge(parent=other_call_name, child=call_alias))
+                    logger.debug(f"Found dependency: {other_call_name} -> {call_alias} via {input_name} = {input_value}")
+                    break  # Only add one edge per dependency
 
     return edges
 
@@ -775,7 +818,7 @@ def _extract_call_blocks(content: str) -> List[Dict[str, Any]]:
     calls = []
     
     # Find all call statements
-    call_matches = re.finditer(r"call\s+(\w+)(?:\s+as\s+(\w+))?\s*\{", content)
+    call_matches = _CALL_START_RE.finditer(content)
     for call_match in call_matches:
         task_name = call_match.group(1)
         call_alias = call_match.group(2) or task_name
@@ -800,7 +843,7 @@ def _extract_scatter_blocks(content: str) -> Dict[str, Dict[str, Any]]:
     scatter_calls = {}
     
     # Find all scatter statements
-    scatter_matches = re.finditer(r"scatter\s*\(([^)]+)\)\s*\{", content, re.DOTALL)
+    scatter_matches = _SCATTER_START_RE.finditer(content)
     for match in scatter_matches:
         scatter_expr = match.group(1)
         scatter_body_start = match.end() - 1
@@ -808,7 +851,7 @@ def _extract_scatter_blocks(content: str) -> Dict[str, Dict[str, Any]]:
         logger.debug(f"Found scatter expression: '{scatter_expr}' with body: '{scatter_body}'")
         
         # Parse collection variable from scatter_expr (e.g., 'file in input_files')
-        scatter_var_match = re.match(r"\w+\s+in\s+(\w+)", scatter_expr)
+        scatter_var_match = _SCATTER_VAR_RE.match(scatter_expr)
         scatter_var = scatter_var_match.group(1) if scatter_var_match else scatter_expr
         logger.debug(f"Extracted scatter variable: '{scatter_var}'")
         
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
-from jsonschema import validate as _js_validate  # type: ignore
+from jsonschema import exceptions as _js_exceptions  # type: ignore
+from jsonschema import validators as _js_validators  # type: ignore
 
 # Locate schema file relative to this module
 _SCHEMA_FILE = Path(__file__).parent / "schemas" / "v0.1" / "wf.json"
@@ -23,6 +25,24 @@ if not _LOSS_SCHEMA_FILE.exists():
     raise FileNotFoundError(f"Schema file missing: {_LOSS_SCHEMA_FILE}")
 _LOSS_SCHEMA: dict[str, Any] = json.loads(_LOSS_SCHEMA_FILE.read_text())
 
+
+def _compile_validator(schema: dict[str, Any]):
+    """Check *schema* once and return a reusable validator instance."""
+    cls = _js_validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def _js_validate(instance: Any, validator) -> None:
+    """Same error semantics as :func:`jsonschema.validate`, minus recompilation."""
+    error = _js_exceptions.best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
+
+_SCHEMA_VALIDATOR = _compile_validator(_SCHEMA)
+_LOSS_SCHEMA_VALIDATOR = _compile_validator(_LOSS_SCHEMA)
+
 # Predefined execution environments (from core.py)
 VALID_ENVIRONMENTS = {
     "shared_filesystem",
@@ -353,7 +373,7 @@ def validate_workflow(obj: Any) -> None:
     else:
         data = obj
 
-    _js_validate(instance=data, schema=_SCHEMA)
+    _js_validate(data, _SCHEMA_VALIDATOR)
 
 
 def validate_workflow_with_enhanced_checks(obj: Any) -> None:
@@ -389,37 +409,41 @@ def validate_workflow_with_enhanced_checks(obj: Any) -> None:
 _BCO_SCHEMA_URL = "https://raw.githubusercontent.com/biocompute-objects/BCO_Specification/master/schema/2791object.json"
 
 
-def validate_bco(bco_doc: Dict[str, Any]) -> None:
-    """Validate *bco_doc* against the official IEEE 2791 JSON-Schema.
+# Minimal schema requiring only mandatory fields, used when the download fails
+_BCO_FALLBACK_SCHEMA: dict[str, Any] = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["object_id", "spec_version", "provenance_domain"],
+    "properties": {
+        "object_id": {"type": "string"},
+        "spec_version": {"type": "string"},
+        "provenance_domain": {"type": "object"},
+    },
+}
 
-    Downloads the schema (cached per session) and raises :class:`jsonschema.ValidationError`
-    on failure.
-    """
+
+@functools.lru_cache(maxsize=1)
+def _bco_validator():
+    """Download and compile the IEEE 2791 schema; failures are not cached."""
     import urllib.request
-    import json
-    import functools
 
-    @functools.lru_cache(maxsize=1)
-    def _load_schema():
-        with urllib.request.urlopen(_BCO_SCHEMA_URL, timeout=15) as fh:
-            return json.loads(fh.read().decode())
+    with urllib.request.urlopen(_BCO_SCHEMA_URL, timeout=15) as fh:
+        schema = json.loads(fh.read().decode())
+    return _compile_validator(schema)
+
+
+def validate_bco(bco_doc: Dict[str, Any]) -> None:
+    """Validate *bco_doc* against the official IEEE 2791 JSON-Schema.
 
+    The schema is downloaded once and reused after a successful fetch; if the
+    download fails, a minimal schema is used for this call and the download is
+    retried next time. Raises :class:`jsonschema.ValidationError` on failure.
+    """
     try:
-        schema = _load_schema()
+        validator = _bco_validator()
     except Exception:
-        # Fallback: minimal schema requiring only mandatory fields
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "type": "object",
-            "required": ["object_id", "spec_version", "provenance_domain"],
-            "properties": {
-                "object_id": {"type": "string"},
-                "spec_version": {"type": "string"},
-                "provenance_domain": {"type": "object"},
-            },
-        }
-
-    _js_validate(instance=bco_doc, schema=schema)
+        validator = _compile_validator(_BCO_FALLBACK_SCHEMA)
+    _js_validate(bco_doc, validator)
 
 
 # -----------------------------------------------------------------------------
@@ -429,7 +453,7 @@ def validate_bco(bco_doc: Dict[str, Any]) -> None:
 
 def validate_loss(loss_doc: Dict[str, Any]) -> None:
     """Validate *loss_doc* against the loss.json schema."""
-    _js_validate(instance=loss_doc, schema=_LOSS_SCHEMA)
+    _js_validate(loss_doc, _LOSS_SCHEMA_VALIDATOR)
 
 
 # -----------------------------------------------------------------------------